@@ -0,0 +1,13 @@
+"""
+Benchmarks do loop principal (simulação e desenho), sem janela.
+
+Rodar da raiz do projeto::
+
+    python -m bench --out bench.json
+    python -m bench --compare bench/baseline.json   # referência versionada
+    python -m bench --out minha_base.json           # baseline desta máquina
+    python -m bench --compare minha_base.json
+    python -m bench.bench_entities   # custo por entidade (slots vs. Sprite)
+    python -m bench.bench_audio      # vozes, CPU e memória do áudio em combate
+    python -m bench.sweep --set initial_lives=3,5 --seeds 200   # balanceamento
+"""
@@ -0,0 +1,3 @@
+from .bench_game import main
+
+main()
@@ -0,0 +1,146 @@
+"""
+Áudio em combate pesado: ``Sound.play`` por evento vs. ``Audio``.
+
+Grava os eventos de uma partida sem janela com a horda grande (o bot do
+``bench.sweep`` atirando sem parar) e os toca em tempo real nos dois
+modos, com o mesmo fluxo de eventos: o de antes (um ``Sound.play`` por
+tiro/acerto, buffers inteiros, canais padrão do mixer) e o ``Audio``
+(canais por grupo, limites por som, buffers aparados). Mede CPU do
+processo (inclui a thread de mixagem do SDL), custo das chamadas, vozes
+tocando e memória dos buffers.
+
+Rodar da raiz do projeto::
+
+    python -m bench.bench_audio --zombies 600 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from bench.sweep import Autoplayer  # noqa: E402
+from code.Audio import Audio  # noqa: E402
+from code.Const import (  # noqa: E402
+    AUDIO_BUFFER,
+    AUDIO_CHANNELS,
+    AUDIO_FREQUENCY,
+    AUDIO_SIZE,
+    SOUNDS,
+    TICK_MS,
+)
+from code.World import World  # noqa: E402
+
+
+def record_events(zombies: int, ticks: int, seed: int) -> list[list[str]]:
+    """Eventos de cada tick de uma partida com ``zombies`` zumbis na tela."""
+    world = World.headless(seed=seed)
+    world.reset(seed=seed)
+    world.spawn_zombies(zombies - world.horde.count)
+    world.score.lives = 10**9  # a partida não termina no meio da medição
+    bot = Autoplayer(world)
+    return [list(world.step(bot(tick))) for tick in range(ticks)]
+
+
+class NaivePlayer:
+    """Como era antes: um ``Sound.play`` por evento, no canal que sobrar."""
+
+    def __init__(self) -> None:
+        pygame.mixer.set_reserved(0)
+        pygame.mixer.set_num_channels(8)  # padrão do mixer
+        self.sounds = {name: pygame.mixer.Sound(spec["file"]) for name, spec in SOUNDS.items()}
+
+    def begin_frame(self) -> None:
+        pass
+
+    def play(self, name: str) -> None:
+        sound = self.sounds.get(name)
+        if sound is not None:
+            sound.play()
+
+    def busy(self) -> int:
+        return sum(
+            pygame.mixer.Channel(i).get_busy() for i in range(pygame.mixer.get_num_channels())
+        )
+
+    def memory_bytes(self) -> int:
+        return sum(len(sound.get_raw()) for sound in self.sounds.values())
+
+
+def make_audio() -> Audio:
+    audio = Audio()
+    for name, spec in SOUNDS.items():
+        audio.add(name, Audio.decode(spec["file"]), spec["group"], spec["voices"], spec["per_frame"])
+    return audio
+
+
+def play_back(player, events: list[list[str]]) -> dict[str, float]:
+    """Toca os eventos em tempo real (um tick por ``TICK_MS``)."""
+    pygame.mixer.stop()
+    time.sleep(0.5)
+    calls = 0
+    call_s = 0.0
+    voices = []
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for tick, tick_events in enumerate(events):
+        player.begin_frame()
+        t = time.perf_counter()
+        for event in tick_events:
+            player.play(event)
+            calls += 1
+        call_s += time.perf_counter() - t
+        voices.append(player.busy())
+
+        delay = start + (tick + 1) * TICK_MS / 1000 - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    wall = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    return {
+        "cpu_pct": cpu / wall * 100,
+        "play_us_per_tick": call_s / len(events) * 1e6,
+        "events": calls,
+        "voices_mean": sum(voices) / len(voices),
+        "voices_peak": max(voices),
+        "buffer_kib": player.memory_bytes() / 1024,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.bench_audio")
+    parser.add_argument("--zombies", type=int, default=600)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER)
+    pygame.init()
+    pygame.mixer.init()
+
+    events = record_events(args.zombies, int(args.seconds * 1000 / TICK_MS), args.seed)
+    results = {
+        "Sound.play": play_back(NaivePlayer(), events),
+        "Audio": play_back(audio := make_audio(), events),
+    }
+    print(f"{'':<12}{'CPU %':>8}{'play µs/tick':>14}{'eventos':>9}"
+          f"{'vozes méd':>11}{'pico':>6}{'buffers KiB':>13}")
+    for name, r in results.items():
+        print(
+            f"{name:<12}{r['cpu_pct']:>8.1f}{r['play_us_per_tick']:>14.1f}{r['events']:>9}"
+            f"{r['voices_mean']:>11.2f}{r['voices_peak']:>6}{r['buffer_kib']:>13.0f}"
+        )
+    print(
+        f"Audio: {audio.played} tocados, {audio.retriggered} reiniciados, "
+        f"{audio.dropped} descartados, {audio.stolen} roubados"
+    )
+
+
+if __name__ == "__main__":
+    main()
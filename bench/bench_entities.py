@@ -0,0 +1,146 @@
+"""
+Custo por entidade: ``__slots__`` + ``Registry`` vs. ``pygame.sprite.Sprite``.
+
+Compara o ``Bullet`` atual com uma réplica do layout anterior (sprite com
+``__dict__``, em ``all_sprites`` + grupo do tipo): memória por instância
+(``tracemalloc``) e tempo de adicionar/remover e de iterar para o update.
+
+Rodar da raiz do projeto::
+
+    python -m bench.bench_entities --count 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import pygame
+
+from code.Bullet import Bullet
+from code.Const import SCREEN_WIDTH
+from code.Registry import Registry
+
+
+class SpriteBullet(pygame.sprite.Sprite):
+    """Tiro como era antes: sprite do pygame com atributos em ``__dict__``."""
+
+    def __init__(self, image_surface: pygame.Surface) -> None:
+        super().__init__()
+        self.image = image_surface
+        self.rect = self.image.get_rect()
+        self.x = 0.0
+        self.y = 0.0
+        self.prev_x = 0.0
+        self.prev_y = 0.0
+        self.pool = None
+        self.pooled = False
+        self.speed = 720.0
+
+    def update(self, dt: float) -> None:
+        # Mesmo trabalho de ``Bullet.update``
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.x += self.speed * dt / 1000
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+        if self.rect.left > SCREEN_WIDTH:
+            self.kill()
+
+
+def bytes_per_instance(factory, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_sprites(image: pygame.Surface, count: int, repeat: int) -> dict[str, float]:
+    objects = [SpriteBullet(image) for _ in range(count)]
+    all_sprites = pygame.sprite.Group()
+    bullets = pygame.sprite.Group()
+
+    def add_remove() -> None:
+        for obj in objects:
+            obj.add(all_sprites, bullets)
+        for obj in objects:
+            obj.kill()
+
+    def update() -> None:
+        all_sprites.update(16)
+
+    add_remove_s = best_of(add_remove, repeat)
+    for obj in objects:
+        obj.x = -10**6  # longe da borda: o update não remove ninguém
+    all_sprites.add(objects)
+    bullets.add(objects)
+    update_s = best_of(update, repeat)
+    return {
+        "bytes": bytes_per_instance(lambda: SpriteBullet(image), count),
+        "add_remove_us": add_remove_s / count * 1e6,
+        "update_us": update_s / count * 1e6,
+    }
+
+
+def bench_registry(image: pygame.Surface, count: int, repeat: int) -> dict[str, float]:
+    objects = [Bullet(image, (0, 0)) for _ in range(count)]
+    registry = Registry((Bullet,))
+
+    def add_remove() -> None:
+        for obj in objects:
+            registry.add(obj)
+        for obj in objects:
+            obj.kill()
+
+    def update() -> None:
+        for entity in registry.all():
+            entity.update(16)
+
+    add_remove_s = best_of(add_remove, repeat)
+    for obj in objects:
+        registry.add(obj)
+        obj.place(-10**6, 0)  # longe da borda: o update não remove ninguém
+    update_s = best_of(update, repeat)
+    return {
+        "bytes": bytes_per_instance(lambda: Bullet(image, (0, 0)), count),
+        "add_remove_us": add_remove_s / count * 1e6,
+        "update_us": update_s / count * 1e6,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.bench_entities")
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    image = pygame.Surface((16, 8), pygame.SRCALPHA)
+    results = {
+        "Sprite + grupos": bench_sprites(image, args.count, args.repeat),
+        "__slots__ + Registry": bench_registry(image, args.count, args.repeat),
+    }
+    print(f"{'':<22}{'bytes/inst':>12}{'add+remove µs':>16}{'update µs':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<22}{result['bytes']:>12.0f}"
+            f"{result['add_remove_us']:>16.3f}{result['update_us']:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+Hordas roteirizadas passando por ``Game.update_game`` e ``Game.draw_playing``.
+
+Cada cenário monta uma partida fora da tela (driver SDL ``dummy``) com N
+zumbis, uma densidade fixa de tiros, chefe ativo ou não e parallax ligado
+ou não, e mede ticks/s da simulação e quadros/s do desenho. O resultado
+vai para JSON; ``--compare`` aponta regressões contra um baseline salvo.
+
+``bench/baseline.json`` é a referência versionada, medida com as versões
+de ``requirements.txt`` e com a máquina em ``meta``. Ele só vale no mesmo
+ambiente (``--compare`` avisa o que difere): em outro, grave o seu com
+``--out`` antes de mudar o código e compare com ele.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from code.BossZombie import BossZombie  # noqa: E402
+from code.Bullet import Bullet  # noqa: E402
+from code.Const import (  # noqa: E402
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    TICK_MS,
+    INITIAL_LIVES,
+)
+from code.Game import Game  # noqa: E402
+
+ZOMBIE_COUNTS = (10, 100, 1000, 10000)
+BULLET_COUNTS = (0, 50)
+SEED = 1234
+
+
+class FlatBackground:
+    """Fundo sem parallax (cor sólida), para isolar o custo das camadas."""
+
+    def set_level(self, level: int) -> None:
+        pass
+
+    def update(self, dt: float) -> None:
+        pass
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        screen.fill((20, 20, 20))
+
+
+def scenario_name(zombies: int, bullets: int, boss: bool, parallax: bool) -> str:
+    return (
+        f"z{zombies}-b{bullets}"
+        f"-{'boss' if boss else 'noboss'}"
+        f"-{'parallax' if parallax else 'flat'}"
+    )
+
+
+def setup_scenario(game: Game, zombies: int, boss: bool, background) -> None:
+    game.start_new_game()
+    game.profiler.enabled = False
+    world = game.world
+    world.reset(seed=SEED)
+
+    # Sem level up: o cenário fica estável (vidas são repostas a cada tick)
+    world.level_timer.cancel()
+
+    world.spawn_zombies(zombies - world.horde.count)
+
+    if boss:
+        chief = BossZombie(world.boss_image, life=10**9, timers=world.timers)
+        chief.place(SCREEN_WIDTH - 120 - chief.rect.width, SCREEN_HEIGHT // 3)
+        chief.entering = False
+        world.entities.add(chief)
+        world.boss_spawned = True
+
+    game.background = background
+
+
+def top_up_bullets(game: Game, bullets: int) -> None:
+    """Mantém ``bullets`` tiros em voo, espalhados pela tela."""
+    world = game.world
+    missing = bullets - world.entities.count(Bullet)
+    for i in range(missing):
+        bullet = world.bullet_pool.acquire(world.entities)
+        y = 20 + (i * 37) % (SCREEN_HEIGHT - 40)
+        bullet.launch((world.rng.randrange(0, SCREEN_WIDTH), y))
+
+
+def measure(fn, min_time: float, min_iterations: int) -> float:
+    """Execuções por segundo de ``fn`` (aquecida antes)."""
+    for _ in range(3):
+        fn()
+    iterations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time or iterations < min_iterations:
+        fn()
+        iterations += 1
+        elapsed = time.perf_counter() - start
+    return iterations / elapsed
+
+
+def run_scenario(
+    game: Game,
+    parallax_background,
+    zombies: int,
+    bullets: int,
+    boss: bool,
+    parallax: bool,
+    min_time: float,
+) -> dict:
+    background = parallax_background if parallax else FlatBackground()
+    setup_scenario(game, zombies, boss, background)
+
+    def tick() -> None:
+        top_up_bullets(game, bullets)
+        game.update_game(TICK_MS)
+        game.world.score.lives = INITIAL_LIVES
+
+    update_rate = measure(tick, min_time, 5)
+    top_up_bullets(game, bullets)
+    draw_rate = measure(lambda: game.draw_playing(0.5), min_time, 5)
+
+    return {
+        "name": scenario_name(zombies, bullets, boss, parallax),
+        "zombies": zombies,
+        "bullets": bullets,
+        "boss": boss,
+        "parallax": parallax,
+        "update_ticks_per_s": round(update_rate, 2),
+        "draw_fps": round(draw_rate, 2),
+        # Pares de colisão do último tick medido
+        "candidate_pairs": game.world.candidate_pairs,
+        "naive_pairs": game.world.naive_pairs,
+    }
+
+
+# Ambiente que precisa bater com o do baseline para a comparação valer
+COMPARABLE_META = ("python", "pygame", "platform", "machine", "cpus", "batched_draw")
+
+
+def compare(
+    results: list[dict],
+    baseline_path: str,
+    threshold: float,
+    meta: dict | None = None,
+) -> bool:
+    """
+    Imprime a variação contra o baseline; False se houver regressão.
+
+    Avisa (sem falhar) quando ``meta`` difere do ambiente em que o
+    baseline foi medido: a variação pode ser da build, não do código.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        report = json.load(f)
+    baseline = {r["name"]: r for r in report["results"]}
+
+    if meta is not None:
+        base_meta = report.get("meta", {})
+        for key in COMPARABLE_META:
+            if base_meta.get(key) != meta.get(key):
+                print(
+                    f"aviso: {key} do baseline é {base_meta.get(key)!r}, "
+                    f"esta medição é {meta.get(key)!r}",
+                    file=sys.stderr,
+                )
+
+    ok = True
+    print(f"\n{'cenário':<32}{'métrica':<22}{'baseline':>12}{'atual':>12}{'Δ':>9}")
+    for result in results:
+        base = baseline.get(result["name"])
+        if base is None:
+            continue
+        for metric in ("update_ticks_per_s", "draw_fps"):
+            old, new = base[metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            flag = ""
+            if change < -threshold:
+                flag = "  REGRESSÃO"
+                ok = False
+            print(
+                f"{result['name']:<32}{metric:<22}{old:>12.1f}{new:>12.1f}"
+                f"{change:>+9.1%}{flag}"
+            )
+    return ok
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench")
+    parser.add_argument("--zombies", type=int, nargs="+", default=ZOMBIE_COUNTS)
+    parser.add_argument("--bullets", type=int, nargs="+", default=BULLET_COUNTS)
+    parser.add_argument("--boss", choices=("on", "off", "both"), default="both")
+    parser.add_argument("--parallax", choices=("on", "off", "both"), default="both")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="segundos mínimos de medição por métrica",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="desenho sprite a sprite (compara com o lote do atlas)",
+    )
+    parser.add_argument("--out", help="arquivo JSON de saída")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON de referência")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="queda relativa aceita antes de acusar regressão (0.10 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    options = {"on": (True,), "off": (False,), "both": (False, True)}
+    game = Game(batched_draw=not args.no_batch)
+    game.finish_loading()
+    parallax_background = game.background
+
+    results = []
+    matrix = itertools.product(
+        args.zombies,
+        args.bullets,
+        options[args.boss],
+        options[args.parallax],
+    )
+    for zombies, bullets, boss, parallax in matrix:
+        result = run_scenario(
+            game, parallax_background, zombies, bullets, boss, parallax, args.min_time
+        )
+        results.append(result)
+        print(
+            f"{result['name']:<32}"
+            f"update {result['update_ticks_per_s']:>10.1f} ticks/s   "
+            f"draw {result['draw_fps']:>9.1f} fps   "
+            f"pares {result['candidate_pairs']:>6}/{result['naive_pairs']:<7}"
+        )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "batched_draw": not args.no_batch,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.threshold, report["meta"]):
+        sys.exit(1)
@@ -0,0 +1,312 @@
+"""
+Varredura de balanceamento: milhares de partidas sem janela, em paralelo.
+
+Cada combinação de parâmetros (``--set nome=v1,v2``, chaves de
+``BALANCE``) é jogada com ``--seeds`` sementes por um bot simples
+(``Autoplayer``), uma partida por tarefa num ``multiprocessing.Pool``. A
+simulação roda em passo fixo sem esperar o relógio, bem mais rápido que
+o tempo real. Os resultados saem por coluna num ``.npz`` (um array por
+métrica, gravado em blocos enquanto as partidas terminam; ver
+``load_results``); no fim, um resumo por combinação (sobrevivência,
+level e taxa de vitória sobre o chefe).
+
+Rodar da raiz do projeto::
+
+    python -m bench.sweep --set initial_lives=3,5 --set boss_life=20,40 \\
+        --seeds 200 --out sweep.npz
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np  # noqa: E402
+
+from code.BossZombie import BossZombie  # noqa: E402
+from code.Brain import Brain  # noqa: E402
+from code.Const import (  # noqa: E402
+    BALANCE,
+    SCREEN_HEIGHT,
+    STATE_GAME_WIN,
+    TICK_MS,
+)
+from code.InputState import InputState  # noqa: E402
+from code.World import World  # noqa: E402
+
+RESULT_COLUMNS = (
+    "seed",
+    "ticks",
+    "survival_s",
+    "level",
+    "points",
+    "kills",
+    "lives",
+    "boss_spawned",
+    "boss_killed",
+)
+
+
+class Autoplayer:
+    """
+    Bot roteirizado: atira sempre, se alinha com o zumbi mais próximo à
+    frente e desvia na vertical dos cérebros do chefe.
+
+    É uma função tick -> ``InputState`` (ver ``World.run_ticks``) que lê o
+    estado do mundo; não precisa jogar bem, só de forma consistente entre
+    as combinações de parâmetros.
+    """
+
+    DANGER_X = 220  # px à frente do jogador em que um cérebro é perigo
+    MARGIN = 6  # px de folga no alinhamento
+    BOSS_CLEAR_X = 300  # zumbi mais longe que isso: mira no chefe
+
+    def __init__(self, world: World) -> None:
+        self.world = world
+
+    def __call__(self, tick: int) -> InputState:
+        world = self.world
+        player = world.player
+        if player is None:
+            return InputState()
+        rect = player.rect
+        horde = world.horde
+        n = horde.count
+        xs = horde.x[:n]
+        centers_y = horde.y[:n] + horde.height / 2
+
+        # Desviar de zumbis na faixa rende menos que atirar neles (medido
+        # com as sementes 0-5); o bot só foge dos cérebros
+        ahead = xs - rect.right
+        dodge = 0.0
+        for brain in world.entities.of(Brain):
+            close = brain.rect.left - rect.right < self.DANGER_X
+            if close and abs(brain.rect.centery - rect.centery) < rect.height:
+                dodge = float(rect.centery - brain.rect.centery) or 1.0
+
+        up = down = False
+        if dodge:
+            # Foge para o lado oposto à ameaça; encostado na borda, pelo outro
+            down = dodge > 0
+            if down and rect.bottom >= SCREEN_HEIGHT:
+                down = False
+            elif not down and rect.top <= 0:
+                down = True
+            up = not down
+        else:
+            # Alinha com o zumbi mais próximo ainda à frente; sem nenhum
+            # perto, mira no chefe
+            target = None
+            front = np.flatnonzero(ahead > 0)
+            if front.size:
+                nearest = front[np.argmin(ahead[front])]
+                if ahead[nearest] < self.BOSS_CLEAR_X:
+                    target = centers_y[nearest]
+            bosses = world.entities.of(BossZombie)
+            if target is None and bosses:
+                target = bosses[0].rect.centery
+            elif target is None and front.size:
+                target = centers_y[nearest]
+            if target is not None:
+                up = target < rect.centery - self.MARGIN
+                down = target > rect.centery + self.MARGIN
+
+        return InputState(up=up, down=down, shoot=tick % 2 == 0)
+
+
+# ========= Processos ========= #
+
+_template: World | None = None
+
+
+def init_worker() -> None:
+    """Carrega a arte uma vez por processo (as máscaras de colisão dependem dela)."""
+    global _template
+    _template = World.headless()
+
+
+def play(task: tuple[dict, int, int]) -> tuple[dict, dict]:
+    """Joga uma partida com ``params`` e ``seed``; devolve (params, resultado)."""
+    params, seed, max_ticks = task
+    template = _template
+    world = World(
+        template.player_image,
+        template.zombie_image,
+        template.bullet_image,
+        template.boss_image,
+        template.brain_image,
+        seed=seed,
+        balance=params,
+    )
+    world.reset(seed=seed)
+    world.run_ticks(max_ticks, Autoplayer(world))
+    return params, {
+        "seed": seed,
+        "ticks": world.ticks,
+        "survival_s": round(world.ticks * TICK_MS / 1000, 3),
+        "level": world.difficulty_level,
+        "points": world.score.points,
+        "kills": world.score.kills,
+        "lives": world.score.lives,
+        "boss_spawned": int(world.boss_spawned),
+        "boss_killed": int(world.state == STATE_GAME_WIN),
+    }
+
+
+# ========= Resultados ========= #
+
+class ColumnWriter:
+    """
+    Grava linhas como colunas num ``.npz``, em blocos de ``chunk`` linhas.
+
+    Cada bloco entra no zip como ``<coluna>.<bloco>.npy`` e o arquivo é
+    fechado a cada bloco: a memória não cresce com a varredura e o que já
+    terminou pode ser lido (``load_results``) com ela ainda rodando.
+    """
+
+    def __init__(self, path: str, columns: list[str], chunk: int = 1024) -> None:
+        self.path = path
+        self.columns = columns
+        self.chunk = chunk
+        self.pending: dict[str, list] = {name: [] for name in columns}
+        self.blocks = 0
+        self.rows = 0
+        zipfile.ZipFile(path, "w").close()
+
+    def append(self, row: dict) -> None:
+        for name in self.columns:
+            self.pending[name].append(row[name])
+        self.rows += 1
+        if len(self.pending[self.columns[0]]) >= self.chunk:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.pending[self.columns[0]]:
+            return
+        with zipfile.ZipFile(self.path, "a") as archive:
+            for name, values in self.pending.items():
+                with archive.open(f"{name}.{self.blocks:05d}.npy", "w", force_zip64=True) as f:
+                    np.lib.format.write_array(f, np.asarray(values))
+                values.clear()
+        self.blocks += 1
+
+
+def load_results(path: str) -> dict[str, np.ndarray]:
+    """Colunas de um ``.npz`` do ``ColumnWriter``, com os blocos concatenados."""
+    blocks: dict[str, list[str]] = {}
+    with np.load(path) as data:
+        for key in sorted(data.files):
+            blocks.setdefault(key.rsplit(".", 1)[0], []).append(key)
+        return {name: np.concatenate([data[key] for key in keys]) for name, keys in blocks.items()}
+
+
+# ========= Linha de comando ========= #
+
+def parse_values(text: str) -> tuple[str, list[float]]:
+    name, _, values = text.partition("=")
+    if name not in BALANCE:
+        raise argparse.ArgumentTypeError(
+            f"parâmetro desconhecido: {name} (use {', '.join(BALANCE)})"
+        )
+    kind = type(BALANCE[name])
+    return name, [kind(float(value)) for value in values.split(",")]
+
+
+def summarize(results: dict[str, np.ndarray], params: dict) -> dict[str, float]:
+    """Resumo das partidas jogadas com ``params`` (zerado se nenhuma terminou)."""
+    sessions = len(results.get("seed", ()))
+    selected = np.ones(sessions, dtype=bool)
+    for name, value in params.items():
+        if sessions:
+            selected &= results[name] == value
+    if not selected.any():
+        return {
+            "sessions": 0,
+            "survival_mean_s": 0.0,
+            "survival_median_s": 0.0,
+            "level_mean": 0.0,
+            "boss_kill_rate": 0.0,
+        }
+    survival = results["survival_s"][selected]
+    return {
+        "sessions": int(selected.sum()),
+        "survival_mean_s": round(float(survival.mean()), 2),
+        "survival_median_s": round(float(np.median(survival)), 2),
+        "level_mean": round(float(results["level"][selected].mean()), 2),
+        "boss_kill_rate": round(float(results["boss_killed"][selected].mean()), 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.sweep")
+    parser.add_argument(
+        "--set",
+        dest="grid",
+        metavar="NOME=V1,V2",
+        type=parse_values,
+        action="append",
+        default=[],
+        help="valores a varrer para uma chave de BALANCE (repetível)",
+    )
+    parser.add_argument("--seeds", type=int, default=20, help="partidas por combinação")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument(
+        "--max-minutes",
+        type=float,
+        default=10.0,
+        help="duração máxima de cada partida (tempo de jogo)",
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--out",
+        default="sweep.npz",
+        help="resultados por coluna (.npz; ler com load_results)",
+    )
+    parser.add_argument("--summary", help="CSV com o resumo por combinação")
+    args = parser.parse_args(argv)
+
+    names = [name for name, _ in args.grid]
+    combos = [dict(zip(names, values)) for values in itertools.product(*(v for _, v in args.grid))]
+    max_ticks = round(args.max_minutes * 60_000 / TICK_MS)
+    tasks = [
+        (params, seed, max_ticks)
+        for params in combos
+        for seed in range(args.first_seed, args.first_seed + args.seeds)
+    ]
+
+    writer = ColumnWriter(args.out, [*names, *RESULT_COLUMNS])
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.workers, initializer=init_worker) as pool:
+        chunksize = max(1, len(tasks) // (args.workers * 8))
+        for done, (params, result) in enumerate(
+            pool.imap_unordered(play, tasks, chunksize=chunksize), 1
+        ):
+            writer.append({**params, **result})
+            if done % 50 == 0 or done == len(tasks):
+                elapsed = time.perf_counter() - start
+                print(f"\r{done}/{len(tasks)} partidas  {elapsed:6.1f} s", end="", file=sys.stderr)
+    writer.flush()
+    print(file=sys.stderr)
+
+    results = load_results(args.out)
+    summary = [{**params, **summarize(results, params)} for params in combos]
+    for row in summary:
+        print("  ".join(f"{key}={value}" for key, value in row.items()))
+    if args.summary:
+        with open(args.summary, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(summary[0]))
+            writer.writeheader()
+            writer.writerows(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Animações por quadros, pré-processadas uma vez e compartilhadas por tipo.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+
+class AnimationSet:
+    """
+    Todos os quadros de um tipo de sprite, prontos para desenhar.
+
+    Os clipes (``walk``, ``attack``...) são fatiados de uma sprite sheet ou
+    gerados a partir de uma imagem única, e as variantes espelhadas e
+    tingidas são assadas na criação. Todas as instâncias do tipo usam as
+    mesmas superfícies: animar é só escolher um índice pelo tempo.
+
+    Os quadros ficam numa lista única (``frames``): primeiro os normais de
+    cada clipe, depois os espelhados na mesma ordem. Isso permite calcular
+    o índice de milhares de sprites de uma vez (ver ``frame_ids``).
+    """
+
+    def __init__(self, clips: dict[str, list[pygame.Surface]], frame_ms: float = 120.0) -> None:
+        """
+        Args:
+            clips: nome do clipe -> quadros (todos do mesmo tamanho).
+            frame_ms: duração de cada quadro.
+        """
+        self.frame_ms = frame_ms
+        self.clips: dict[str, tuple[int, int]] = {}  # nome -> (início, quadros)
+
+        frames: list[pygame.Surface] = []
+        for name, clip in clips.items():
+            self.clips[name] = (len(frames), len(clip))
+            frames.extend(clip)
+        self.flip_offset = len(frames)
+        frames.extend(pygame.transform.flip(frame, True, False) for frame in list(frames))
+        self.frames = frames
+
+    # ========= Criação ========= #
+
+    @classmethod
+    def from_sheet(
+        cls,
+        sheet: pygame.Surface,
+        frame_size: tuple[int, int],
+        clips: dict[str, tuple[int, int]],
+        scale: tuple[int, int] | None = None,
+        frame_ms: float = 120.0,
+    ) -> AnimationSet:
+        """
+        Fatia uma sprite sheet em grade.
+
+        Args:
+            sheet: imagem com os quadros lado a lado.
+            frame_size: tamanho de cada quadro na sheet.
+            clips: nome -> (linha da sheet, quantidade de quadros).
+            scale: tamanho final dos quadros (None mantém).
+        """
+        w, h = frame_size
+        sliced = {}
+        for name, (row, count) in clips.items():
+            frames = []
+            for i in range(count):
+                frame = sheet.subsurface(pygame.Rect(i * w, row * h, w, h)).copy()
+                if scale is not None and frame.get_size() != tuple(scale):
+                    frame = pygame.transform.smoothscale(frame, scale)
+                frames.append(frame)
+            sliced[name] = frames
+        return cls(sliced, frame_ms)
+
+    @classmethod
+    def procedural(
+        cls,
+        image: pygame.Surface,
+        swing: float = 4.0,
+        bob: int = 2,
+        attack_swing: float = 0.0,
+        frame_ms: float = 120.0,
+    ) -> AnimationSet:
+        """
+        Ciclo de caminhada (e ataque) a partir de uma imagem só.
+
+        Os assets do jogo não têm sprite sheets: cada quadro é a imagem
+        girada alguns graus e deslocada na vertical, no mesmo tamanho da
+        original (o ``rect`` das colisões não muda).
+
+        Args:
+            swing: inclinação máxima da caminhada (graus).
+            bob: quanto o corpo sobe no meio do passo (px).
+            attack_swing: inclinação para a frente do ataque (0 = sem clipe).
+        """
+        walk = [
+            cls._pose(image, -swing, 0),
+            cls._pose(image, 0, -bob),
+            cls._pose(image, swing, 0),
+            cls._pose(image, 0, -bob),
+        ]
+        clips = {"walk": walk}
+        if attack_swing:
+            clips["attack"] = [
+                cls._pose(image, attack_swing * 0.5, 0),
+                cls._pose(image, attack_swing, -bob),
+            ]
+        return cls(clips, frame_ms)
+
+    @staticmethod
+    def _pose(image: pygame.Surface, angle: float, offset_y: int) -> pygame.Surface:
+        frame = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        posed = pygame.transform.rotozoom(image, angle, 1.0) if angle else image
+        rect = posed.get_rect(center=frame.get_rect().center)
+        rect.y += offset_y
+        frame.blit(posed, rect)
+        return frame.convert_alpha() if pygame.display.get_surface() else frame
+
+    def tinted(self, color: tuple[int, int, int]) -> AnimationSet:
+        """Cópia com os quadros clareados por ``color`` (ex.: flash de dano)."""
+        clips = {}
+        for name, (start, count) in self.clips.items():
+            frames = []
+            for frame in self.frames[start:start + count]:
+                frame = frame.copy()
+                frame.fill(color, special_flags=pygame.BLEND_RGB_ADD)
+                frames.append(frame)
+            clips[name] = frames
+        return AnimationSet(clips, self.frame_ms)
+
+    # ========= Consulta ========= #
+
+    def frame(self, clip: str, time_ms: float, flipped: bool = False) -> pygame.Surface:
+        start, count = self.clips[clip]
+        index = start + int(time_ms // self.frame_ms) % count
+        if flipped:
+            index += self.flip_offset
+        return self.frames[index]
+
+    def frame_ids(
+        self,
+        clip: str,
+        time_ms: np.ndarray,
+        flipped: np.ndarray | None = None,
+        alternate: str | None = None,
+        use_alternate: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Índices em ``frames`` para vários sprites de uma vez.
+
+        Args:
+            clip: clipe padrão.
+            time_ms: tempo de animação de cada sprite.
+            flipped: quais usam a variante espelhada.
+            alternate, use_alternate: outro clipe e quem o usa (ex.: ataque).
+        """
+        tick = (time_ms // self.frame_ms).astype(np.intp)
+        start, count = self.clips[clip]
+        ids = start + tick % count
+        if alternate is not None and use_alternate is not None:
+            alt_start, alt_count = self.clips[alternate]
+            ids = np.where(use_alternate, alt_start + tick % alt_count, ids)
+        if flipped is not None:
+            ids = ids + flipped * self.flip_offset
+        return ids
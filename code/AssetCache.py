@@ -0,0 +1,249 @@
+"""
+Cache em disco de sprites já decodificados e escalados.
+
+Os PNGs originais são grandes (até 1024x1024) e viram sprites pequenos;
+decodificar e aplicar ``smoothscale`` em toda abertura domina o tempo de
+inicialização. O cache guarda os pixels RGBA finais em um único arquivo,
+lido de uma vez, com chave ``hash da fonte + tamanho final + variante``.
+
+Para medir o ganho::
+
+    python -m code.AssetCache --bench
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from typing import Callable
+
+import pygame
+
+from .Const import ASSET_CACHE_FILE
+
+Size = tuple[int, int]
+SizeSpec = Size | Callable[[Size], Size] | None
+
+MAGIC = b"ZRAC"
+VERSION = 1
+HEADER = struct.Struct("<4sII")  # magic, versão, tamanho do índice
+
+
+class AssetCache:
+    """
+    Sprites pré-processados, carregados com uma única leitura.
+
+    Pode ser usado pelas threads do ``AssetLoader``: os dicionários só são
+    alterados (e o arquivo só é gravado) sob ``lock``; decodificar e escalar
+    acontece fora dele.
+    """
+
+    def __init__(self, path: str = ASSET_CACHE_FILE) -> None:
+        self.path = path
+
+        # Fontes conhecidas: caminho -> mtime, bytes, sha1 e tamanho original
+        self.sources: dict[str, dict] = {}
+
+        # Entradas do arquivo: chave -> offset/tamanho no blob
+        self.entries: dict[str, dict] = {}
+        self.blob = memoryview(b"")
+
+        # Pixels já entregues nesta execução
+        self.used: dict[str, tuple[Size, bytes | memoryview]] = {}
+        self.dirty = False
+
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    # ========= Arquivo ========= #
+
+    def load(self) -> bool:
+        """Lê o cache inteiro do disco. Retorna False se não existir/for inválido."""
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+
+        if len(data) < HEADER.size:
+            return False
+        magic, version, index_len = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            return False
+
+        start = HEADER.size
+        try:
+            index = json.loads(data[start:start + index_len])
+        except ValueError:
+            return False
+
+        self.sources = index["sources"]
+        self.entries = index["entries"]
+        self.blob = memoryview(data)[start + index_len:]
+        return True
+
+    def save(self) -> None:
+        """Reescreve o cache; descarta entradas de fontes que mudaram."""
+        with self.lock:
+            if not self.dirty:
+                return
+
+            current = {info["sha1"] for info in self.sources.values()}
+            pending = dict(self.used)
+            for key, entry in self.entries.items():
+                if key not in pending and key.split(":", 1)[0] in current:
+                    start = entry["offset"]
+                    pixels = self.blob[start:start + entry["length"]]
+                    pending[key] = (tuple(entry["size"]), pixels)
+
+            entries = {}
+            chunks = []
+            offset = 0
+            for key, (size, pixels) in pending.items():
+                entries[key] = {"size": list(size), "offset": offset, "length": len(pixels)}
+                chunks.append(pixels)
+                offset += len(pixels)
+
+            index = json.dumps({"sources": self.sources, "entries": entries}).encode()
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+                f.write(index)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    # ========= Imagens ========= #
+
+    def source_info(self, path: str) -> dict | None:
+        """Hash e tamanho original da fonte; só relê o arquivo se ele mudou."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        info = self.sources.get(path)
+        if info and info["mtime"] == stat.st_mtime_ns and info["bytes"] == stat.st_size:
+            return info
+
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            size = pygame.image.load(path).get_size()
+        except pygame.error:
+            return None
+
+        info = {
+            "mtime": stat.st_mtime_ns,
+            "bytes": stat.st_size,
+            "sha1": hashlib.sha1(data).hexdigest(),
+            "size": list(size),
+        }
+        with self.lock:
+            self.sources[path] = info
+            self.dirty = True
+        return info
+
+    def image(
+        self,
+        path: str,
+        scale: SizeSpec = None,
+        darken: int = 0,
+    ) -> pygame.Surface | None:
+        """
+        Sprite pronto (escalado e escurecido), do cache ou recém-processado.
+
+        Args:
+            path: caminho do PNG original.
+            scale: tamanho final, ou função (tamanho original) -> tamanho final.
+            darken: valor subtraído de R, G e B (como ``BLEND_RGB_SUB``).
+
+        Returns:
+            Superfície RGBA (sem ``convert``), ou None se a fonte não existir.
+        """
+        info = self.source_info(path)
+        if info is None:
+            return None
+
+        source_size = tuple(info["size"])
+        target = scale(source_size) if callable(scale) else (scale or source_size)
+        key = f"{info['sha1']}:{target[0]}x{target[1]}:{darken}"
+
+        if key in self.used:
+            size, pixels = self.used[key]
+            return pygame.image.frombuffer(pixels, size, "RGBA")
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            start = entry["offset"]
+            pixels = self.blob[start:start + entry["length"]]
+            size = tuple(entry["size"])
+        else:
+            self.misses += 1
+            surface = self.bake(path, target, darken)
+            size = surface.get_size()
+            pixels = pygame.image.tobytes(surface, "RGBA")
+
+        with self.lock:
+            if entry is None:
+                self.dirty = True
+            self.used[key] = (size, pixels)
+        return pygame.image.frombuffer(pixels, size, "RGBA")
+
+    @staticmethod
+    def bake(path: str, size: Size, darken: int = 0) -> pygame.Surface:
+        image = AssetCache.truecolor(pygame.image.load(path))
+        if darken:
+            image = image.copy()
+            image.fill((darken, darken, darken), special_flags=pygame.BLEND_RGB_SUB)
+        if image.get_size() != tuple(size):
+            image = pygame.transform.smoothscale(image, size)
+        return image
+
+    @staticmethod
+    def truecolor(image: pygame.Surface) -> pygame.Surface:
+        """
+        Garante 24/32 bits (exigido por ``smoothscale``) sem ``convert``,
+        que depende do display e não pode rodar nas threads de carregamento.
+        """
+        if image.get_bitsize() >= 24:
+            return image
+        rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        rgba.blit(image, (0, 0))
+        return rgba
+
+
+def bench() -> None:
+    """Compara o tempo de criação do Game sem cache, assando e com cache."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from .Game import Game
+
+    if os.path.exists(ASSET_CACHE_FILE):
+        os.remove(ASSET_CACHE_FILE)
+
+    results = {}
+    for label, use_cache in (("sem cache", False), ("assando", True), ("com cache", True)):
+        start = time.perf_counter()
+        Game(use_asset_cache=use_cache).finish_loading()
+        results[label] = (time.perf_counter() - start) * 1000
+        pygame.quit()
+
+    for label, ms in results.items():
+        print(f"{label:>10}: {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        bench()
@@ -0,0 +1,53 @@
+"""
+Carregamento de assets em threads, em grupos (menu, partida, chefe).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class AssetLoader:
+    """
+    Decodifica arquivos num pool de threads enquanto o jogo segue rodando.
+
+    Cada arquivo é um job dentro de um grupo; o jogo consulta ``progress``
+    para a tela de carregamento e, quando ``done(grupo)``, pega os
+    resultados com ``results`` e termina o trabalho que exige a thread
+    principal (``convert_alpha``, criar o ``Menu``...). Os jobs só devem
+    produzir superfícies soltas, sem tocar no display.
+    """
+
+    def __init__(self, workers: int = 2) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="assets",
+        )
+        self.groups: dict[str, dict[str, Future]] = {}
+
+    def submit(self, group: str, name: str, job: Callable[..., Any], *args) -> None:
+        jobs = self.groups.setdefault(group, {})
+        if name not in jobs:
+            jobs[name] = self.executor.submit(job, *args)
+
+    def queued(self, group: str) -> bool:
+        return group in self.groups
+
+    def done(self, group: str) -> bool:
+        jobs = self.groups.get(group)
+        return jobs is not None and all(job.done() for job in jobs.values())
+
+    def progress(self, *groups: str) -> float:
+        """Fração dos jobs concluídos (0.0 a 1.0) nos grupos pedidos."""
+        jobs = [job for g in groups for job in self.groups.get(g, {}).values()]
+        if not jobs:
+            return 1.0
+        return sum(job.done() for job in jobs) / len(jobs)
+
+    def results(self, group: str) -> dict[str, Any]:
+        """Resultados do grupo; bloqueia até o último job terminar."""
+        return {name: job.result() for name, job in self.groups[group].items()}
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,210 @@
+"""
+Gerente de vozes do mixer: canais por grupo, limite por som e música em stream.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from .Const import AUDIO_GROUPS, MUSIC_VOLUME
+
+
+class SoundSlot:
+    """Um som registrado: buffer decodificado, limites e vozes tocando."""
+
+    def __init__(self, sound: pygame.mixer.Sound, group: str, voices: int, per_frame: int) -> None:
+        self.sound = sound
+        self.group = group
+        self.max_voices = voices
+        self.per_frame = per_frame
+        self.triggered = 0  # disparos neste quadro
+        self.channels: list[pygame.mixer.Channel] = []  # mais antiga primeiro
+
+
+class ChannelGroup:
+    """Canais reservados de um grupo; sem canal livre, reusa o mais antigo."""
+
+    def __init__(self, channels: list[pygame.mixer.Channel]) -> None:
+        self.channels = channels
+        self.started = [0] * len(channels)  # ordem em que cada um começou
+
+    def acquire(self, order: int) -> tuple[pygame.mixer.Channel, bool]:
+        """Canal para uma voz nova e se ele foi roubado de outra."""
+        oldest = 0
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                self.started[i] = order
+                return channel, False
+            if self.started[i] < self.started[oldest]:
+                oldest = i
+        self.started[oldest] = order
+        return self.channels[oldest], True
+
+    def restart(self, channel: pygame.mixer.Channel, order: int) -> None:
+        self.started[self.channels.index(channel)] = order
+
+    def busy(self) -> int:
+        return sum(channel.get_busy() for channel in self.channels)
+
+
+class Audio:
+    """
+    Toca os sons do jogo em canais reservados, com limite por som.
+
+    Cada grupo de ``AUDIO_GROUPS`` tem seus canais; o ``pygame.mixer``
+    não os usa para ``Sound.play`` soltos e um grupo não rouba voz do
+    outro. Cada som tem um máximo de vozes simultâneas (no
+    limite, a voz mais antiga dele recomeça em vez de abrir outra) e de
+    disparos por quadro (``begin_frame`` zera; o excesso é descartado):
+    uma horda morrendo de uma vez vira um punhado de vozes, não dezenas.
+
+    Os sons são decodificados uma vez (``decode``, na thread de assets)
+    para o formato do mixer, sem o silêncio das pontas. A música não
+    ocupa canal: o ``mixer.music`` a lê do arquivo aos poucos.
+    """
+
+    # Amplitude (fração do máximo) abaixo da qual as pontas são cortadas
+    TRIM_LEVEL = 16 / 32768
+    FADE_MS = 8  # rampa no fim cortado, sem estalo
+
+    def __init__(self, groups: dict[str, int] = AUDIO_GROUPS) -> None:
+        total = sum(groups.values())
+        pygame.mixer.set_num_channels(total)
+        pygame.mixer.set_reserved(total)
+
+        self.groups: dict[str, ChannelGroup] = {}
+        first = 0
+        for name, count in groups.items():
+            channels = [pygame.mixer.Channel(i) for i in range(first, first + count)]
+            self.groups[name] = ChannelGroup(channels)
+            first += count
+
+        self.sounds: dict[str, SoundSlot] = {}
+        self.music_loaded = False
+        self.order = 0
+
+        # Contadores (ver bench/bench_audio.py)
+        self.played = 0
+        self.retriggered = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    # ========= Carregamento ========= #
+
+    @classmethod
+    def decode(cls, path: str) -> pygame.mixer.Sound | None:
+        """Decodifica para o formato do mixer e corta o silêncio das pontas."""
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (pygame.error, FileNotFoundError):
+            return None
+
+        samples = pygame.sndarray.array(sound)
+        if samples.dtype.kind == "u":
+            # Formatos sem sinal têm o zero no meio da escala
+            level = samples.astype(np.int32) - (np.iinfo(samples.dtype).max + 1) // 2
+        else:
+            level = samples.astype(np.int32)
+        level = np.abs(level)
+        if level.ndim > 1:
+            level = level.max(axis=1)
+        loud = np.flatnonzero(level >= cls.TRIM_LEVEL * np.iinfo(samples.dtype).max)
+        if loud.size == 0:
+            return sound
+        start, end = loud[0], loud[-1] + 1
+        if start == 0 and end == len(samples):
+            return sound
+
+        trimmed = samples[start:end].copy()
+        frequency = pygame.mixer.get_init()[0]
+        fade = min(len(trimmed), frequency * cls.FADE_MS // 1000)
+        if fade and samples.dtype.kind == "i":
+            ramp = np.linspace(1.0, 0.0, fade)
+            if trimmed.ndim > 1:
+                ramp = ramp[:, None]
+            trimmed[-fade:] = (trimmed[-fade:] * ramp).astype(samples.dtype)
+        return pygame.sndarray.make_sound(trimmed)
+
+    def add(
+        self,
+        name: str,
+        sound: pygame.mixer.Sound | None,
+        group: str = "sfx",
+        voices: int = 4,
+        per_frame: int = 1,
+    ) -> None:
+        """Registra um som decodificado (``None`` = arquivo ausente, fica mudo)."""
+        if sound is not None:
+            self.sounds[name] = SoundSlot(sound, group, voices, per_frame)
+
+    @staticmethod
+    def open_music(path: str) -> bool:
+        try:
+            pygame.mixer.music.load(path)
+            return True
+        except (pygame.error, FileNotFoundError):
+            return False
+
+    # ========= Reprodução ========= #
+
+    def begin_frame(self) -> None:
+        for slot in self.sounds.values():
+            slot.triggered = 0
+
+    def play(self, name: str) -> bool:
+        """Toca ``name`` se couber nos limites; retorna se tocou."""
+        slot = self.sounds.get(name)
+        if slot is None:
+            return False
+        if slot.triggered >= slot.per_frame:
+            self.dropped += 1
+            return False
+        slot.triggered += 1
+
+        # Vozes ainda tocando este som (o canal pode ter sido reusado)
+        sound = slot.sound
+        voices = [c for c in slot.channels if c.get_busy() and c.get_sound() is sound]
+        group = self.groups[slot.group]
+        self.order += 1
+        if len(voices) >= slot.max_voices:
+            channel = voices.pop(0)
+            group.restart(channel, self.order)
+            self.retriggered += 1
+        else:
+            channel, stolen = group.acquire(self.order)
+            self.stolen += stolen
+        channel.play(sound)
+        voices.append(channel)
+        slot.channels = voices
+        self.played += 1
+        return True
+
+    def busy(self) -> int:
+        """Vozes tocando agora, em todos os grupos."""
+        return sum(group.busy() for group in self.groups.values())
+
+    def memory_bytes(self) -> int:
+        """Tamanho dos buffers decodificados."""
+        return sum(len(slot.sound.get_raw()) for slot in self.sounds.values())
+
+    # ========= Música ========= #
+
+    def play_music(self, loops: int = -1) -> None:
+        if self.music_loaded:
+            pygame.mixer.music.set_volume(MUSIC_VOLUME)
+            pygame.mixer.music.play(loops)
+
+    def stop_music(self) -> None:
+        if self.music_loaded:
+            pygame.mixer.music.stop()
+
+    def pause(self) -> None:
+        pygame.mixer.pause()
+        if self.music_loaded:
+            pygame.mixer.music.pause()
+
+    def resume(self) -> None:
+        pygame.mixer.unpause()
+        if self.music_loaded:
+            pygame.mixer.music.unpause()
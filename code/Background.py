@@ -1,22 +1,77 @@
 """
-Fundo do jogo: apenas delega para o gerenciador de parallax.
+Fundo do jogo: pilhas de parallax por level, montadas a partir de ``BACKGROUNDS``.
 """
 
 from __future__ import annotations
 
+from typing import Callable
+
 import pygame
 
-from .Parallax import ParallaxManager
+from .Const import SCREEN_HEIGHT
+from .Parallax import ParallaxLayer, ParallaxManager
 
 
 class Background:
-    """Wrapper simples para o parallax (facilita extensão futura)."""
+    """
+    Um ``ParallaxManager`` por level que troca de fundo; ``set_level``
+    escolhe a pilha do maior level configurado até o atual.
+
+    Todas as pilhas são montadas (convertidas, compostas e fatiadas) na
+    carga, então trocar de fundo no level up não custa nada no quadro.
+    """
+
+    def __init__(self, stacks: dict[int, ParallaxManager]) -> None:
+        self.stacks = stacks
+        self.levels = sorted(stacks)
+        self.parallax = stacks[self.levels[0]]
+
+    @staticmethod
+    def layer_key(spec: dict) -> str:
+        """Nome do asset de uma camada (mesma arte + ajuste = mesmo asset)."""
+        height = spec.get("height", SCREEN_HEIGHT)
+        return f"layer:{spec['image']}:{spec.get('darken', 0)}:{height}"
+
+    @staticmethod
+    def layer_scale(spec: dict) -> Callable[[tuple[int, int]], tuple[int, int]]:
+        height = spec.get("height", SCREEN_HEIGHT)
+        return lambda size: ParallaxLayer.layer_size(size, height)
+
+    @classmethod
+    def from_specs(
+        cls,
+        backgrounds: dict[int, tuple[dict, ...]],
+        images: dict[str, pygame.Surface],
+        scale: float = 1.0,
+    ) -> Background:
+        """
+        Monta as pilhas de ``backgrounds`` com as artes já carregadas (por
+        ``layer_key``), desenhadas na escala ``scale`` (ver ``RenderTarget``).
+        """
+        stacks = {}
+        for level, specs in backgrounds.items():
+            layers = [
+                ParallaxLayer(
+                    images[cls.layer_key(spec)],
+                    spec["speed"],
+                    y=spec.get("y", 0),
+                    opaque=not spec.get("alpha", False),
+                    scale=scale,
+                )
+                for spec in specs
+            ]
+            stacks[level] = ParallaxManager(layers)
+        return cls(stacks)
 
-    def __init__(self, base_image: pygame.Surface) -> None:
-        self.parallax = ParallaxManager(base_image)
+    def set_level(self, level: int) -> None:
+        current = self.levels[0]
+        for configured in self.levels:
+            if configured <= level:
+                current = configured
+        self.parallax = self.stacks[current]
 
-    def update(self) -> None:
-        self.parallax.update()
+    def update(self, dt: float) -> None:
+        self.parallax.update(dt)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        self.parallax.draw(screen)
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        self.parallax.draw(screen, alpha)
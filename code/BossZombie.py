@@ -1,61 +1,109 @@
 import pygame
-import random
-from .Const import SCREEN_WIDTH, SCREEN_HEIGHT
+from .Const import SCREEN_WIDTH, SCREEN_HEIGHT, LAYER_BOSS
+from .Animation import AnimationSet
+from .Entity import Entity
+from .Scheduler import Scheduler
 
-class BossZombie(pygame.sprite.Sprite):
+class BossZombie(Entity):
     """Chefão do level 5 (zumbi fortão)."""
 
-    def __init__(self, image_surface: pygame.Surface, life: int = 20):
-        super().__init__()
+    __slots__ = (
+        "base_image", "max_life", "life", "speed_x", "speed_y", "entering",
+        "timers", "attack_timer", "attack_interval", "attack_ready",
+        "animation", "hit_animation", "anim_time", "hit_timer",
+    )
+
+    layer = LAYER_BOSS
+
+    # cor somada aos quadros quando leva tiro, e por quanto tempo (ms)
+    HIT_TINT = (120, 120, 120)
+    HIT_FLASH_MS = 90
+
+    def __init__(
+        self,
+        image_surface: pygame.Surface,
+        life: int = 20,
+        animation: AnimationSet | None = None,
+        hit_animation: AnimationSet | None = None,
+        attack_interval: float = 1500,
+        timers: Scheduler | None = None,
+    ):
+        super().__init__(image_surface)
         self.base_image = image_surface
-        self.image = self.base_image
-        self.rect = self.image.get_rect()
+
+        # animação; a versão clareada do dano (``HIT_TINT``) vem assada de
+        # fora, uma vez para todos os chefes (sem ela, o dano não pisca)
+        self.animation = animation
+        self.hit_animation = hit_animation or animation
+        self.anim_time = 0.0
+        self.hit_timer = 0.0
 
         # vida do chefe (muitos tiros)
         self.max_life = life
         self.life = life
 
         # posição inicial (fora da tela)
-        self.rect.x = SCREEN_WIDTH + 100
-        self.rect.y = SCREEN_HEIGHT // 2
+        self.place(SCREEN_WIDTH + 100, SCREEN_HEIGHT // 2)
 
-        # movimento horizontal inicial
-        self.speed_x = 2.0
+        # movimento horizontal inicial (px/s)
+        self.speed_x = 120.0
 
-        # movimento vertical
-        self.speed_y = 2.5
+        # movimento vertical (px/s)
+        self.speed_y = 150.0
 
         # estado: entrando → parado direita → atirando
         self.entering = True
 
-        # timer de ataque
-        self.attack_timer = 0
-        self.attack_interval = 1500  # 1.5s por ataque
+        # timer de ataque: agendado no ``timers`` do World ao terminar de
+        # entrar (sem agenda, o chefe não ataca)
+        self.timers = timers
+        self.attack_timer = None
+        self.attack_interval = attack_interval  # ms por ataque
+
+        # sinaliza para o World criar um cérebro
+        self.attack_ready = False
+
+    def update(self, dt):
+        self.save_previous()
+        self.animate(dt)
 
-    def update(self):
         # Fase 1: boss entra na tela
         if self.entering:
-            self.rect.x -= self.speed_x
+            self.x -= self.speed_x * dt / 1000
+            self.sync_rect()
             if self.rect.right <= SCREEN_WIDTH - 120:
                 self.entering = False
             return
 
         # Fase 2: movimento vertical contínuo
-        self.rect.y += self.speed_y
+        self.y += self.speed_y * dt / 1000
+        self.sync_rect()
         if self.rect.top <= 10 or self.rect.bottom >= SCREEN_HEIGHT - 10:
             self.speed_y *= -1
 
-        # Fase 3: ataque
-        self.attack_timer += 16
-        if self.attack_timer >= self.attack_interval:
-            self.attack_timer = 0
-            return "ATTACK"  # sinaliza para o Game criar um cérebro
+        # Fase 3: ataque (o primeiro sai um intervalo depois de parar)
+        if self.attack_timer is None and self.timers is not None:
+            self.attack_timer = self.timers.every(self.attack_interval, self.attack)
+
+    def attack(self):
+        self.attack_ready = True
 
-        return None
+    def kill(self):
+        if self.attack_timer is not None:
+            self.attack_timer.cancel()
+            self.attack_timer = None
+        super().kill()
+
+    def animate(self, dt):
+        self.anim_time += dt
+        self.hit_timer = max(0.0, self.hit_timer - dt)
+        if self.animation is not None:
+            animation = self.hit_animation if self.hit_timer > 0 else self.animation
+            self.image = animation.frame("walk", self.anim_time)
 
     def take_damage(self, amount=1):
+        self.hit_timer = self.HIT_FLASH_MS
         self.life -= amount
         if self.life <= 0:
             return True  # morreu
         return False
-
@@ -1,15 +1,27 @@
-import pygame
+from .Const import LAYER_PROJECTILES
+from .Entity import Entity
 
-class Brain(pygame.sprite.Sprite):
+
+class Brain(Entity):
     """Projétil lançado pelo chefão."""
 
-    def __init__(self, image_surface, x, y, speed=6):
-        super().__init__()
-        self.image = image_surface
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
+    __slots__ = ("speed",)
+
+    layer = LAYER_PROJECTILES
+
+    def __init__(self, image_surface, x, y, speed=360.0):
+        super().__init__(image_surface)
+        self.speed = speed  # px/s
+        self.launch(x, y)
+
+    def launch(self, x, y):
+        """(Re)posiciona o cérebro na boca do chefe."""
+        self.rect.center = (x, y)
+        self.place(self.rect.x, self.rect.y)
 
-    def update(self):
-        self.rect.x -= self.speed
+    def update(self, dt):
+        self.save_previous()
+        self.x -= self.speed * dt / 1000
+        self.sync_rect()
         if self.rect.right < 0:
             self.kill()
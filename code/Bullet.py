@@ -6,23 +6,35 @@ from __future__ import annotations
 
 import pygame
 
+from .Const import SCREEN_WIDTH, LAYER_PROJECTILES
+from .Entity import Entity
 
-class Bullet(pygame.sprite.Sprite):
+
+class Bullet(Entity):
     """Projétil que se move para a direita."""
 
+    __slots__ = ("speed",)
+
+    layer = LAYER_PROJECTILES
+
     def __init__(
         self,
         image_surface: pygame.Surface,
         position: tuple[int, int],
-        speed: int = 12,
+        speed: float = 720.0,
     ) -> None:
-        super().__init__()
-        self.image = image_surface
-        self.rect = self.image.get_rect()
+        super().__init__(image_surface)
+        self.speed = speed  # px/s
+        self.launch(position)
+
+    def launch(self, position: tuple[int, int]) -> None:
+        """(Re)posiciona o projétil no ponto de disparo."""
         self.rect.center = position
-        self.speed = speed
+        self.place(self.rect.x, self.rect.y)
 
-    def update(self) -> None:
-        self.rect.x += self.speed
-        if self.rect.left > pygame.display.get_surface().get_width():
+    def update(self, dt: float) -> None:
+        self.save_previous()
+        self.x += self.speed * dt / 1000
+        self.sync_rect()
+        if self.rect.left > SCREEN_WIDTH:
             self.kill()
@@ -0,0 +1,81 @@
+"""
+Teste fino de colisão por máscara de pixels, depois do filtro por retângulo.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+
+class MaskCache:
+    """
+    Máscaras de colisão calculadas uma vez por imagem de origem.
+
+    A chave é a própria ``Surface``: todos os zumbis da horda, todos os
+    tiros do pool etc. compartilham a mesma imagem e, portanto, a mesma
+    máscara. Imagem totalmente transparente (placeholder, ``World.headless``
+    sem arte) vira máscara cheia, ou seja, volta ao teste por retângulo.
+    """
+
+    def __init__(self, threshold: int = 127) -> None:
+        """
+        Args:
+            threshold: alfa mínimo para o pixel contar como sólido.
+        """
+        self.threshold = threshold
+        self.masks: dict[pygame.Surface, pygame.mask.Mask] = {}
+
+    def get(self, image: pygame.Surface) -> pygame.mask.Mask:
+        mask = self.masks.get(image)
+        if mask is None:
+            mask = pygame.mask.from_surface(image, self.threshold)
+            if mask.count() == 0:
+                mask = pygame.mask.Mask(image.get_size(), fill=True)
+            self.masks[image] = mask
+        return mask
+
+    def clear(self) -> None:
+        self.masks.clear()
+
+
+def sprites_overlap(
+    mask_a: pygame.mask.Mask,
+    rect_a: pygame.Rect,
+    mask_b: pygame.mask.Mask,
+    rect_b: pygame.Rect,
+) -> bool:
+    """Se as máscaras se tocam (os retângulos já devem se cruzar)."""
+    offset = (rect_b.x - rect_a.x, rect_b.y - rect_a.y)
+    return mask_a.overlap(mask_b, offset) is not None
+
+
+def refine_hits(
+    mask: pygame.mask.Mask,
+    lefts: np.ndarray,
+    tops: np.ndarray,
+    candidates: np.ndarray,
+    other_mask: pygame.mask.Mask,
+    other_rect: pygame.Rect,
+) -> np.ndarray:
+    """
+    Filtra ``candidates`` (índices que já passaram no teste de retângulo)
+    mantendo só os que tocam ``other_mask`` em ``other_rect``.
+
+    Args:
+        mask: máscara compartilhada pelos candidatos.
+        lefts, tops: canto superior esquerdo de cada candidato (inteiros).
+    """
+    if candidates.size == 0:
+        return candidates
+    x = other_rect.x
+    y = other_rect.y
+    overlap = mask.overlap
+    keep = [
+        overlap(other_mask, (x - left, y - top)) is not None
+        for left, top in zip(
+            lefts[candidates].astype(int).tolist(),
+            tops[candidates].astype(int).tolist(),
+        )
+    ]
+    return candidates[np.array(keep, dtype=bool)]
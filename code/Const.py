@@ -6,9 +6,14 @@ Constantes e configurações globais do jogo.
 SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 540
 
-# FPS
+# FPS (limite de renderização; 0 = sem limite)
 FPS = 60
 
+# Simulação em passo fixo, independente do FPS de renderização
+TICK_RATE = 60
+TICK_MS = 1000 / TICK_RATE
+MAX_SUBSTEPS = 5  # ticks máximos por quadro para recuperar travadas
+
 # Título da janela
 WINDOW_TITLE = "Zombie Runner - Trabalho Pratico"
 
@@ -26,6 +31,7 @@ STATE_PLAYING = "playing"
 STATE_GAME_OVER = "game_over"
 STATE_GAME_WIN = "game_win"
 STATE_PAUSED = "paused"
+STATE_LOADING = "loading"
 
 # Caminhos de assets
 ASSET_DIR = "asset"
@@ -36,12 +42,131 @@ BULLET_IMG = f"{ASSET_DIR}/bullet.png"
 BACKGROUND_IMG = f"{ASSET_DIR}/game_background.png"
 MENU_BACKGROUND_IMG = f"{ASSET_DIR}/menu_background.png"
 HEART_IMG = f"{ASSET_DIR}/heart.png"
+BOSS_IMG = f"{ASSET_DIR}/boss.png"
+BRAIN_IMG = f"{ASSET_DIR}/brain.png"
+
+# Tamanhos das sprites (largura, altura)
+PLAYER_SIZE = (72, 72)
+ZOMBIE_SIZE = (72, 72)
+BULLET_SIZE = (28, 12)
+HEART_SIZE = (24, 24)
+BOSS_SIZE = (150, 150)
+BRAIN_SIZE = (32, 32)
+
+# Camadas de desenho (maior fica por cima)
+LAYER_ZOMBIES = 1
+LAYER_BOSS = 2
+LAYER_PLAYER = 3
+LAYER_PROJECTILES = 4
+LAYER_PARTICLES = 5
+LAYER_HUD = 10
+
+# Resolução interna do desenho (a lógica segue em SCREEN_WIDTH x
+# SCREEN_HEIGHT, mesma proporção) e quantas vezes a janela a amplia, por
+# vizinho mais próximo ou scale2x; ver RenderTarget
+RENDER_SIZE = (SCREEN_WIDTH, SCREEN_HEIGHT)
+WINDOW_SCALE = 1
+UPSCALE_INTEGER = "integer"
+UPSCALE_SCALE2X = "scale2x"
+
+# Cache de sprites pré-processados (gerado na primeira execução)
+CACHE_DIR = ".cache"
+ASSET_CACHE_FILE = f"{CACHE_DIR}/sprites.bin"
+
+# Trace do profiler salvo com F4 (sem --profile-out)
+PROFILE_FILE = f"{CACHE_DIR}/profile.csv"
 
 FONT_FILE = f"{ASSET_DIR}/ZOMBIE.ttf"
-SHOOT_SOUND_FILE = f"{ASSET_DIR}/shoot.wav"
-HIT_SOUND_FILE = f"{ASSET_DIR}/hit.wav"
-MUSIC_FILE = f"{ASSET_DIR}/music.wav"
+SHOOT_SOUND_FILE = f"{ASSET_DIR}/mixkit-game-gun-shot-1662.mp3"
+HIT_SOUND_FILE = f"{ASSET_DIR}/mixkit-impact-of-a-strong-punch-2155.mp3"
+MUSIC_FILE = f"{ASSET_DIR}/music.ogg"  # Vorbis, lido em stream
 
 # Configuração de jogo
 INITIAL_LIVES = 3
 POINTS_PER_ZOMBIE = 10
+INITIAL_ZOMBIES = 8
+BOSS_LEVEL = 5
+BOSS_LIFE = 20
+
+# Balanceamento da partida; World(balance=...) sobrescreve por chave
+# (ver bench/sweep.py)
+BALANCE = {
+    "difficulty_interval": 20000,  # ms entre level ups
+    "initial_lives": INITIAL_LIVES,
+    "points_per_zombie": POINTS_PER_ZOMBIE,
+    "boss_life": BOSS_LIFE,
+    "boss_attack_interval": 1500,  # ms entre cérebros
+    "zombie_min_speed": 120.0,  # px/s
+    "zombie_max_speed": 300.0,
+}
+
+# Ondas de cada level: zumbis novos, aumento de velocidade (px/s) e chefe.
+# Levels além da tabela repetem a regra padrão (level zumbis, +18 px/s).
+WAVES = {
+    2: {"zombies": 2, "speed_up": 18.0},
+    3: {"zombies": 3, "speed_up": 18.0},
+    4: {"zombies": 4, "speed_up": 18.0},
+    BOSS_LEVEL: {"zombies": 5, "speed_up": 18.0, "boss": True},
+}
+
+# Fundo: pilha de camadas de parallax (de trás para frente) por level; um
+# level sem entrada mantém a do level anterior. Cada camada: arquivo,
+# velocidade (px/s) e, opcionais, escurecimento (BLEND_RGB_SUB), faixa
+# vertical (y, altura) e se tem transparência.
+BACKGROUNDS = {
+    1: (
+        {"image": BACKGROUND_IMG, "speed": 30.0, "darken": 40},  # fundo distante
+        {"image": BACKGROUND_IMG, "speed": 90.0},  # frente
+    ),
+}
+
+# Máximo de partículas vivas (buffer circular; sob carga, emissões encolhem)
+PARTICLE_BUDGET = 2048
+
+# Entidades criadas por tick; o resto fica na fila para os próximos ticks
+SPAWN_BUDGET = 8
+
+# Perseguição da horda: peso do campo de fluxo (0 = só para a esquerda,
+# 1 = direto ao jogador) e da separação entre vizinhos
+ZOMBIE_CHASE = 0.4
+ZOMBIE_SEPARATION = 0.6
+ZOMBIE_ATTACK_RANGE = 140  # px até o jogador para animar o ataque
+FLOW_CELL = 40
+FLOW_REFRESH_TICKS = 4
+
+# Modo com simulação em outro processo (SimWorker): capacidade de cada
+# snapshot em memória compartilhada (zumbis além disso não são desenhados)
+SNAPSHOT_ZOMBIES = 16384
+SNAPSHOT_ENTITIES = 512
+SNAPSHOT_EVENTS = 256
+SNAPSHOT_IMPACTS = 256
+
+# Colisões: só retângulo ou retângulo + máscara de pixels, por par
+COLLIDE_RECT = "rect"
+COLLIDE_MASK = "mask"
+COLLISION_MODES = {
+    "bullet_zombie": COLLIDE_MASK,
+    "bullet_boss": COLLIDE_MASK,
+    "player_zombie": COLLIDE_MASK,
+    "player_brain": COLLIDE_MASK,
+}
+
+# Eventos emitidos pela simulação (sons, efeitos)
+EVENT_SHOOT = "shoot"
+EVENT_HIT = "hit"
+EVENT_LEVEL_UP = "level_up"
+
+# Áudio (ver Audio): formato do mixer, canais reservados por grupo (a
+# música toca no stream do ``mixer.music``, fora deles) e, por som, o
+# grupo, o máximo de vozes simultâneas e de disparos por quadro. Os sons
+# têm o nome do evento que os toca.
+AUDIO_FREQUENCY = 44100
+AUDIO_SIZE = -16
+AUDIO_CHANNELS = 2
+AUDIO_BUFFER = 512  # amostras (~12 ms de latência)
+AUDIO_GROUPS = {"sfx": 10}
+MUSIC_VOLUME = 0.4
+SOUNDS = {
+    EVENT_SHOOT: {"file": SHOOT_SOUND_FILE, "group": "sfx", "voices": 3, "per_frame": 1},
+    EVENT_HIT: {"file": HIT_SOUND_FILE, "group": "sfx", "voices": 4, "per_frame": 2},
+}
@@ -0,0 +1,125 @@
+"""
+Renderização por retângulos sujos para as telas estáticas.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable, Iterable
+
+import pygame
+
+from .RenderTarget import RenderTarget
+
+# (nome, chave, cria): ``cria()`` devolve (superfície, canto superior
+# esquerdo) e só é chamado quando a chave muda
+Overlay = tuple[str, Hashable, Callable[[], tuple[pygame.Surface, tuple[int, int]]]]
+
+
+class DirtyRenderer:
+    """
+    Envia ao display só as regiões que mudaram (``display.update(rects)``).
+
+    Menu, game over, vitória e pause não mudam entre quadros: cada tela é
+    composta uma vez numa superfície, guardada pela chave que a identifica
+    (ex.: ``("game_over", pontos)``) e exibida por um ``DirtySprite`` num
+    ``LayeredDirty``. Enquanto a chave não muda, o sprite não fica sujo e
+    o quadro não desenha nem envia nada ao display.
+
+    O que muda dentro de uma tela parada (barra de progresso, painel do
+    profiler) fica em sprites próprios por cima dela (``overlays``): uma
+    mudança envia só o retângulo daquele sprite, e um overlay que some
+    repinta só a área que ocupava. Durante a partida o parallax rola a
+    tela toda, então ``present_full`` envia a janela inteira.
+    """
+
+    OVERLAY_LAYER = 1
+
+    def __init__(self, render: RenderTarget) -> None:
+        self.render = render
+        self.screen = screen = render.surface
+
+        self.sprite = pygame.sprite.DirtySprite()
+        self.sprite.image = pygame.Surface(screen.get_size())
+        self.sprite.rect = screen.get_rect()
+        self.sprite.dirty = 0
+
+        # Já começa e nunca cai no modo "tela inteira" (por timing): nele, o
+        # primeiro draw não limpa os sprites sujos e o quadro seguinte
+        # enviaria a tela toda de novo
+        self.group = pygame.sprite.LayeredDirty(self.sprite, _use_update=True)
+        self.group.set_timing_threshold(float("inf"))
+
+        # Uma superfície por tela: nome -> (chave, superfície)
+        self.cache: dict[str, tuple[Hashable, pygame.Surface]] = {}
+        self.current: Hashable = None
+
+        # Sprites por cima da tela: nome -> sprite, nome -> chave
+        self.overlays: dict[str, pygame.sprite.DirtySprite] = {}
+        self.overlay_keys: dict[str, Hashable] = {}
+
+        # Retângulos enviados no último quadro (para diagnóstico)
+        self.last_rects: list[pygame.Rect] = []
+
+    def present_static(
+        self,
+        key: tuple,
+        compose: Callable[[pygame.Surface], None],
+        overlays: Iterable[Overlay] = (),
+    ) -> list[pygame.Rect]:
+        """
+        Mostra a tela estática ``key``, compondo-a só na primeira vez.
+
+        Args:
+            key: identifica o conteúdo; ``key[0]`` é o nome da tela.
+            compose: desenha a tela na superfície recebida.
+            overlays: sprites deste quadro por cima da tela (ver
+                ``Overlay``); os que não vierem são escondidos.
+        """
+        if key != self.current:
+            name = key[0]
+            cached = self.cache.get(name)
+            if cached is None or cached[0] != key:
+                surface = pygame.Surface(self.screen.get_size()).convert()
+                compose(surface)
+                self.cache[name] = (key, surface)
+            self.sprite.image = self.cache[name][1]
+            self.sprite.dirty = 1
+            self.current = key
+
+        self.update_overlays(overlays)
+
+        rects = self.group.draw(self.screen)
+        if rects:
+            self.render.present(rects)
+        self.last_rects = rects
+        return rects
+
+    def update_overlays(self, overlays: Iterable[Overlay]) -> None:
+        shown = set()
+        for name, key, create in overlays:
+            shown.add(name)
+            sprite = self.overlays.get(name)
+            if sprite is None:
+                sprite = self.overlays[name] = pygame.sprite.DirtySprite()
+                sprite.visible = 0
+                self.group.add(sprite, layer=self.OVERLAY_LAYER)
+                self.overlay_keys[name] = None
+            if sprite.visible and self.overlay_keys[name] == key:
+                continue
+            image, topleft = create()
+            sprite.image = image
+            sprite.rect = image.get_rect(topleft=topleft)
+            sprite.visible = 1
+            sprite.dirty = 1
+            self.overlay_keys[name] = key
+
+        for name, sprite in self.overlays.items():
+            if name not in shown and sprite.visible:
+                sprite.visible = 0
+                sprite.dirty = 1
+
+    def present_full(self) -> None:
+        """Quadro de jogo: a tela toda mudou (parallax), envia tudo."""
+        self.current = None
+        self.last_rects = [self.screen.get_rect()]
+        self.render.flip()
@@ -0,0 +1,75 @@
+"""
+Base das entidades simuladas com passo de tempo fixo.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+
+class Entity:
+    """
+    Entidade com posição em float e posição do tick anterior.
+
+    A simulação altera ``x``/``y`` (sem truncar para int) e o ``rect`` é só
+    o reflexo arredondado usado nas colisões. O desenho interpola entre a
+    posição anterior e a atual, desacoplando a taxa de quadros da lógica.
+
+    Não herda de ``pygame.sprite.Sprite``: com ``__slots__`` não há
+    ``__dict__`` por instância nem os dicionários de grupos; quem guarda as
+    entidades vivas é o ``Registry``. Para o desenho, expõe o mesmo que
+    uma sprite (``image``, ``rect``) mais ``draw_pos`` e ``layer``.
+    """
+
+    __slots__ = ("image", "rect", "x", "y", "prev_x", "prev_y", "pool", "pooled", "registry")
+
+    # Camada de desenho (ver SpriteBatch); subclasses sobrescrevem
+    layer = 0
+
+    def __init__(self, image_surface: pygame.Surface) -> None:
+        self.image = image_surface
+        self.rect = self.image.get_rect()
+
+        self.x = 0.0
+        self.y = 0.0
+        self.prev_x = 0.0
+        self.prev_y = 0.0
+
+        # Pool de origem (ver Pool); None = instância avulsa
+        self.pool = None
+        self.pooled = False
+
+        # Registro onde está viva (ver Registry); None = fora do jogo
+        self.registry = None
+
+    def kill(self) -> None:
+        """Sai do registro e, se vier de um pool, volta para ele."""
+        if self.pool is not None:
+            self.pool.release(self)
+        elif self.registry is not None:
+            self.registry.remove(self)
+
+    def alive(self) -> bool:
+        return self.registry is not None
+
+    def place(self, x: float, y: float) -> None:
+        """Teleporta (sem interpolar a partir da posição antiga)."""
+        self.x = self.prev_x = float(x)
+        self.y = self.prev_y = float(y)
+        self.sync_rect()
+
+    def save_previous(self) -> None:
+        """Guarda a posição atual antes de mover no tick."""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def sync_rect(self) -> None:
+        self.rect.x = round(self.x)
+        self.rect.y = round(self.y)
+
+    def draw_pos(self, alpha: float) -> tuple[int, int]:
+        """Posição de desenho entre o tick anterior (0.0) e o atual (1.0)."""
+        return (
+            round(self.prev_x + (self.x - self.prev_x) * alpha),
+            round(self.prev_y + (self.y - self.prev_y) * alpha),
+        )
@@ -5,18 +5,15 @@ Lógica principal do jogo: loop, estados, colisões.
 from __future__ import annotations
 
 import sys
-import random
 
 import pygame
 
-# Imports do boss e do projétil do boss
-from .BossZombie import BossZombie
-from .Brain import Brain
-
 from .Const import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FPS,
+    TICK_MS,
+    MAX_SUBSTEPS,
     WINDOW_TITLE,
     WHITE,
     GREEN,
@@ -29,115 +26,406 @@ from .Const import (
     BULLET_IMG,
     BACKGROUND_IMG,
     MENU_BACKGROUND_IMG,
+    BACKGROUNDS,
+    RENDER_SIZE,
+    WINDOW_SCALE,
+    UPSCALE_INTEGER,
     FONT_FILE,
-    SHOOT_SOUND_FILE,
-    HIT_SOUND_FILE,
     MUSIC_FILE,
-    POINTS_PER_ZOMBIE,
+    SOUNDS,
+    AUDIO_FREQUENCY,
+    AUDIO_SIZE,
+    AUDIO_CHANNELS,
+    AUDIO_BUFFER,
     HEART_IMG,
-    ASSET_DIR,
-    STATE_PAUSED
+    BOSS_IMG,
+    BRAIN_IMG,
+    PLAYER_SIZE,
+    ZOMBIE_SIZE,
+    BULLET_SIZE,
+    HEART_SIZE,
+    BOSS_SIZE,
+    BRAIN_SIZE,
+    STATE_PAUSED,
+    STATE_LOADING,
+    BOSS_LEVEL,
+    EVENT_LEVEL_UP,
+    PROFILE_FILE,
+    LAYER_HUD,
+    LAYER_PARTICLES,
 )
 
+from .Animation import AnimationSet
+from .AssetCache import AssetCache, SizeSpec
+from .AssetLoader import AssetLoader
+from .Audio import Audio
 from .Background import Background
+from .BossZombie import BossZombie
+from .DirtyRenderer import DirtyRenderer
+from .InputState import InputState
 from .Menu import Menu
-from .Player import Player
-from .Zombie import Zombie
-from .Score import Score
+from .Particles import ParticleSystem
+from .Profiler import Profiler
+from .RenderTarget import RenderTarget
+from .Replay import InputRecorder, ReplayPlayer
+from .Scheduler import Scheduler, Timer
+from .SimWorker import RemoteWorld
+from .SpriteBatch import SpriteBatch, TextureAtlas
+from .TextCache import TextCache, DigitAtlas
+from .World import World
 
 
 class Game:
     """Classe principal do jogo Zombie Runner."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        use_asset_cache: bool = True,
+        dirty_rects: bool = False,
+        batched_draw: bool = True,
+        profile_out: str | None = None,
+        seed: int | None = None,
+        record_path: str | None = None,
+        replay_path: str | None = None,
+        pipelined: bool = False,
+        render_size: tuple[int, int] = RENDER_SIZE,
+        window_scale: int = WINDOW_SCALE,
+        upscale: str = UPSCALE_INTEGER,
+    ) -> None:
+        """
+        Args:
+            use_asset_cache: carrega sprites já escalados de ``ASSET_CACHE_FILE``
+                (gerado na primeira execução) em vez de decodificar os PNGs.
+            dirty_rects: telas estáticas compostas uma vez e enviadas ao
+                display só quando mudam (ver ``DirtyRenderer``).
+            batched_draw: sprites do jogo num atlas, desenhados com um único
+                ``blits`` por quadro (ver ``SpriteBatch``).
+            profile_out: arquivo ``.csv``/``.json`` onde o trace do profiler
+                é salvo ao sair (F3 mostra o overlay, F4 salva na hora).
+            seed: semente fixa das partidas (None = uma nova por partida).
+            record_path: grava a entrada de cada partida neste arquivo.
+            replay_path: reproduz a partida gravada em vez do teclado.
+            pipelined: simulação num processo à parte, um tick à frente do
+                desenho (ver ``RemoteWorld``).
+            render_size: resolução interna do desenho (a lógica continua
+                em ``SCREEN_WIDTH`` x ``SCREEN_HEIGHT``).
+            window_scale: quantas vezes a janela amplia a resolução interna.
+            upscale: ``UPSCALE_INTEGER`` ou ``UPSCALE_SCALE2X`` (ver
+                ``RenderTarget``).
+        """
+        # Formato fixo do mixer: os sons são decodificados direto nele
+        pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SIZE, AUDIO_CHANNELS, AUDIO_BUFFER)
         pygame.init()
         pygame.mixer.init()
+        self.audio = Audio()
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Tudo é desenhado em ``screen``, na resolução interna; a janela
+        # recebe o quadro ampliado
+        self.render = RenderTarget(render_size, window_scale, upscale)
+        self.screen = self.render.surface
         pygame.display.set_caption(WINDOW_TITLE)
         self.clock = pygame.time.Clock()
 
-        # ----- Carrega assets -----
-        background_image = self.load_image(BACKGROUND_IMG)
-        self.background = Background(background_image)
+        self.renderer = DirtyRenderer(self.render) if dirty_rects else None
+
+        # Profiler por quadro (overlay com F3, exportação com F4)
+        self.profiler = Profiler()
+        self.profile_out = profile_out
+        self.debug_font = pygame.font.Font(None, 18)
+
+        # Sobreposição escura do pause (criada uma vez)
+        self.pause_overlay = pygame.Surface(self.render.size)
+        self.pause_overlay.set_alpha(150)
+        self.pause_overlay.fill((0, 0, 0))
+
+        self.assets: AssetCache | None = None
+        if use_asset_cache:
+            self.assets = AssetCache()
+            self.assets.load()
+
+        # ----- Assets em segundo plano -----
+        # Menu primeiro (a tela inicial aparece assim que ele fica pronto),
+        # depois a partida; o chefe só é buscado perto do BOSS_LEVEL.
+        self.loader = AssetLoader()
+        # Fora da resolução lógica, sempre em lote: o atlas guarda a arte
+        # já na escala do desenho
+        self.batched_draw = batched_draw or self.render.scale != 1
+        self.pipelined = pipelined
+        self.queue_menu_assets()
+        self.queue_game_assets()
+
+        self.menu: Menu | None = None
+        self.world: World | RemoteWorld | None = None
+        self.batch: SpriteBatch | None = None
+        self.boss_assets_ready = False
+
+        # Estado do jogo (STATE_LOADING até o menu ficar pronto)
+        self.state = STATE_LOADING
+        self.state_after_loading = STATE_MENU
+        self.seed = seed
+
+        # Tiro pedido via KEYDOWN, consumido no próximo tick
+        self.shoot_requested = False
+
+        # Gravação / reprodução da entrada (ver Replay)
+        self.record_path = record_path
+        self.replay_path = replay_path
+        self.recorder: InputRecorder | None = None
+        self.replay: ReplayPlayer | None = None
+
+        # Sangue e estilhaços nos impactos (só visual)
+        self.particles = ParticleSystem()
+
+        # Temporizadores dos efeitos de tela (a simulação tem os seus, em
+        # ``world.timers``); pausam junto com o jogo
+        self.timers = Scheduler()
 
-        self.player_image = self.load_image(PLAYER_IMG, scale=(72, 72))
-        self.zombie_image = self.load_image(ZOMBIE_IMG, scale=(72, 72))
-        self.bullet_image = self.load_image(BULLET_IMG, scale=(28, 12))
-        self.heart_image = self.load_image(HEART_IMG, scale=(24, 24))
+        # ----- Animação de LEVEL UP -----
+        self.levelup_timer: Timer | None = None
+        self.LEVELUP_DURATION = 1200
+        self.LEVELUP_FLASH_TIME = 180
 
-        # Imagens do chefe e do cérebro
-        self.boss_image = self.load_image(f"{ASSET_DIR}/boss.png", scale=(150, 150))
-        self.brain_image = self.load_image(f"{ASSET_DIR}/brain.png", scale=(32, 32))
+    # ========= Carregamento ========= #
+
+    def queue_menu_assets(self) -> None:
+        screen_size = self.render.size
+        submit = self.loader.submit
+        submit("menu", "background", self.decode_image, MENU_BACKGROUND_IMG, screen_size)
+        submit("menu", "fallback", self.decode_image, BACKGROUND_IMG, screen_size)
+        submit("menu", "font_title", self.load_font, FONT_FILE, self.render.length(42))
+        submit("menu", "font_text", self.load_font, FONT_FILE, self.render.length(24))
+
+    def queue_game_assets(self) -> None:
+        submit = self.loader.submit
+        for specs in BACKGROUNDS.values():
+            for spec in specs:
+                submit(
+                    "game",
+                    Background.layer_key(spec),
+                    self.decode_image,
+                    spec["image"],
+                    Background.layer_scale(spec),
+                    spec.get("darken", 0),
+                )
+        submit("game", "player", self.decode_image, PLAYER_IMG, PLAYER_SIZE)
+        submit("game", "zombie", self.decode_image, ZOMBIE_IMG, ZOMBIE_SIZE)
+        submit("game", "bullet", self.decode_image, BULLET_IMG, BULLET_SIZE)
+        submit("game", "heart", self.decode_image, HEART_IMG, HEART_SIZE)
+        for name, spec in SOUNDS.items():
+            submit("game", f"sound.{name}", Audio.decode, spec["file"])
+        submit("game", "music", Audio.open_music, MUSIC_FILE)
+
+    def queue_boss_assets(self) -> None:
+        """Prefetch do chefe e do cérebro (só usados no BOSS_LEVEL)."""
+        self.loader.submit("boss", "boss", self.decode_image, BOSS_IMG, BOSS_SIZE)
+        self.loader.submit("boss", "brain", self.decode_image, BRAIN_IMG, BRAIN_SIZE)
+
+    def poll_assets(self) -> None:
+        """Instala os grupos que terminaram de carregar (uma vez cada)."""
+        loader = self.loader
+        if self.menu is None and loader.done("menu"):
+            self.install_menu_assets()
+        if self.world is None and loader.done("game"):
+            self.install_game_assets()
+        if not self.boss_assets_ready and self.world is not None and loader.done("boss"):
+            self.install_boss_assets()
+
+        if self.state == STATE_LOADING:
+            if self.state_after_loading == STATE_MENU and self.menu is not None:
+                self.state = STATE_MENU
+            elif self.state_after_loading == STATE_PLAYING and self.world is not None:
+                self.start_new_game()
 
-        # Menu
-        menu_background_image = self.load_image(
-            MENU_BACKGROUND_IMG,
-            fallback=background_image,
+    def finish_loading(self) -> None:
+        """Bloqueia até todos os assets (inclusive os do chefe) estarem prontos."""
+        self.queue_boss_assets()
+        for group in ("menu", "game", "boss"):
+            self.loader.results(group)
+        self.poll_assets()
+
+    def install_menu_assets(self) -> None:
+        menu_assets = self.loader.results("menu")
+        screen_size = self.render.size
+        fallback = self.finish_image(menu_assets["fallback"], screen_size)
+        menu_background_image = self.finish_image(
+            menu_assets["background"], screen_size, fallback=fallback
         )
 
-        self.font_title = self.load_font(FONT_FILE, 42)
-        self.font_text = self.load_font(FONT_FILE, 24)
-
-        self.menu = Menu(menu_background_image, self.font_title, self.font_text)
-
-        # Sons
-        self.shoot_sound = self.load_sound(SHOOT_SOUND_FILE)
-        self.hit_sound = self.load_sound(HIT_SOUND_FILE)
-        self.music_loaded = self.load_music(MUSIC_FILE)
-
-        # Estado do jogo
-        self.state = STATE_MENU
-        self.score = Score()
-
-        # Sprites
-        self.all_sprites = pygame.sprite.Group()
-        self.zombie_group = pygame.sprite.Group()
-        self.bullet_group = pygame.sprite.Group()
-
-        # Grupos do chefe
-        self.boss_group = pygame.sprite.Group()
-        self.brain_group = pygame.sprite.Group()
-        self.boss_spawned = False
-        self.boss_dead = False
+        self.font_title = menu_assets["font_title"]
+        self.font_text = menu_assets["font_text"]
+
+        # Textos: cache LRU para rótulos e atlas de dígitos para contadores
+        self.text_cache = TextCache()
+        self.score_digits = DigitAtlas(self.font_text, WHITE)
+        self.kills_digits = DigitAtlas(self.font_text, GREEN)
+        # Fora do TextCache: o fade muda o alpha da superfície, e a do cache é
+        # compartilhada com quem renderizar o mesmo texto
+        self.levelup_banner = self.font_text.render("LEVEL UP!", True, (255, 215, 0))
+
+        self.menu = Menu(
+            menu_background_image,
+            self.font_title,
+            self.font_text,
+            self.render,
+            self.text_cache,
+        )
 
-        self.player: Player | None = None
+    def install_game_assets(self) -> None:
+        game_assets = self.loader.results("game")
+        layers = {
+            Background.layer_key(spec): self.finish_image(
+                game_assets[Background.layer_key(spec)],
+                Background.layer_scale(spec),
+                darken=spec.get("darken", 0),
+            )
+            for specs in BACKGROUNDS.values()
+            for spec in specs
+        }
+        self.background = Background.from_specs(BACKGROUNDS, layers, self.render.scale)
+
+        self.player_image = self.finish_image(game_assets["player"], PLAYER_SIZE)
+        self.zombie_image = self.finish_image(game_assets["zombie"], ZOMBIE_SIZE)
+        self.bullet_image = self.finish_image(game_assets["bullet"], BULLET_SIZE)
+        self.heart_image = self.finish_image(game_assets["heart"], HEART_SIZE)
+
+        # Quadros de animação, assados uma vez por tipo
+        self.player_animation = AnimationSet.procedural(self.player_image, swing=3, bob=2)
+        self.zombie_animation = AnimationSet.procedural(
+            self.zombie_image, swing=6, bob=2, attack_swing=14, frame_ms=150
+        )
+        self.boss_animation = None
+        self.boss_hit_animation = None
 
-        if self.music_loaded:
-            pygame.mixer.music.set_volume(0.4)
+        # Chefe e cérebro chegam depois; até lá, superfícies vazias do
+        # mesmo tamanho (a simulação só depende dos retângulos)
+        self.boss_image = pygame.Surface(BOSS_SIZE, pygame.SRCALPHA)
+        self.brain_image = pygame.Surface(BRAIN_SIZE, pygame.SRCALPHA)
 
-        # ----- Dificuldade -----
-        self.difficulty_timer = 0
-        self.difficulty_level = 1
-        self.difficulty_interval = 20000  # 8 segundos
+        # Sons
+        for name, spec in SOUNDS.items():
+            self.audio.add(
+                name,
+                game_assets[f"sound.{name}"],
+                spec["group"],
+                spec["voices"],
+                spec["per_frame"],
+            )
+        self.audio.music_loaded = game_assets["music"]
+
+        # Simulação (sprites, score, dificuldade e chefe), aqui ou num
+        # processo à parte
+        world_class = RemoteWorld if self.pipelined else World
+        self.world = world_class(
+            self.player_image,
+            self.zombie_image,
+            self.bullet_image,
+            self.boss_image,
+            self.brain_image,
+            seed=self.seed,
+            player_animation=self.player_animation,
+            zombie_animation=self.zombie_animation,
+        )
+        self.score = self.world.score
+        self.world.profiler = self.profiler
+        self.build_batch()
+        self.save_asset_cache("game")
+
+    def install_boss_assets(self) -> None:
+        boss_assets = self.loader.results("boss")
+        self.boss_image = self.finish_image(boss_assets["boss"], BOSS_SIZE)
+        self.brain_image = self.finish_image(boss_assets["brain"], BRAIN_SIZE)
+        self.boss_animation = AnimationSet.procedural(self.boss_image, swing=2, bob=3, frame_ms=200)
+        # Flash de dano assado aqui, uma vez, e compartilhado pelos chefes
+        self.boss_hit_animation = self.boss_animation.tinted(BossZombie.HIT_TINT)
+        self.world.boss_image = self.boss_image
+        self.world.boss_animation = self.boss_animation
+        self.world.boss_hit_animation = self.boss_hit_animation
+        self.world.brain_image = self.brain_image
+        self.boss_assets_ready = True
+        self.build_batch()
+
+        self.save_asset_cache("boss")
+
+    def save_asset_cache(self, group: str) -> None:
+        """Grava sprites recém-assados no cache, numa thread do loader."""
+        if self.assets is not None:
+            self.loader.submit("cache", group, self.assets.save)
+
+    def build_batch(self) -> None:
+        """Atlas com todas as sprites (e quadros de animação) + lote de desenho."""
+        if not self.batched_draw:
+            return
+        images = [
+            self.player_image,
+            self.zombie_image,
+            self.bullet_image,
+            self.heart_image,
+            self.boss_image,
+            self.brain_image,
+        ]
+        animations = (
+            self.player_animation,
+            self.zombie_animation,
+            self.boss_animation,
+            self.boss_hit_animation,
+        )
+        for animation in animations:
+            if animation is not None:
+                images.extend(animation.frames)
+        scale = self.render.scale
+        atlas = TextureAtlas(images, max_width=round(1024 * scale), scale=scale)
+        self.batch = SpriteBatch(self.screen, atlas, scale)
+
+    def decode_image(
+        self,
+        path: str,
+        scale: SizeSpec = None,
+        darken: int = 0,
+    ) -> pygame.Surface | None:
+        """
+        Decodifica, escurece e escala uma imagem (seguro fora da thread
+        principal). Retorna None se o arquivo não puder ser lido.
+        """
+        try:
+            if self.assets is not None:
+                return self.assets.image(path, scale, darken)
+            image = AssetCache.truecolor(pygame.image.load(path))
+        except (pygame.error, FileNotFoundError):
+            return None
 
-        # ----- Animação de LEVEL UP -----
-        self.levelup_effect_time = 0
-        self.levelup_text_alpha = 0
-        self.levelup_scale = 1.0
-        self.LEVELUP_DURATION = 1200
-        self.LEVELUP_FLASH_TIME = 180
+        if darken:
+            image.fill((darken,) * 3, special_flags=pygame.BLEND_RGB_SUB)
 
-    # ========= Helpers de carregamento ========= #
+        if callable(scale):
+            scale = scale(image.get_size())
+        if scale is not None and image.get_size() != tuple(scale):
+            image = pygame.transform.smoothscale(image, scale)
+        return image
 
     @staticmethod
-    def load_image(
-        path: str,
-        scale: tuple[int, int] | None = None,
+    def finish_image(
+        image: pygame.Surface | None,
+        scale: SizeSpec = None,
         fallback: pygame.Surface | None = None,
+        darken: int = 0,
     ) -> pygame.Surface:
-        try:
-            image = pygame.image.load(path).convert_alpha()
-        except (pygame.error, FileNotFoundError):
-            if fallback is not None:
-                image = fallback.copy()
-            else:
-                image = pygame.Surface((100, 100))
-                image.fill((80, 80, 80))
-
-        if scale is not None:
+        """Converte para o formato do display; sem imagem, usa o substituto."""
+        if image is not None:
+            return image.convert_alpha()
+
+        if fallback is not None:
+            image = fallback.copy()
+        else:
+            image = pygame.Surface((100, 100))
+            image.fill((80, 80, 80))
+
+        if darken:
+            image.fill((darken,) * 3, special_flags=pygame.BLEND_RGB_SUB)
+
+        if callable(scale):
+            scale = scale(image.get_size())
+        if scale is not None and image.get_size() != tuple(scale):
             image = pygame.transform.smoothscale(image, scale)
-
         return image
 
     @staticmethod
@@ -147,338 +435,461 @@ class Game:
         except (IOError, FileNotFoundError):
             return pygame.font.SysFont("arial", size)
 
-    @staticmethod
-    def load_sound(path: str) -> pygame.mixer.Sound | None:
-        try:
-            return pygame.mixer.Sound(path)
-        except (pygame.error, FileNotFoundError):
-            return None
-
-    @staticmethod
-    def load_music(path: str) -> bool:
-        try:
-            pygame.mixer.music.load(path)
-            return True
-        except (pygame.error, FileNotFoundError):
-            return False
-
     # ========= Setup ========= #
 
     def start_new_game(self) -> None:
         """Reseta score, recria player e zumbis."""
-        self.score.reset()
-
-        self.all_sprites.empty()
-        self.zombie_group.empty()
-        self.bullet_group.empty()
-        self.boss_group.empty()
-        self.brain_group.empty()
-
-        self.boss_spawned = False
-        self.boss_dead = False
-
-        self.player = Player(self.player_image)
-        self.all_sprites.add(self.player)
-
-        # Cria vários zumbis iniciais
-        for _ in range(8):
-            zombie = Zombie(self.zombie_image)
-            self.all_sprites.add(zombie)
-            self.zombie_group.add(zombie)
-
-        if self.music_loaded:
-            pygame.mixer.music.play(-1)
+        self.save_recording()
+        if self.replay_path:
+            self.replay = ReplayPlayer.load(self.replay_path)
+            self.world.reset(seed=self.replay.seed)
+        else:
+            self.world.reset()
+        if self.record_path:
+            self.recorder = InputRecorder(self.world.session_seed)
+        self.shoot_requested = False
+
+        self.timers.clear()
+        self.levelup_timer = None
+        self.particles.clear()
+        self.background.set_level(self.world.difficulty_level)
+
+        self.audio.play_music()
 
         self.state = STATE_PLAYING
 
     # ========= Loop principal ========= #
 
     def run(self) -> None:
+        """
+        Loop com passo fixo: a simulação avança em ticks de ``TICK_MS`` e o
+        desenho interpola entre os dois últimos ticks, em qualquer FPS.
+        """
         running = True
+        accumulator = 0.0
+        profiler = self.profiler
         while running:
-            self.clock.tick(FPS)
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                if self.state == STATE_MENU:
-                    self.handle_menu_events(event)
-                elif self.state == STATE_PLAYING:
-                    self.handle_playing_events(event)
-                elif self.state == STATE_GAME_OVER:
-                    self.handle_game_over_events(event)
-                elif self.state == STATE_GAME_WIN:
-                    self.handle_game_over_events(event)
-                elif self.state == STATE_PAUSED:
-                    self.handle_paused_events(event)
+            frame_ms = self.clock.tick(FPS)
+            profiler.begin_frame()
+            self.audio.begin_frame()
+
+            with profiler.section("events"):
+                running = self.handle_events()
+
+            with profiler.section("assets"):
+                self.poll_assets()
 
             if self.state == STATE_PLAYING:
-                self.update_game()
+                accumulator += frame_ms
+                steps = 0
+                while accumulator >= TICK_MS and steps < MAX_SUBSTEPS:
+                    self.update_game(TICK_MS)
+                    accumulator -= TICK_MS
+                    steps += 1
+                    if self.state != STATE_PLAYING:
+                        break
+
+                # Depois de uma travada longa, descarta o atraso restante
+                if steps == MAX_SUBSTEPS:
+                    accumulator = min(accumulator, TICK_MS)
+            else:
+                accumulator = 0.0
 
-            self.draw()
+            self.draw(accumulator / TICK_MS)
+            profiler.end_frame(self.world.entity_counts() if self.world else None)
 
+        self.quit()
+
+    def quit(self) -> None:
+        self.loader.shutdown()
+        if isinstance(self.world, RemoteWorld):
+            self.world.close()
+        self.save_recording()
+        if self.profile_out:
+            self.profiler.export(self.profile_out)
         pygame.quit()
         sys.exit()
 
 
     # ========= Eventos ========= #
 
+    def handle_events(self) -> bool:
+        """Processa a fila de eventos; retorna False se a janela foi fechada."""
+        running = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                self.handle_debug_keys(event)
+
+            if self.state == STATE_LOADING:
+                self.handle_loading_events(event)
+            elif self.state == STATE_MENU:
+                self.handle_menu_events(event)
+            elif self.state == STATE_PLAYING:
+                self.handle_playing_events(event)
+            elif self.state == STATE_GAME_OVER:
+                self.handle_game_over_events(event)
+            elif self.state == STATE_GAME_WIN:
+                self.handle_game_over_events(event)
+            elif self.state == STATE_PAUSED:
+                self.handle_paused_events(event)
+        return running
+
+    def handle_debug_keys(self, event: pygame.event.Event) -> None:
+        if event.key == pygame.K_F3:
+            self.profiler.visible = not self.profiler.visible
+        elif event.key == pygame.K_F4:
+            self.profiler.export(self.profile_out or PROFILE_FILE)
+
+    def handle_loading_events(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.quit()
+
     def handle_menu_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
-                self.start_new_game()
+                if self.world is None:
+                    # Assets da partida ainda carregando: espera na tela de loading
+                    self.state = STATE_LOADING
+                    self.state_after_loading = STATE_PLAYING
+                else:
+                    self.start_new_game()
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.quit()
 
     def handle_playing_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE and self.player is not None:
-                bullet = self.player.shoot(self.bullet_image)
-                if bullet is not None:
-                    self.all_sprites.add(bullet)
-                    self.bullet_group.add(bullet)
-                    if self.shoot_sound is not None:
-                        self.shoot_sound.play()
+            if event.key == pygame.K_SPACE:
+                self.shoot_requested = True
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.quit()
             elif event.key == pygame.K_p:
                 self.state = STATE_PAUSED
+                self.timers.pause()
+                self.audio.pause()
 
     def handle_paused_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_p:
                 self.state = STATE_PLAYING
+                self.timers.resume()
+                self.audio.resume()
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.quit()
 
     def handle_game_over_events(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 self.state = STATE_MENU
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.quit()
 
     # ========= Lógica ========= #
 
-    def update_game(self) -> None:
-        """Atualiza fundo, sprites, IA, chefe e colisões."""
-
-        self.background.update()
-        self.all_sprites.update()
-
-        # ----- LEVEL UP Animation -----
-        self.difficulty_timer += self.clock.get_time()
-
-        if self.levelup_effect_time > 0:
-            dt = self.clock.get_time()
-            self.levelup_effect_time -= dt
-            self.levelup_scale = 1.0 + (self.levelup_effect_time / self.LEVELUP_DURATION) * 0.4
-            self.levelup_text_alpha = max(0, self.levelup_text_alpha - dt * 0.5)
-
-        # ----- Dificuldade -----
-        if self.difficulty_timer >= self.difficulty_interval:
-            self.difficulty_timer = 0
-            self.difficulty_level += 1
-
-            # Iniciar efeitos de LEVEL UP
-            self.levelup_effect_time = self.LEVELUP_DURATION
-            self.levelup_text_alpha = 255
-            self.levelup_scale = 1.4
-
-            # Deixar zumbis mais rápidos
-            for z in self.zombie_group:
-                z.speed_x += 0.3
-
-            # Criar mais zumbis
-            for _ in range(self.difficulty_level):
-                zombie = Zombie(self.zombie_image)
-                self.all_sprites.add(zombie)
-                self.zombie_group.add(zombie)
-
-            print(f"[DEBUG] Level aumentado para {self.difficulty_level}")
-
-            # ----- Spawn do Boss -----
-            if self.difficulty_level == 5 and not self.boss_spawned:
-                boss = BossZombie(self.boss_image, life=20)
-                self.boss_group.add(boss)
-                self.all_sprites.add(boss)
-                self.boss_spawned = True
-
-        # ----- Update Boss (movimento + ataque) -----
-        for boss in self.boss_group:
-            action = boss.update()
-            if action == "ATTACK":
-                brain = Brain(self.brain_image, boss.rect.left, boss.rect.centery)
-                self.brain_group.add(brain)
-                self.all_sprites.add(brain)
-
-        # ----- Colisão tiro x zumbi -----
-        hits = pygame.sprite.groupcollide(
-            self.zombie_group,
-            self.bullet_group,
-            True,
-            True,
-        )
-
-        for _ in hits:
-            self.score.add_points(POINTS_PER_ZOMBIE)
-            self.score.add_kill(1)
-
-            if self.hit_sound:
-                self.hit_sound.play()
-
-            zombie = Zombie(self.zombie_image)
-            self.all_sprites.add(zombie)
-            self.zombie_group.add(zombie)
-
-        # ----- Colisão tiro x Boss -----
-        if self.boss_spawned and not self.boss_dead:
-            for boss in self.boss_group:
-                hits = pygame.sprite.spritecollide(boss, self.bullet_group, True)
-                for _ in hits:
-                    died = boss.take_damage(1)
-                    if died:
-                        boss.kill()
-                        self.boss_dead = True
-                        self.state = STATE_GAME_WIN
-                        if self.music_loaded:
-                            pygame.mixer.music.stop()
-
-        # ----- Colisão zumbi x player -----
-        if self.player:
-            collisions = pygame.sprite.spritecollide(
-                self.player,
-                self.zombie_group,
-                True,
-            )
-            if collisions:
-                self.score.lose_life(1)
-                for _ in collisions:
-                    zombie = Zombie(self.zombie_image)
-                    self.all_sprites.add(zombie)
-                    self.zombie_group.add(zombie)
-
-        # ----- Colisão cérebro x player -----
-        if self.player:
-            brain_hits = pygame.sprite.spritecollide(
-                self.player, self.brain_group, True
+    def update_game(self, dt: float = TICK_MS) -> None:
+        """Avança um tick: fundo, simulação, sons e efeitos de level up."""
+        with self.profiler.section("background.update"):
+            self.background.update(dt)
+        self.timers.advance(dt)
+
+        if self.replay is not None:
+            controls = self.replay.next()
+        else:
+            controls = InputState.from_keys(
+                pygame.key.get_pressed(), shoot=self.shoot_requested
             )
-            if brain_hits:
-                self.score.lose_life(1)
-                if self.score.is_game_over():
-                    self.state = STATE_GAME_OVER
-                    if self.music_loaded:
-                        pygame.mixer.music.stop()
-
-        # GAME OVER por vidas
-        if self.score.is_game_over() and self.state != STATE_GAME_WIN:
-            self.state = STATE_GAME_OVER
-            if self.music_loaded:
-                pygame.mixer.music.stop()
+        self.shoot_requested = False
+        if self.recorder is not None:
+            self.recorder.record(controls)
+
+        # Chefe: prefetch um level antes; se ainda não chegou, espera aqui
+        if self.world.difficulty_level >= BOSS_LEVEL - 1:
+            self.queue_boss_assets()
+        if not self.boss_assets_ready and self.world.boss_due():
+            with self.profiler.section("assets.wait_boss"):
+                self.install_boss_assets()
+
+        events = self.world.step(controls, dt)
+
+        # Sons (com o nome do evento; os limites por som ficam no Audio)
+        for event in events:
+            self.audio.play(event)
+            if event == EVENT_LEVEL_UP:
+                # Fundo do novo level e efeitos de LEVEL UP (reinicia se
+                # já estiver rodando)
+                self.background.set_level(self.world.difficulty_level)
+                if self.levelup_timer is not None:
+                    self.levelup_timer.cancel()
+                self.levelup_timer = self.timers.after(
+                    self.LEVELUP_DURATION, self.end_levelup_effect
+                )
+
+        # Efeitos de impacto (zumbi morto, chefe atingido, cérebro no jogador)
+        with self.profiler.section("particles"):
+            for kind, x, y in self.world.impacts:
+                self.particles.burst(kind, x, y)
+            self.particles.update(dt)
+
+        # Fim de partida (vitória sobre o chefe ou sem vidas)
+        if self.world.state != STATE_PLAYING:
+            self.state = self.world.state
+            self.save_recording()
+            self.audio.stop_music()
+        elif self.replay is not None and self.replay.finished():
+            self.state = STATE_MENU
+            self.audio.stop_music()
+
+    def end_levelup_effect(self) -> None:
+        self.levelup_timer = None
+
+    def save_recording(self) -> None:
+        if self.recorder is not None and self.recorder.inputs:
+            self.recorder.save(self.record_path)
+        self.recorder = None
 
     # ========= Desenho ========= #
 
-    def draw(self) -> None:
-        if self.state == STATE_MENU:
+    def draw(self, alpha: float = 1.0) -> None:
+        """Desenha o estado atual; ``alpha`` é a fração do próximo tick."""
+        if self.renderer is not None and self.state != STATE_PLAYING:
+            self.draw_static()
+            return
+
+        if self.state == STATE_LOADING:
+            self.draw_loading(self.screen)
+        elif self.state == STATE_MENU:
             self.menu.draw_main_menu(self.screen)
         elif self.state == STATE_PLAYING:
-            self.draw_playing()
+            self.draw_playing(alpha)
         elif self.state == STATE_GAME_OVER:
             self.menu.draw_game_over(self.screen, self.score.points)
         elif self.state == STATE_GAME_WIN:
-            self.draw_game_win()
+            self.draw_game_win(self.screen)
         elif self.state == STATE_PAUSED:
-            self.draw_pause()
+            self.draw_pause(self.screen)
 
-        pygame.display.flip()
+        with self.profiler.section("draw.upscale"):
+            self.render.upscale()
 
-    def draw_playing(self) -> None:
-        # Fundo
-        self.background.draw(self.screen)
+        # Overlay na janela, depois de ampliar: legível em qualquer resolução
+        if self.state in (STATE_PLAYING, STATE_PAUSED):
+            with self.profiler.section("draw.profiler"):
+                self.profiler.draw_overlay(self.render.window, self.debug_font)
 
-        # Sprites normais
-        self.all_sprites.draw(self.screen)
+        with self.profiler.section("draw.flip"):
+            if self.renderer is not None:
+                self.renderer.present_full()
+            else:
+                self.render.flip()
+
+    def draw_static(self) -> None:
+        """
+        Telas paradas no modo dirty-rect: compostas uma vez, reaproveitadas.
+
+        A barra de carregamento e o painel do profiler (F3, no pause) são
+        overlays: quando mudam, só o retângulo deles vai ao display.
+        """
+        overlays = []
+        if self.state == STATE_LOADING:
+            key, compose = ("loading",), self.draw_loading_frame
+            progress = int(self.loading_progress() * 100)
+            overlays.append(("loading_bar", progress, self.loading_bar_overlay))
+        elif self.state == STATE_MENU:
+            key, compose = ("menu",), self.menu.draw_main_menu
+        elif self.state == STATE_GAME_OVER:
+            points = self.score.points
+            key = ("game_over", points)
 
-        # ===== HUD =====
+            def compose(target: pygame.Surface) -> None:
+                self.menu.draw_game_over(target, points)
+        elif self.state == STATE_GAME_WIN:
+            key, compose = ("game_win", self.score.points), self.draw_game_win
+        elif self.state == STATE_PAUSED:
+            key, compose = ("paused", self.world.ticks), self.draw_pause
+            panel = self.profiler.overlay(self.debug_font)
+            if panel is not None:
+                pos = self.profiler.overlay_pos(self.screen.get_size(), panel)
+                overlays.append(("profiler", panel, lambda: (panel, pos)))
+        else:
+            return
+        self.renderer.present_static(key, compose, overlays)
+
+    def draw_playing(self, alpha: float = 1.0) -> None:
+        profiler = self.profiler
 
-        # Corações (vidas)
+        # Fundo
+        with profiler.section("draw.background"):
+            self.background.draw(self.screen, alpha)
+
+        # Horda e sprites normais (interpolados entre os dois últimos ticks)
+        with profiler.section("draw.sprites"):
+            if self.batch is not None:
+                self.draw_batched(alpha)
+            else:
+                self.world.horde.draw(self.screen, alpha)
+                for sprite in self.world.all_sprites:
+                    self.screen.blit(sprite.image, sprite.draw_pos(alpha))
+                particles = SpriteBatch(self.screen)
+                self.particles.draw(particles, LAYER_PARTICLES)
+                particles.flush()
+
+        with profiler.section("draw.hud"):
+            self.draw_hud()
+
+    def draw_batched(self, alpha: float) -> None:
+        """Horda, entidades, partículas e corações do HUD num único lote, por camada."""
+        batch = self.batch
+        horde = self.world.horde
+        groups, culled = horde.sprites(alpha, SCREEN_WIDTH, SCREEN_HEIGHT, batch.scale)
+        for image, positions in groups:
+            batch.add_many(image, positions, horde.layer, culled)
+            culled = 0
+        batch.add_sprites(self.world.all_sprites, alpha)
+        self.particles.draw(batch, LAYER_PARTICLES)
+        hearts = [self.render.point(x, y) for x, y in self.heart_positions()]
+        batch.add_many(self.heart_image, hearts, LAYER_HUD)
+        batch.flush()
+
+    def heart_positions(self) -> list[tuple[int, int]]:
+        """Onde desenhar um coração por vida (só o que cabe na tela), em coordenadas lógicas."""
         heart_spacing = 6
-        base_x = 10
+        step = self.heart_image.get_width() + heart_spacing
+        count = min(self.score.lives, SCREEN_WIDTH // step)
+        return [(10 + i * step, 10) for i in range(max(0, count))]
+
+    def draw_hud(self) -> None:
+        # ===== HUD =====
+        # Layout em pixels lógicos (``px``) sobre textos já na resolução
+        # de desenho
+        px = self.render.length
+        screen_width, screen_height = self.screen.get_size()
         base_y = 10
 
-        if self.heart_image:
-            w = self.heart_image.get_width()
-            for i in range(self.score.lives):
-                x = base_x + i * (w + heart_spacing)
-                self.screen.blit(self.heart_image, (x, base_y))
+        # Corações (vidas); no modo em lote já saíram com as sprites
+        if self.batch is None:
+            self.screen.blits(
+                [(self.heart_image, pos) for pos in self.heart_positions()],
+                doreturn=False,
+            )
 
-        # SCORE
-        score_text = self.font_text.render(
-            f"SCORE {self.score.points}", True, WHITE
+        # SCORE (rótulo em cache + dígitos do atlas)
+        score_label = self.text_cache.render(self.font_text, "SCORE ", WHITE)
+        self.screen.blit(score_label, (px(10), px(base_y + 30)))
+        self.score_digits.draw(
+            self.screen, self.score.points, (px(10) + score_label.get_width(), px(base_y + 30))
         )
-        self.screen.blit(score_text, (10, base_y + 30))
 
         # ZUMBIS mortos
-        kills_text = self.font_text.render(
-            f"ZUMBIS {self.score.kills}", True, GREEN
+        kills_label = self.text_cache.render(self.font_text, "ZUMBIS ", GREEN)
+        self.screen.blit(kills_label, (px(10), px(base_y + 60)))
+        self.kills_digits.draw(
+            self.screen, self.score.kills, (px(10) + kills_label.get_width(), px(base_y + 60))
         )
-        self.screen.blit(kills_text, (10, base_y + 60))
 
         # LEVEL (animação com zoom + flash)
-        level_str = f"LEVEL {self.difficulty_level}"
-        level_surface = self.font_text.render(level_str, True, WHITE)
-
-        scaled_w = int(level_surface.get_width() * self.levelup_scale)
-        scaled_h = int(level_surface.get_height() * self.levelup_scale)
-        level_surface = pygame.transform.scale(level_surface, (scaled_w, scaled_h))
-
-        level_x = SCREEN_WIDTH - scaled_w - 10
-        level_y = 10
-
-        if self.levelup_effect_time > (self.LEVELUP_DURATION - self.LEVELUP_FLASH_TIME):
-            flash_rect = pygame.Rect(level_x - 10, level_y - 5, scaled_w + 20, scaled_h + 10)
+        level_str = f"LEVEL {self.world.difficulty_level}"
+        level_surface = self.text_cache.render(self.font_text, level_str, WHITE)
+
+        # O efeito sai do tempo restante do timer: zoom de 1.4 até 1.0,
+        # flash no começo e o texto sumindo (255 - 0.5 por ms)
+        remaining = self.levelup_timer.remaining() if self.levelup_timer else 0.0
+        elapsed = self.LEVELUP_DURATION - remaining
+        levelup_scale = 1.0 + (remaining / self.LEVELUP_DURATION) * 0.4
+        levelup_text_alpha = max(0, 255 - elapsed * 0.5) if remaining > 0 else 0
+
+        scaled_w = int(level_surface.get_width() * levelup_scale)
+        scaled_h = int(level_surface.get_height() * levelup_scale)
+        if (scaled_w, scaled_h) != level_surface.get_size():
+            level_surface = pygame.transform.scale(level_surface, (scaled_w, scaled_h))
+
+        level_x = screen_width - scaled_w - px(10)
+        level_y = px(10)
+
+        if remaining > (self.LEVELUP_DURATION - self.LEVELUP_FLASH_TIME):
+            flash_rect = pygame.Rect(
+                level_x - px(10), level_y - px(5), scaled_w + px(20), scaled_h + px(10)
+            )
             pygame.draw.rect(self.screen, (255, 255, 255), flash_rect)
 
         self.screen.blit(level_surface, (level_x, level_y))
 
         # Texto LEVEL UP centralizado
-        if self.levelup_text_alpha > 0:
-            text = self.font_text.render("LEVEL UP!", True, (255, 215, 0))
-            text.set_alpha(self.levelup_text_alpha)
-            x = SCREEN_WIDTH // 2 - text.get_width() // 2
-            y = SCREEN_HEIGHT // 2 - text.get_height() // 2
+        if levelup_text_alpha > 0:
+            text = self.levelup_banner
+            text.set_alpha(levelup_text_alpha)
+            x = screen_width // 2 - text.get_width() // 2
+            y = screen_height // 2 - text.get_height() // 2
             self.screen.blit(text, (x, y))
 
-    def draw_game_win(self):
-        self.screen.fill((0, 0, 0))
+    def loading_progress(self) -> float:
+        if self.state_after_loading == STATE_PLAYING:
+            return self.loader.progress("game")
+        return self.loader.progress("menu")
+
+    def draw_loading(self, screen: pygame.Surface) -> None:
+        """Barra de progresso (só com a fonte padrão, sem assets do jogo)."""
+        self.draw_loading_frame(screen)
+        self.draw_loading_bar(screen, self.loading_bar(screen.get_size()))
+
+    def loading_bar(self, size: tuple[int, int]) -> pygame.Rect:
+        width, height = size
+        bar = pygame.Rect(0, 0, width // 2, self.render.length(16))
+        bar.center = (width // 2, height // 2)
+        return bar
+
+    def draw_loading_frame(self, screen: pygame.Surface) -> None:
+        """Tudo da tela de carregamento menos a barra."""
+        screen.fill((0, 0, 0))
+        bar = self.loading_bar(screen.get_size())
+        text = self.debug_font.render("CARREGANDO...", True, WHITE)
+        screen.blit(text, text.get_rect(midbottom=(bar.centerx, bar.top - 8)))
+
+    def draw_loading_bar(self, screen: pygame.Surface, bar: pygame.Rect) -> None:
+        filled = bar.copy()
+        filled.width = round(bar.width * self.loading_progress())
+        pygame.draw.rect(screen, (200, 200, 200), filled)
+        pygame.draw.rect(screen, WHITE, bar, 1)
+
+    def loading_bar_overlay(self) -> tuple[pygame.Surface, tuple[int, int]]:
+        """A barra numa superfície própria (overlay do modo dirty-rect)."""
+        bar = self.loading_bar(self.screen.get_size())
+        surface = pygame.Surface(bar.size).convert()
+        surface.fill((0, 0, 0))
+        self.draw_loading_bar(surface, bar.move(-bar.x, -bar.y))
+        return surface, bar.topleft
+
+    def draw_game_win(self, screen: pygame.Surface) -> None:
+        screen.fill((0, 0, 0))
+
+        trophy = self.text_cache.render(self.font_title, "🏆 GAME WIN!", (255, 215, 0))
+        points = self.text_cache.render(
+            self.font_text, f"Pontuação: {self.score.points}", (255, 255, 255)
+        )
 
-        trophy = self.font_title.render("🏆 GAME WIN!", True, (255, 215, 0))
-        points = self.font_text.render(f"Pontuação: {self.score.points}", True, (255, 255, 255))
+        px = self.render.length
+        x = screen.get_width() // 2
 
-        x = SCREEN_WIDTH // 2
+        screen.blit(trophy, (x - trophy.get_width() // 2, px(200)))
+        screen.blit(points, (x - points.get_width() // 2, px(280)))
 
-        self.screen.blit(trophy, (x - trophy.get_width() // 2, 200))
-        self.screen.blit(points, (x - points.get_width() // 2, 280))
-    def draw_pause(self):
+    def draw_pause(self, screen: pygame.Surface) -> None:
         # manter o fundo congelado
         self.draw_playing()
+        if screen is not self.screen:
+            screen.blit(self.screen, (0, 0))
 
         # sobreposição escura
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        screen.blit(self.pause_overlay, (0, 0))
 
         # texto
-        pause_text = self.font_title.render("PAUSADO", True, (255, 255, 255))
-        sub_text = self.font_text.render("Pressione P para continuar", True, (200, 200, 200))
+        pause_text = self.text_cache.render(self.font_title, "PAUSADO", (255, 255, 255))
+        sub_text = self.text_cache.render(
+            self.font_text, "Pressione P para continuar", (200, 200, 200)
+        )
 
-        x = SCREEN_WIDTH // 2
+        px = self.render.length
+        x = screen.get_width() // 2
 
-        self.screen.blit(pause_text, (x - pause_text.get_width() // 2, 220))
-        self.screen.blit(sub_text, (x - sub_text.get_width() // 2, 300))
+        screen.blit(pause_text, (x - pause_text.get_width() // 2, px(220)))
+        screen.blit(sub_text, (x - sub_text.get_width() // 2, px(300)))
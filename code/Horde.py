@@ -0,0 +1,322 @@
+"""
+Horda de zumbis em arrays NumPy (estrutura de arrays).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from .Const import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    LAYER_ZOMBIES,
+    ZOMBIE_CHASE,
+    ZOMBIE_SEPARATION,
+    ZOMBIE_ATTACK_RANGE,
+)
+from .Animation import AnimationSet
+from .Collision import refine_hits
+from .Navigation import FlowField, separation
+
+
+class Horde:
+    """
+    Todos os zumbis da partida em arrays contíguos de float.
+
+    Os zumbis vivos ocupam os índices ``[0, count)``; morrer compacta os
+    arrays e nascer escreve no fim, então o mesmo espaço é reaproveitado
+    (faz o papel do pool). Movimento, reaparecimento à direita, aumento de
+    velocidade e testes de sobreposição são operações vetorizadas, sem
+    laço Python por zumbi.
+
+    Colisões usam sweep and prune no eixo x: os zumbis são ordenados por x
+    (de novo só quando algo mudou) e cada consulta só testa a fatia cujo
+    intervalo em x cruza o retângulo consultado. ``candidates`` conta os
+    pares testados desde o último ``prepare_queries``.
+    """
+
+    layer = LAYER_ZOMBIES
+
+    # Arrays por zumbi (realocados e compactados juntos)
+    COLUMNS = ("x", "y", "prev_x", "prev_y", "speed_x", "phase", "near")
+
+    def __init__(
+        self,
+        image_surface: pygame.Surface,
+        min_speed: float = 120.0,
+        max_speed: float = 300.0,
+        capacity: int = 64,
+        chase: float = ZOMBIE_CHASE,
+        separation_weight: float = ZOMBIE_SEPARATION,
+    ) -> None:
+        """
+        Args:
+            image_surface: sprite compartilhado por todos os zumbis.
+            min_speed: velocidade mínima (px/s).
+            max_speed: velocidade máxima (px/s).
+            capacity: tamanho inicial dos arrays (dobra quando enche).
+            chase: peso do campo de fluxo na direção (0 = só para a esquerda).
+            separation_weight: peso do afastamento entre vizinhos.
+        """
+        self.image = image_surface
+        self.width, self.height = image_surface.get_size()
+        self.min_speed = min_speed
+        self.max_speed = max_speed
+        self.chase = chase
+        self.separation_weight = separation_weight
+
+        self.rng = np.random.default_rng()
+        self.count = 0
+        self.capacity = 0
+        for name in self.COLUMNS:
+            setattr(self, name, np.zeros(0))
+        self._allocate(capacity)
+
+        # Animação (opcional): quadros compartilhados, fase própria de cada
+        # zumbi e "perto do jogador" (clipe de ataque). Só visual: usa um RNG
+        # separado para não mexer na sequência da simulação.
+        self.animation: AnimationSet | None = None
+        self.time_ms = 0.0
+        self.visual_rng = np.random.default_rng()
+
+        # Índices ordenados por x e posições arredondadas (como o Rect)
+        self._stale = True
+        self._order = np.empty(0, dtype=np.intp)
+        self._sorted_left = np.empty(0)
+        self._left = np.empty(0)
+        self._top = np.empty(0)
+
+        # Pares testados nas consultas desde o último prepare_queries
+        self.candidates = 0
+
+    def _allocate(self, capacity: int) -> None:
+        """Realoca os arrays para ``capacity`` zumbis, mantendo os vivos."""
+        for name in self.COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros(capacity)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    # ========= Ciclo de vida ========= #
+
+    def reset(self, seed: int) -> None:
+        """Remove todos os zumbis e reinicia o RNG (determinismo)."""
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self._stale = True
+
+    def spawn(self, amount: int = 1) -> None:
+        """Cria ``amount`` zumbis fora da tela, à direita."""
+        if amount <= 0:
+            return
+        if self.count + amount > self.capacity:
+            capacity = max(1, self.capacity)
+            while self.count + amount > capacity:
+                capacity *= 2
+            self._allocate(capacity)
+
+        new = slice(self.count, self.count + amount)
+        self.count += amount
+        self._respawn(new, amount)
+        self._stale = True
+
+    def _respawn(self, index, amount: int) -> None:
+        """Reposiciona os zumbis de ``index`` (antigo ``reset_position``)."""
+        rng = self.rng
+
+        # Aparece um pouco fora da tela, para a animação parecer natural
+        x = SCREEN_WIDTH + rng.integers(20, 151, size=amount)
+
+        # Y aleatório dentro dos limites
+        y = rng.integers(20, SCREEN_HEIGHT - self.height - 20 + 1, size=amount)
+
+        self.x[index] = x
+        self.prev_x[index] = x
+        self.y[index] = y
+        self.prev_y[index] = y
+        self.speed_x[index] = rng.uniform(self.min_speed, self.max_speed, size=amount)
+        self.phase[index] = self.visual_rng.uniform(0, 1000, size=amount)
+        self.near[index] = 0
+
+    def kill(self, indices: np.ndarray) -> int:
+        """Remove os zumbis de ``indices`` compactando os arrays."""
+        indices = np.unique(indices)
+        if indices.size == 0:
+            return 0
+        n = self.count
+        keep = np.ones(n, dtype=bool)
+        keep[indices] = False
+        alive = n - indices.size
+        for name in self.COLUMNS:
+            array = getattr(self, name)
+            array[:alive] = array[:n][keep]
+        self.count = alive
+        self._stale = True
+        return int(indices.size)
+
+    # ========= Simulação ========= #
+
+    def update(self, dt: float, flow: FlowField | None = None) -> None:
+        """
+        Movimenta a horda; quem sai pela esquerda reaparece.
+
+        Sem ``flow`` todos andam só para a esquerda. Com ele, a direção mistura
+        "para a esquerda" com o campo de fluxo (peso ``chase``) e a separação
+        dos vizinhos; a velocidade de cada zumbi continua ``speed_x``.
+        """
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        step = self.speed_x[:n] * (dt / 1000)
+        self.time_ms += dt
+        self._stale = True
+
+        if flow is None or n == 0:
+            x -= step
+        else:
+            center_x = x + self.width / 2
+            center_y = y + self.height / 2
+            flow_x, flow_y = flow.sample(center_x, center_y)
+            self.near[:n] = flow.distance_at(center_x, center_y) < ZOMBIE_ATTACK_RANGE
+            dir_x = self.chase * flow_x - (1 - self.chase)
+            dir_y = self.chase * flow_y
+            if self.separation_weight:
+                push_x, push_y = separation(center_x, center_y, self.width)
+                dir_x += self.separation_weight * push_x
+                dir_y += self.separation_weight * push_y
+            length = np.maximum(np.hypot(dir_x, dir_y), 1e-6)
+            x += step * dir_x / length
+            y += step * dir_y / length
+            np.clip(y, 0, SCREEN_HEIGHT - self.height, out=y)
+
+        # Quando sair totalmente da tela à esquerda, reaparece à direita
+        gone = np.flatnonzero(np.rint(x) + self.width < 0)
+        if gone.size:
+            self._respawn(gone, gone.size)
+
+    def centers(self, indices: np.ndarray) -> list[tuple[float, float]]:
+        """Centros dos zumbis de ``indices`` (antes de ``kill``)."""
+        xs = self.x[indices] + self.width / 2
+        ys = self.y[indices] + self.height / 2
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def speed_up(self, amount: float) -> None:
+        self.speed_x[:self.count] += amount
+
+    # ========= Colisões ========= #
+
+    def prepare_queries(self) -> None:
+        """Início das consultas do tick: zera ``candidates`` e ordena."""
+        self.candidates = 0
+        self._sort()
+
+    def _sort(self) -> None:
+        n = self.count
+        self._left = np.rint(self.x[:n])
+        self._top = np.rint(self.y[:n])
+        self._order = np.argsort(self._left, kind="stable")
+        self._sorted_left = self._left[self._order]
+        self._stale = False
+
+    def overlapping(
+        self,
+        rect: pygame.Rect,
+        masks: tuple[pygame.mask.Mask, pygame.mask.Mask] | None = None,
+    ) -> np.ndarray:
+        """
+        Índices dos zumbis cujo retângulo cruza ``rect``.
+
+        Args:
+            masks: (máscara dos zumbis, máscara de quem está em ``rect``)
+                para confirmar por pixel os que passaram no retângulo.
+        """
+        if self._stale:
+            self._sort()
+
+        # x do zumbi em (rect.left - largura, rect.right)
+        lo = np.searchsorted(self._sorted_left, rect.left - self.width, side="right")
+        hi = np.searchsorted(self._sorted_left, rect.right, side="left")
+        if hi <= lo:
+            return self._order[:0]
+
+        candidates = self._order[lo:hi]
+        self.candidates += candidates.size
+        top = self._top[candidates]
+        hit = (top < rect.bottom) & (top + self.height > rect.top)
+        hits = candidates[hit]
+        if masks is not None:
+            hits = refine_hits(masks[0], self._left, self._top, hits, masks[1], rect)
+        return hits
+
+    # ========= Desenho ========= #
+
+    def sprites(
+        self,
+        alpha: float,
+        width: int,
+        height: int,
+        scale: float = 1.0,
+    ) -> tuple[list[tuple[pygame.Surface, list[tuple[int, int]]]], int]:
+        """
+        Zumbis visíveis numa tela ``width``x``height``, agrupados por quadro.
+
+        As posições saem multiplicadas por ``scale`` (resolução de desenho
+        / lógica, ver ``SpriteBatch``); o recorte é em coordenadas lógicas.
+
+        Returns:
+            ([(quadro, posições interpoladas)], quantidade recortada por
+            estar fora da tela)
+        """
+        n = self.count
+        if n == 0:
+            return [], 0
+        prev_x = self.prev_x[:n]
+        prev_y = self.prev_y[:n]
+        xs = np.rint(prev_x + (self.x[:n] - prev_x) * alpha)
+        ys = np.rint(prev_y + (self.y[:n] - prev_y) * alpha)
+        visible = np.flatnonzero(
+            (xs < width) & (xs + self.width > 0)
+            & (ys < height) & (ys + self.height > 0)
+        )
+        culled = n - visible.size
+        if visible.size == 0:
+            return [], culled
+        xs = xs[visible]
+        ys = ys[visible]
+        if scale != 1:
+            xs = np.rint(xs * scale)
+            ys = np.rint(ys * scale)
+        xs = xs.astype(int)
+        ys = ys.astype(int)
+
+        if self.animation is None:
+            return [(self.image, list(zip(xs.tolist(), ys.tolist())))], culled
+
+        # Quadro de cada zumbi: índice pelo tempo, sem transformar nada
+        animation = self.animation
+        ids = animation.frame_ids(
+            "walk",
+            self.time_ms + self.phase[visible],
+            flipped=self.x[visible] > self.prev_x[visible],
+            alternate="attack" if "attack" in animation.clips else None,
+            use_alternate=self.near[visible] > 0,
+        )
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        xs = xs[order].tolist()
+        ys = ys[order].tolist()
+        bounds = (np.flatnonzero(np.diff(ids)) + 1).tolist()
+        groups = []
+        for start, end in zip([0, *bounds], [*bounds, len(xs)]):
+            frame = animation.frames[ids[start]]
+            groups.append((frame, list(zip(xs[start:end], ys[start:end]))))
+        return groups, culled
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        groups, _ = self.sprites(alpha, *screen.get_size())
+        for image, positions in groups:
+            screen.blits([(image, pos) for pos in positions], doreturn=False)
@@ -0,0 +1,69 @@
+"""
+Entrada do jogador em um tick de simulação.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+
+class InputState:
+    """Teclas relevantes para a simulação em um único tick."""
+
+    # Bits usados na gravação de replays (um byte por tick)
+    UP, DOWN, LEFT, RIGHT, SHOOT = 1, 2, 4, 8, 16
+
+    def __init__(
+        self,
+        up: bool = False,
+        down: bool = False,
+        left: bool = False,
+        right: bool = False,
+        shoot: bool = False,
+    ) -> None:
+        """
+        Args:
+            up, down, left, right: direções pressionadas.
+            shoot: pedido de tiro neste tick (borda de SPACE).
+        """
+        self.up = up
+        self.down = down
+        self.left = left
+        self.right = right
+        self.shoot = shoot
+
+    @classmethod
+    def from_keys(cls, keys, shoot: bool = False) -> InputState:
+        """Monta a entrada a partir de ``pygame.key.get_pressed()``."""
+        return cls(
+            up=bool(keys[pygame.K_UP]),
+            down=bool(keys[pygame.K_DOWN]),
+            left=bool(keys[pygame.K_LEFT]),
+            right=bool(keys[pygame.K_RIGHT]),
+            shoot=shoot,
+        )
+
+    def to_bits(self) -> int:
+        return (
+            (self.UP if self.up else 0)
+            | (self.DOWN if self.down else 0)
+            | (self.LEFT if self.left else 0)
+            | (self.RIGHT if self.right else 0)
+            | (self.SHOOT if self.shoot else 0)
+        )
+
+    @classmethod
+    def from_bits(cls, bits: int) -> InputState:
+        return cls(
+            up=bool(bits & cls.UP),
+            down=bool(bits & cls.DOWN),
+            left=bool(bits & cls.LEFT),
+            right=bool(bits & cls.RIGHT),
+            shoot=bool(bits & cls.SHOOT),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"InputState(up={self.up}, down={self.down}, left={self.left}, "
+            f"right={self.right}, shoot={self.shoot})"
+        )
@@ -13,29 +13,40 @@ from .Const import (
     YELLOW,
     RED,
 )
+from .RenderTarget import RenderTarget
+from .TextCache import TextCache
 
 
 class Menu:
-    """Responsável por desenhar o menu e a tela de game over."""
+    """
+    Responsável por desenhar o menu e a tela de game over.
+
+    O layout é em coordenadas lógicas (``SCREEN_WIDTH`` x ``SCREEN_HEIGHT``),
+    convertidas por ``RenderTarget.point`` para a resolução de desenho; as
+    fontes já vêm no tamanho dessa resolução.
+    """
 
     def __init__(
         self,
         background_surface: pygame.Surface,
         title_font: pygame.font.Font,
         text_font: pygame.font.Font,
+        render: RenderTarget,
+        text_cache: TextCache | None = None,
     ) -> None:
-        self.background = pygame.transform.smoothscale(
-            background_surface,
-            (SCREEN_WIDTH, SCREEN_HEIGHT),
-        )
+        self.render = render
+        if background_surface.get_size() != render.size:
+            background_surface = pygame.transform.smoothscale(background_surface, render.size)
+        self.background = background_surface
         self.title_font = title_font
         self.text_font = text_font
+        self.text_cache = text_cache or TextCache()
 
     def draw_main_menu(self, screen: pygame.Surface) -> None:
         screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render("ZOMBIE RUNNER", True, YELLOW)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 140))
+        title = self.text_cache.render(self.title_font, "ZOMBIE RUNNER", YELLOW)
+        title_rect = title.get_rect(center=self.render.point(SCREEN_WIDTH // 2, 140))
         screen.blit(title, title_rect)
 
         lines = [
@@ -49,12 +60,14 @@ class Menu:
         ]
 
         for i, text in enumerate(lines):
-            surf = self.text_font.render(text, True, WHITE)
-            rect = surf.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
+            surf = self.text_cache.render(self.text_font, text, WHITE)
+            rect = surf.get_rect(center=self.render.point(SCREEN_WIDTH // 2, 250 + i * 30))
             screen.blit(surf, rect)
 
-        dev = self.text_font.render("Developed by Pratesdev.com", True, RED)
-        dev_rect = dev.get_rect(bottomright=(SCREEN_WIDTH - 12, SCREEN_HEIGHT - 12))
+        dev = self.text_cache.render(self.text_font, "Developed by Pratesdev.com", RED)
+        dev_rect = dev.get_rect(
+            bottomright=self.render.point(SCREEN_WIDTH - 12, SCREEN_HEIGHT - 12)
+        )
         screen.blit(dev, dev_rect)
 
     def draw_game_over(
@@ -64,22 +77,22 @@ class Menu:
     ) -> None:
         screen.blit(self.background, (0, 0))
 
-        title = self.title_font.render("GAME OVER", True, RED)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 160))
+        title = self.text_cache.render(self.title_font, "GAME OVER", RED)
+        title_rect = title.get_rect(center=self.render.point(SCREEN_WIDTH // 2, 160))
         screen.blit(title, title_rect)
 
-        score_text = self.text_font.render(
+        score_text = self.text_cache.render(
+            self.text_font,
             f"Pontuacao final - {final_score}",
-            True,
             WHITE,
         )
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 230))
+        score_rect = score_text.get_rect(center=self.render.point(SCREEN_WIDTH // 2, 230))
         screen.blit(score_text, score_rect)
 
-        info_text = self.text_font.render(
+        info_text = self.text_cache.render(
+            self.text_font,
             "ENTER - voltar ao menu ou ESC - sair",
-            True,
             WHITE,
         )
-        info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, 290))
+        info_rect = info_text.get_rect(center=self.render.point(SCREEN_WIDTH // 2, 290))
         screen.blit(info_text, info_rect)
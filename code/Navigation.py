@@ -0,0 +1,131 @@
+"""
+Navegação da horda: campo de fluxo até o jogador e separação entre vizinhos.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .Const import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+class FlowField:
+    """
+    Direção (vetor unitário) de cada célula de uma grade grossa até o alvo.
+
+    É um campo só para toda a horda: recalculado a cada ``refresh_ticks``
+    ticks (todas as células de uma vez, vetorizado) e consultado por
+    zumbi em O(1) pelo índice da célula. A arena não tem obstáculos, então
+    o campo de distância é a distância euclidiana ao alvo e o fluxo é o seu
+    gradiente; com obstáculos, bastaria trocar ``_compute`` por uma busca
+    em largura na grade.
+    """
+
+    def __init__(self, cell_size: int = 40, refresh_ticks: int = 4) -> None:
+        """
+        Args:
+            cell_size: lado da célula em pixels.
+            refresh_ticks: ticks entre recálculos do campo.
+        """
+        self.cell_size = cell_size
+        self.refresh_ticks = refresh_ticks
+        self.cols = -(-SCREEN_WIDTH // cell_size)
+        self.rows = -(-SCREEN_HEIGHT // cell_size)
+
+        centers_x = (np.arange(self.cols) + 0.5) * cell_size
+        centers_y = (np.arange(self.rows) + 0.5) * cell_size
+        self.center_x, self.center_y = np.meshgrid(centers_x, centers_y)
+
+        self.distance = np.zeros((self.rows, self.cols))
+        self.flow_x = np.zeros((self.rows, self.cols))
+        self.flow_y = np.zeros((self.rows, self.cols))
+
+        self.target: tuple[float, float] | None = None
+        self._age = 0
+
+    def reset(self) -> None:
+        self.target = None
+
+    def update(self, target: tuple[float, float]) -> bool:
+        """Avança um tick; recalcula se venceu o intervalo. Retorna se recalculou."""
+        self._age += 1
+        if self.target is not None and self._age < self.refresh_ticks:
+            return False
+        self._age = 0
+        self.target = target
+        self._compute(target)
+        return True
+
+    def _compute(self, target: tuple[float, float]) -> None:
+        dx = target[0] - self.center_x
+        dy = target[1] - self.center_y
+        self.distance = np.hypot(dx, dy)
+        length = np.maximum(self.distance, 1e-6)
+        self.flow_x = dx / length
+        self.flow_y = dy / length
+
+    def _cells(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Célula de cada posição (fora da grade usa a célula da borda)."""
+        size = self.cell_size
+        col = np.clip((xs // size).astype(np.intp), 0, self.cols - 1)
+        row = np.clip((ys // size).astype(np.intp), 0, self.rows - 1)
+        return row, col
+
+    def sample(self, xs: np.ndarray, ys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Direção até o alvo nas posições dadas."""
+        row, col = self._cells(xs, ys)
+        return self.flow_x[row, col], self.flow_y[row, col]
+
+    def distance_at(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Distância (do centro da célula) até o alvo nas posições dadas."""
+        row, col = self._cells(xs, ys)
+        return self.distance[row, col]
+
+
+def separation(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    radius: float,
+    crowd: int = 4,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Empurrão de cada ponto para longe do centro de massa dos vizinhos.
+
+    Os pontos são agrupados numa grade de lado ``radius``; os vizinhos de
+    um ponto são os das 3x3 células em volta (somas por célula com
+    ``bincount``), então o custo é O(n) sem pares explícitos. A força vai
+    até 1 e cresce com a lotação (satura em ``crowd`` vizinhos).
+    """
+    n = xs.size
+    if n < 2:
+        return np.zeros(n), np.zeros(n)
+
+    col = (xs // radius).astype(np.intp)
+    row = (ys // radius).astype(np.intp)
+    col -= col.min()
+    row -= row.min()
+
+    # Grade com uma célula de borda para as somas 3x3 não saírem dos limites
+    cols = int(col.max()) + 3
+    rows = int(row.max()) + 3
+    index = (row + 1) * cols + (col + 1)
+
+    def neighbourhood(weights: np.ndarray | None) -> np.ndarray:
+        grid = np.bincount(index, weights=weights, minlength=rows * cols)
+        grid = grid.reshape(rows, cols).astype(float)
+        total = np.zeros((rows - 2, cols - 2))
+        for dr in range(3):
+            for dc in range(3):
+                total += grid[dr:dr + rows - 2, dc:dc + cols - 2]
+        return total[row, col]
+
+    others = neighbourhood(None) - 1
+    has_others = others > 0
+    safe = np.maximum(others, 1)
+    center_x = (neighbourhood(xs) - xs) / safe
+    center_y = (neighbourhood(ys) - ys) / safe
+
+    strength = np.minimum(others, crowd) / crowd / radius
+    push_x = np.where(has_others, (xs - center_x) * strength, 0.0)
+    push_y = np.where(has_others, (ys - center_y) * strength, 0.0)
+    return np.clip(push_x, -1, 1), np.clip(push_y, -1, 1)
@@ -10,50 +10,138 @@ from .Const import SCREEN_WIDTH, SCREEN_HEIGHT
 
 
 class ParallaxLayer:
-    """Uma camada de fundo que se move horizontalmente (parallax)."""
+    """
+    Uma camada de fundo que se move horizontalmente (parallax).
+
+    A arte é convertida para o formato do display (sem alpha se a camada
+    for opaca) e fatiada em colunas de ``TILE_WIDTH``; o ``draw`` só envia
+    as colunas que caem na tela, num ``blits``. Uma faixa (``y``, altura
+    da imagem) pode cobrir só parte da tela.
+
+    Posição, velocidade e ``source`` são lógicas; ``image`` e as colunas
+    ficam na resolução de desenho (``scale``, ver ``RenderTarget``).
+    """
+
+    TILE_WIDTH = 128
 
     def __init__(
         self,
         image: pygame.Surface,
         speed: float,
+        y: int = 0,
+        opaque: bool = True,
+        scale: float = 1.0,
     ) -> None:
         # Garante que a imagem tenha o tamanho da tela ou maior em largura
-        self.image = pygame.transform.smoothscale(
-            image,
-            (max(SCREEN_WIDTH, image.get_width()), SCREEN_HEIGHT),
-        )
-        self.speed = speed
+        size = self.layer_size(image.get_size(), image.get_height())
+        if image.get_size() != size:
+            image = pygame.transform.smoothscale(image, size)
+        self.source = image
+        if scale != 1:
+            image = pygame.transform.smoothscale(
+                image, (round(size[0] * scale), max(1, round(size[1] * scale)))
+            )
+        self.image = image.convert() if opaque else image.convert_alpha()
+        if scale == 1:
+            self.source = self.image
+        self.speed = speed  # px/s
+        self.y = y
+        self.top = round(y * scale)
+        self.opaque = opaque
+        self.scale = scale
         self.x = 0.0
+        self.prev_x = 0.0
+
+        width, height = self.image.get_size()
+        self.tiles = [
+            self.image.subsurface((x, 0, min(self.TILE_WIDTH, width - x), height))
+            for x in range(0, width, self.TILE_WIDTH)
+        ]
+
+    @staticmethod
+    def layer_size(image_size: tuple[int, int], height: int = SCREEN_HEIGHT) -> tuple[int, int]:
+        """Tamanho final da camada para uma imagem de ``image_size``."""
+        return max(SCREEN_WIDTH, image_size[0]), height
 
-    def update(self) -> None:
-        self.x -= self.speed
-        width = self.image.get_width()
+    def covers_screen(self) -> bool:
+        """Opaca e da altura da tela: esconde tudo o que estiver atrás."""
+        return self.opaque and self.y <= 0 and self.y + self.source.get_height() >= SCREEN_HEIGHT
+
+    def update(self, dt: float) -> None:
+        self.prev_x = self.x
+        self.x -= self.speed * dt / 1000
+        width = self.source.get_width()
         if self.x <= -width:
             self.x += width
+            self.prev_x += width
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
+        x = int((self.prev_x + (self.x - self.prev_x) * alpha) * self.scale)
+        x = -(-x % self.image.get_width())  # em (-largura, 0]
+        tiles = self.tiles
+        tile_width = self.TILE_WIDTH
+        screen_width = screen.get_width()
 
-    def draw(self, screen: pygame.Surface) -> None:
-        width = self.image.get_width()
-        screen.blit(self.image, (int(self.x), 0))
-        screen.blit(self.image, (int(self.x) + width, 0))
+        # Primeira coluna visível; a partir dela, dá a volta na imagem
+        index = -x // tile_width
+        left = x + index * tile_width
+        visible = []
+        while left < screen_width:
+            tile = tiles[index]
+            visible.append((tile, (left, self.top)))
+            left += tile.get_width()
+            index += 1
+            if index == len(tiles):
+                index = 0
+        screen.blits(visible, doreturn=False)
 
 
 class ParallaxManager:
-    """Controla múltiplas camadas de parallax."""
+    """
+    Controla múltiplas camadas de parallax, de trás para frente.
 
-    def __init__(self, base_image: pygame.Surface) -> None:
-        # Duas camadas com velocidades diferentes usando a mesma arte
-        darker = base_image.copy()
-        darker.fill((40, 40, 40), special_flags=pygame.BLEND_RGB_SUB)
+    Na montagem, as camadas escondidas por uma camada opaca de tela
+    inteira são descartadas e uma camada sobre outra opaca com a mesma
+    velocidade e largura é composta nela: o custo por quadro depende do que
+    aparece na tela, não de quantas camadas a pilha declara.
+    """
 
-        self.layers: list[ParallaxLayer] = [
-            ParallaxLayer(darker, speed=0.5),   # fundo distante
-            ParallaxLayer(base_image, speed=1.5),  # frente
-        ]
+    def __init__(self, layers: list[ParallaxLayer]) -> None:
+        # Nada atrás da última camada que cobre a tela aparece
+        first = 0
+        for i, layer in enumerate(layers):
+            if layer.covers_screen():
+                first = i
+        self.layers: list[ParallaxLayer] = []
+        for layer in layers[first:]:
+            below = self.layers[-1] if self.layers else None
+            if below is not None and self.can_merge(below, layer):
+                self.layers[-1] = self.merge(below, layer)
+            else:
+                self.layers.append(layer)
+
+    @staticmethod
+    def can_merge(below: ParallaxLayer, above: ParallaxLayer) -> bool:
+        # Compor sobre uma camada com transparência não daria o mesmo resultado
+        return (
+            below.opaque
+            and below.speed == above.speed
+            and below.source.get_width() == above.source.get_width()
+            and below.y <= above.y
+            and above.y + above.source.get_height() <= below.y + below.source.get_height()
+        )
+
+    @staticmethod
+    def merge(below: ParallaxLayer, above: ParallaxLayer) -> ParallaxLayer:
+        """Compõe ``above`` sobre ``below`` numa camada só (as duas rolam juntas)."""
+        image = below.source.copy()
+        image.blit(above.source, (0, above.y - below.y))
+        return ParallaxLayer(image, below.speed, below.y, below.opaque, below.scale)
 
-    def update(self) -> None:
+    def update(self, dt: float) -> None:
         for layer in self.layers:
-            layer.update()
+            layer.update(dt)
 
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0) -> None:
         for layer in self.layers:
-            layer.draw(screen)
+            layer.draw(screen, alpha)
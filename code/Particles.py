@@ -0,0 +1,167 @@
+"""
+Partículas (sangue, estilhaços) em buffers circulares NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pygame
+
+from .Const import PARTICLE_BUDGET
+
+# Efeitos por tipo de impacto: quantidade, cor, velocidade (px/s) e vida (ms)
+PRESETS = {
+    "zombie": {"count": 24, "color": (150, 10, 10), "speed": (80, 320), "life": (250, 650)},
+    "boss": {"count": 10, "color": (90, 160, 40), "speed": (60, 240), "life": (200, 450)},
+    "brain": {"count": 16, "color": (230, 130, 160), "speed": (60, 260), "life": (300, 600)},
+}
+
+
+class ParticleSystem:
+    """
+    Partículas com capacidade fixa, atualizadas em bloco.
+
+    Posição, velocidade e vida ficam em arrays de tamanho ``capacity``
+    usados como buffer circular: emitir escreve a partir de ``head`` e,
+    com o buffer cheio, sobrescreve as mais antigas. Sob carga, cada
+    emissão é reduzida na proporção do buffer já ocupado, então efeitos
+    simultâneos ficam mais ralos em vez de derrubar o quadro.
+
+    O desenho usa sprites pequenos pré-renderizados por cor e nível de
+    transparência, entregues de uma vez ao ``SpriteBatch``.
+    """
+
+    SIZE = 4
+    FADE_LEVELS = 4
+    GRAVITY = 900.0  # px/s²
+
+    def __init__(self, capacity: int = PARTICLE_BUDGET) -> None:
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.intp)
+        self.head = 0
+        self.alive = 0
+
+        # Efeitos visuais apenas: RNG próprio, fora do determinismo da partida
+        self.rng = np.random.default_rng()
+
+        # Paleta: uma linha de sprites (opaco -> transparente) por cor
+        self.palette: list[tuple[int, int, int]] = []
+        self.sprites: list[list[pygame.Surface]] = []
+        for preset in PRESETS.values():
+            self._color_index(preset["color"])
+
+    def _color_index(self, color: tuple[int, int, int]) -> int:
+        if color in self.palette:
+            return self.palette.index(color)
+        row = []
+        for level in range(self.FADE_LEVELS):
+            sprite = pygame.Surface((self.SIZE, self.SIZE))
+            sprite.fill(color)
+            sprite.set_alpha(255 * (self.FADE_LEVELS - level) // self.FADE_LEVELS)
+            row.append(sprite)
+        self.palette.append(color)
+        self.sprites.append(row)
+        return len(self.palette) - 1
+
+    def clear(self) -> None:
+        self.life[:] = 0
+        self.alive = 0
+
+    # ========= Emissão ========= #
+
+    def burst(self, kind: str, x: float, y: float) -> int:
+        """Emite o efeito ``PRESETS[kind]`` no ponto dado."""
+        preset = PRESETS[kind]
+        return self.emit(
+            x,
+            y,
+            preset["count"],
+            preset["color"],
+            preset["speed"],
+            preset["life"],
+        )
+
+    def emit(
+        self,
+        x: float,
+        y: float,
+        count: int,
+        color: tuple[int, int, int],
+        speed: tuple[float, float],
+        life: tuple[float, float],
+    ) -> int:
+        """Emite até ``count`` partículas; retorna quantas saíram (após o orçamento)."""
+        load = self.alive / self.capacity
+        count = min(int(count * (1.0 - load)) or 1, self.capacity)
+
+        rng = self.rng
+        index = (self.head + np.arange(count)) % self.capacity
+        self.head = (self.head + count) % self.capacity
+
+        angle = rng.uniform(0, 2 * np.pi, count)
+        velocity = rng.uniform(speed[0], speed[1], count)
+        lifetime = rng.uniform(life[0], life[1], count)
+
+        self.x[index] = x
+        self.y[index] = y
+        self.vx[index] = np.cos(angle) * velocity
+        self.vy[index] = np.sin(angle) * velocity - velocity * 0.5  # jato para cima
+        self.life[index] = lifetime
+        self.max_life[index] = lifetime
+        self.color[index] = self._color_index(color)
+        self.alive = int(np.count_nonzero(self.life > 0))
+        return count
+
+    # ========= Simulação ========= #
+
+    def update(self, dt: float) -> None:
+        if self.alive == 0:
+            return
+        seconds = dt / 1000
+        self.vy += self.GRAVITY * seconds
+        self.x += self.vx * seconds
+        self.y += self.vy * seconds
+        self.life -= dt
+        self.alive = int(np.count_nonzero(self.life > 0))
+
+    # ========= Desenho ========= #
+
+    def draw(self, batch, layer: int) -> None:
+        """Entrega as partículas vivas e visíveis ao ``SpriteBatch``, por sprite."""
+        if self.alive == 0:
+            return
+        x = self.x
+        y = self.y
+        live = np.flatnonzero(
+            (self.life > 0)
+            & (x > -self.SIZE) & (x < batch.width)
+            & (y > -self.SIZE) & (y < batch.height)
+        )
+        if live.size == 0:
+            return
+        xs = (x[live] * batch.scale).astype(int)
+        ys = (y[live] * batch.scale).astype(int)
+        fade = ((1.0 - self.life[live] / self.max_life[live]) * self.FADE_LEVELS)
+        fade = np.minimum(fade.astype(np.intp), self.FADE_LEVELS - 1)
+        sprite_id = self.color[live] * self.FADE_LEVELS + fade
+
+        order = np.argsort(sprite_id, kind="stable")
+        sprite_id = sprite_id[order]
+        xs = xs[order].tolist()
+        ys = ys[order].tolist()
+        bounds = np.flatnonzero(np.diff(sprite_id)) + 1
+        starts = [0, *bounds.tolist()]
+        ends = [*bounds.tolist(), len(xs)]
+        for start, end in zip(starts, ends):
+            color, level = divmod(int(sprite_id[start]), self.FADE_LEVELS)
+            batch.add_many(
+                self.sprites[color][level],
+                zip(xs[start:end], ys[start:end]),
+                layer,
+            )
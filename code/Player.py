@@ -6,65 +6,98 @@ from __future__ import annotations
 
 import pygame
 
-from .Const import SCREEN_HEIGHT
+from .Const import SCREEN_WIDTH, SCREEN_HEIGHT, LAYER_PLAYER
+from .Animation import AnimationSet
 from .Bullet import Bullet
+from .Entity import Entity
+from .InputState import InputState
+from .Pool import Pool
 
 
-class Player(pygame.sprite.Sprite):
+class Player(Entity):
     """Personagem do jogador (sobrevivente)."""
 
+    __slots__ = (
+        "base_image", "speed", "shot_cooldown_ms", "last_shot_time",
+        "controls", "animation", "anim_time",
+    )
+
+    layer = LAYER_PLAYER
+
     def __init__(
         self,
         image_surface: pygame.Surface,
-        speed: int = 6,
+        speed: float = 360.0,
         shot_cooldown_ms: int = 220,
+        animation: AnimationSet | None = None,
     ) -> None:
-        super().__init__()
-        self.image = image_surface
-        self.rect = self.image.get_rect()
+        super().__init__(image_surface)
+        self.base_image = image_surface
         self.rect.midleft = (40, SCREEN_HEIGHT // 2)
+        self.place(self.rect.x, self.rect.y)
 
-        self.speed = speed
+        self.speed = speed  # px/s
         self.shot_cooldown_ms = shot_cooldown_ms
-        self.last_shot_time = 0
+        self.last_shot_time = -shot_cooldown_ms
+
+        # Entrada do tick atual (definida pela simulação antes do update)
+        self.controls = InputState()
+
+        # Caminhada (quadros pré-assados; parado usa a imagem base)
+        self.animation = animation
+        self.anim_time = 0.0
 
-    def update(self) -> None:
-        keys = pygame.key.get_pressed()
+    def update(self, dt: float) -> None:
+        controls = self.controls
+        step = self.speed * dt / 1000
+        self.save_previous()
 
         # Cima
-        if keys[pygame.K_UP]:
-            self.rect.y -= self.speed
+        if controls.up:
+            self.y -= step
 
         # Baixo
-        if keys[pygame.K_DOWN]:
-            self.rect.y += self.speed
+        if controls.down:
+            self.y += step
 
         # Esquerda
-        if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
+        if controls.left:
+            self.x -= step
 
         # Direita
-        if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
+        if controls.right:
+            self.x += step
 
         # Mantém dentro da tela
-        screen = pygame.display.get_surface()
-        if screen:
-            width, height = screen.get_size()
-            self.rect.left = max(0, self.rect.left)
-            self.rect.top = max(0, self.rect.top)
-            self.rect.right = min(width, self.rect.right)
-            self.rect.bottom = min(height, self.rect.bottom)
-
-    def can_shoot(self) -> bool:
-        current_time = pygame.time.get_ticks()
-        return current_time - self.last_shot_time >= self.shot_cooldown_ms
-
-    def shoot(self, bullet_image: pygame.Surface) -> Bullet | None:
-        """Cria um projétil, se o cooldown permitir."""
-        if not self.can_shoot():
+        self.x = min(max(0.0, self.x), SCREEN_WIDTH - self.rect.width)
+        self.y = min(max(0.0, self.y), SCREEN_HEIGHT - self.rect.height)
+        self.sync_rect()
+        self.animate(dt)
+
+    def animate(self, dt: float) -> None:
+        # O tempo avança mesmo sem quadros (ver SimWorker: o desenho pode
+        # estar em outro processo)
+        controls = self.controls
+        if controls.up or controls.down or controls.left or controls.right:
+            self.anim_time += dt
+        else:
+            self.anim_time = 0.0
+        if self.animation is None:
+            return
+        if self.anim_time > 0:
+            self.image = self.animation.frame("walk", self.anim_time)
+        else:
+            self.image = self.base_image
+
+    def can_shoot(self, now_ms: float) -> bool:
+        return now_ms - self.last_shot_time >= self.shot_cooldown_ms
+
+    def shoot(self, bullet_pool: Pool, now_ms: float) -> Bullet | None:
+        """Tira um projétil do pool, se o cooldown permitir."""
+        if not self.can_shoot(now_ms):
             return None
 
-        bullet = Bullet(bullet_image, self.rect.midright)
-        self.last_shot_time = pygame.time.get_ticks()
+        bullet = bullet_pool.acquire()
+        bullet.launch(self.rect.midright)
+        self.last_shot_time = now_ms
         return bullet
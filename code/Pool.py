@@ -0,0 +1,65 @@
+"""
+Pool de entidades reaproveitáveis (zumbis, tiros, cérebros).
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from .Entity import Entity
+from .Registry import Registry
+
+
+class Pool:
+    """
+    Guarda instâncias liberadas para reuso em vez de criar novas.
+
+    ``acquire`` devolve uma instância livre (ou cria uma) já adicionada ao
+    registro; quem chama reinicializa a posição. ``release`` tira do
+    registro e devolve ao pool. Entidades com ``pool`` definido chamam
+    ``release`` no próprio ``kill()``, então o código de colisão continua igual.
+    """
+
+    def __init__(self, factory: Callable[[], Entity]) -> None:
+        """
+        Args:
+            factory: cria uma instância nova quando o pool está vazio.
+        """
+        self.factory = factory
+        self.free: list[Entity] = []
+
+        # Estatísticas (novas instâncias vs. reaproveitadas)
+        self.created = 0
+        self.reused = 0
+
+    def prewarm(self, amount: int) -> None:
+        """Cria ``amount`` instâncias livres antecipadamente."""
+        for _ in range(amount):
+            obj = self._create()
+            obj.pooled = True
+            self.free.append(obj)
+
+    def _create(self) -> Entity:
+        obj = self.factory()
+        obj.pool = self
+        self.created += 1
+        return obj
+
+    def acquire(self, registry: Registry | None = None) -> Entity:
+        if self.free:
+            obj = self.free.pop()
+            self.reused += 1
+        else:
+            obj = self._create()
+        obj.pooled = False
+        if registry is not None:
+            registry.add(obj)
+        return obj
+
+    def release(self, obj: Entity) -> None:
+        if obj.pooled:
+            return
+        obj.pooled = True
+        if obj.registry is not None:
+            obj.registry.remove(obj)
+        self.free.append(obj)
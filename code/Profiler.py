@@ -0,0 +1,220 @@
+"""
+Profiler por quadro: tempo de cada fase, entidades e alocações.
+"""
+
+from __future__ import annotations
+
+import csv
+import gc
+import json
+import os
+import sys
+import time
+from collections import deque
+
+import pygame
+
+
+class _Section:
+    """Cronômetro reutilizável de uma fase (usado com ``with``)."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: Profiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        elapsed = (time.perf_counter() - self.start) * 1000
+        phases = self.profiler.phases
+        phases[self.name] = phases.get(self.name, 0.0) + elapsed
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    """
+    Mede cada quadro do loop principal.
+
+    Uso::
+
+        profiler.begin_frame()
+        with profiler.section("update"):
+            ...
+        profiler.end_frame({"zombies": 40})
+
+    Guarda os últimos ``history`` quadros (tempos em ms por fase, contagem de
+    entidades, blocos alocados e coletas do GC) para o overlay e para
+    exportação em CSV/JSON. Desligado, ``section`` não mede nada.
+    """
+
+    def __init__(self, enabled: bool = True, history: int = 600) -> None:
+        self.enabled = enabled
+        self.visible = False
+        self.frames: deque[dict] = deque(maxlen=history)
+
+        self.phases: dict[str, float] = {}
+        self.marks: list[str] = []
+        self.frame_index = 0
+        self.sections: dict[str, _Section] = {}
+
+        self._frame_start = 0.0
+        self._blocks_start = 0
+        self._gc_runs = 0
+        self._gc_start = 0
+
+        # Overlay só é re-renderizado algumas vezes por segundo
+        self.overlay_interval_ms = 250
+        self._overlay: pygame.Surface | None = None
+        self._overlay_time = 0.0
+
+        if enabled:
+            gc.callbacks.append(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._gc_runs += 1
+
+    # ========= Coleta ========= #
+
+    def section(self, name: str):
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = _Section(self, name)
+        return section
+
+    def mark(self, label: str) -> None:
+        """Registra um acontecimento no quadro atual (ex.: level up)."""
+        if self.enabled:
+            self.marks.append(label)
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self.phases = {}
+        self.marks = []
+        self._gc_start = self._gc_runs
+        self._blocks_start = sys.getallocatedblocks()
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self, counts: dict[str, int] | None = None) -> None:
+        if not self.enabled:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000
+        self.frames.append({
+            "frame": self.frame_index,
+            "frame_ms": frame_ms,
+            "phases": self.phases,
+            "counts": dict(counts or {}),
+            "alloc_blocks": sys.getallocatedblocks() - self._blocks_start,
+            "gc_runs": self._gc_runs - self._gc_start,
+            "marks": self.marks,
+        })
+        self.frame_index += 1
+
+    # ========= Estatísticas ========= #
+
+    def percentile(self, p: float, key: str = "frame_ms") -> float:
+        values = sorted(frame[key] for frame in self.frames)
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+        return values[index]
+
+    def phase_averages(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        for frame in self.frames:
+            for name, ms in frame["phases"].items():
+                totals[name] = totals.get(name, 0.0) + ms
+        count = max(1, len(self.frames))
+        return {name: total / count for name, total in totals.items()}
+
+    # ========= Exportação ========= #
+
+    def export(self, path: str) -> None:
+        """Salva os quadros em ``.json`` (trace completo) ou ``.csv`` (tabela)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        frames = list(self.frames)
+
+        if path.endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"frames": frames}, f)
+            return
+
+        phase_names = sorted({n for fr in frames for n in fr["phases"]})
+        count_names = sorted({n for fr in frames for n in fr["counts"]})
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["frame", "frame_ms", "alloc_blocks", "gc_runs", "marks"]
+                + phase_names
+                + count_names
+            )
+            for fr in frames:
+                writer.writerow(
+                    [fr["frame"], f"{fr['frame_ms']:.4f}", fr["alloc_blocks"],
+                     fr["gc_runs"], "|".join(fr["marks"])]
+                    + [f"{fr['phases'].get(n, 0.0):.4f}" for n in phase_names]
+                    + [fr["counts"].get(n, 0) for n in count_names]
+                )
+
+    # ========= Overlay ========= #
+
+    def overlay(self, font: pygame.font.Font) -> pygame.Surface | None:
+        """Painel atual (o mesmo objeto até ser refeito); None se escondido."""
+        if not self.visible or not self.frames:
+            return None
+
+        now = time.perf_counter() * 1000
+        if self._overlay is None or now - self._overlay_time >= self.overlay_interval_ms:
+            self._overlay = self._render_overlay(font)
+            self._overlay_time = now
+        return self._overlay
+
+    @staticmethod
+    def overlay_pos(screen_size: tuple[int, int], panel: pygame.Surface) -> tuple[int, int]:
+        return screen_size[0] - panel.get_width() - 10, 60
+
+    def draw_overlay(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
+        panel = self.overlay(font)
+        if panel is not None:
+            screen.blit(panel, self.overlay_pos(screen.get_size(), panel))
+
+    def _render_overlay(self, font: pygame.font.Font) -> pygame.Surface:
+        last = self.frames[-1]
+        lines = [
+            f"frame p50 {self.percentile(50):.2f} ms  p99 {self.percentile(99):.2f} ms",
+            f"alloc {last['alloc_blocks']:+d} blocos  gc {last['gc_runs']}",
+        ]
+        averages = sorted(self.phase_averages().items(), key=lambda kv: -kv[1])
+        lines += [f"{name:<22}{ms:7.3f} ms" for name, ms in averages]
+        lines += [f"{name:<22}{n:7d}" for name, n in last["counts"].items()]
+
+        surfaces = [font.render(line, True, (255, 255, 255)) for line in lines]
+        width = max(s.get_width() for s in surfaces) + 12
+        height = sum(s.get_height() for s in surfaces) + 12
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        y = 6
+        for surface in surfaces:
+            panel.blit(surface, (6, y))
+            y += surface.get_height()
+        return panel
@@ -0,0 +1,55 @@
+"""
+Registro único das entidades vivas, separadas por tipo.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, TypeVar
+
+from .Entity import Entity
+
+E = TypeVar("E", bound=Entity)
+
+
+class Registry:
+    """
+    Entidades vivas da partida, uma coleção por tipo.
+
+    Substitui o ``all_sprites`` + um grupo por tipo do ``pygame.sprite``:
+    cada entidade entra em um lugar só (o do seu tipo), adicionar e remover
+    são O(1) e a ordem de chegada se mantém (dict usado como conjunto
+    ordenado). ``all`` junta os tipos na ordem do construtor.
+    """
+
+    def __init__(self, kinds: Iterable[type[Entity]]) -> None:
+        self.kinds: dict[type[Entity], dict[Entity, None]] = {kind: {} for kind in kinds}
+
+    def add(self, entity: Entity) -> None:
+        self.kinds[type(entity)][entity] = None
+        entity.registry = self
+
+    def remove(self, entity: Entity) -> None:
+        self.kinds[type(entity)].pop(entity, None)
+        entity.registry = None
+
+    def clear(self) -> None:
+        for entities in self.kinds.values():
+            for entity in entities:
+                entity.registry = None
+            entities.clear()
+
+    def of(self, kind: type[E]) -> list[E]:
+        """Cópia da lista de um tipo (pode ser alterada enquanto se itera)."""
+        return list(self.kinds[kind])
+
+    def count(self, kind: type[Entity]) -> int:
+        return len(self.kinds[kind])
+
+    def all(self) -> list[Entity]:
+        entities: list[Entity] = []
+        for group in self.kinds.values():
+            entities.extend(group)
+        return entities
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.kinds.values())
@@ -0,0 +1,121 @@
+"""
+Alvo de desenho em resolução interna, ampliado para a janela uma vez por quadro.
+"""
+
+from __future__ import annotations
+
+import pygame
+
+from .Const import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    RENDER_SIZE,
+    WINDOW_SCALE,
+    UPSCALE_INTEGER,
+    UPSCALE_SCALE2X,
+)
+
+
+class RenderTarget:
+    """
+    Superfície onde o jogo desenha e a janela que a mostra.
+
+    A simulação e o layout usam coordenadas lógicas (``SCREEN_WIDTH`` x
+    ``SCREEN_HEIGHT``); o desenho sai na resolução interna ``size``
+    (``scale`` = interna / lógica, ex.: 0.5 em 480x270 corta o fill por
+    4) e ``present`` amplia o quadro para a janela ``window_scale`` vezes
+    maior: por vizinho mais próximo ou com ``scale2x`` (fatores 2, 4...).
+    Com ``window_scale`` 1, a superfície interna é a própria janela.
+    """
+
+    def __init__(
+        self,
+        size: tuple[int, int] = RENDER_SIZE,
+        window_scale: int = WINDOW_SCALE,
+        upscale: str = UPSCALE_INTEGER,
+    ) -> None:
+        width, height = size
+        if width * SCREEN_HEIGHT != height * SCREEN_WIDTH:
+            raise ValueError(
+                f"resolução {width}x{height} fora da proporção {SCREEN_WIDTH}:{SCREEN_HEIGHT}"
+            )
+        if window_scale < 1:
+            raise ValueError("window_scale precisa ser >= 1")
+        if upscale not in (UPSCALE_INTEGER, UPSCALE_SCALE2X):
+            raise ValueError(f"ampliação desconhecida: {upscale}")
+
+        self.size = (width, height)
+        self.scale = width / SCREEN_WIDTH
+        self.window_scale = window_scale
+        self.mode = upscale
+
+        self.window = pygame.display.set_mode((width * window_scale, height * window_scale))
+        if window_scale == 1:
+            self.surface = self.window
+        else:
+            self.surface = pygame.Surface(self.size).convert()
+
+        # scale2x só dobra; outros fatores (ou 2x sem pedir) vão por inteiro
+        self.doublings = 0
+        if upscale == UPSCALE_SCALE2X:
+            factor = window_scale
+            while factor > 1 and factor % 2 == 0:
+                factor //= 2
+                self.doublings += 1
+            if factor != 1:
+                self.doublings = 0
+        self.steps = [
+            pygame.Surface((width << i, height << i)).convert()
+            for i in range(1, self.doublings)
+        ]
+
+    # ========= Coordenadas ========= #
+
+    def length(self, value: float) -> int:
+        """Comprimento lógico em pixels da resolução interna."""
+        return round(value * self.scale)
+
+    def point(self, x: float, y: float) -> tuple[int, int]:
+        return round(x * self.scale), round(y * self.scale)
+
+    def image(self, surface: pygame.Surface) -> pygame.Surface:
+        """Cópia da arte (tamanho lógico) na resolução interna."""
+        if self.scale == 1:
+            return surface
+        w, h = surface.get_size()
+        return pygame.transform.smoothscale(
+            surface, (max(1, self.length(w)), max(1, self.length(h)))
+        )
+
+    # ========= Quadro ========= #
+
+    def upscale(self) -> None:
+        """Amplia o quadro da superfície interna para a janela."""
+        if self.surface is self.window:
+            return
+        if self.doublings:
+            source = self.surface
+            for step in self.steps:
+                pygame.transform.scale2x(source, step)
+                source = step
+            pygame.transform.scale2x(source, self.window)
+        else:
+            pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+
+    def flip(self, rects: list[pygame.Rect] | None = None) -> None:
+        """
+        Envia a janela ao display.
+
+        Args:
+            rects: só estas regiões (da resolução interna) mudaram; None
+                envia a tela toda.
+        """
+        if rects is None:
+            pygame.display.flip()
+        else:
+            k = self.window_scale
+            pygame.display.update([pygame.Rect(r.x * k, r.y * k, r.w * k, r.h * k) for r in rects])
+
+    def present(self, rects: list[pygame.Rect] | None = None) -> None:
+        self.upscale()
+        self.flip(rects)
@@ -0,0 +1,134 @@
+"""
+Gravação e reprodução de partidas (entrada por tick + semente).
+
+Como a simulação roda em ticks fixos e toda aleatoriedade sai do RNG da
+partida, a semente mais a entrada de cada tick reproduzem a partida bit a
+bit. O arquivo é pequeno: cabeçalho + pares (bits da entrada, repetições).
+
+Reproduzir sem janela, o mais rápido possível (benchmark)::
+
+    python -m code.Replay partida.zrr
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+import time
+
+from .InputState import InputState
+
+MAGIC = b"ZRRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBII")  # magic, versão, semente, total de ticks
+RUN = struct.Struct("<BB")  # bits da entrada, repetições (1-255)
+
+
+class InputRecorder:
+    """Acumula a entrada de cada tick de uma partida."""
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+        self.inputs = bytearray()
+
+    def record(self, controls: InputState) -> None:
+        self.inputs.append(controls.to_bits())
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(self.inputs)))
+            f.write(encode_runs(self.inputs))
+
+
+class ReplayPlayer:
+    """Devolve a entrada gravada, tick a tick."""
+
+    def __init__(self, seed: int, inputs: bytes) -> None:
+        self.seed = seed
+        self.inputs = inputs
+        self.position = 0
+
+        # Uma instância por combinação de teclas (no máximo 32)
+        self._states: dict[int, InputState] = {}
+
+    @classmethod
+    def load(cls, path: str) -> ReplayPlayer:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: não é um replay do Zombie Runner")
+        inputs = decode_runs(data[HEADER.size:])
+        if len(inputs) != ticks:
+            raise ValueError(f"{path}: replay truncado")
+        return cls(seed, inputs)
+
+    def finished(self) -> bool:
+        return self.position >= len(self.inputs)
+
+    def next(self) -> InputState:
+        """Entrada do próximo tick (sem teclas depois do fim)."""
+        bits = 0
+        if self.position < len(self.inputs):
+            bits = self.inputs[self.position]
+            self.position += 1
+        state = self._states.get(bits)
+        if state is None:
+            state = self._states[bits] = InputState.from_bits(bits)
+        return state
+
+    def script(self, tick: int) -> InputState:
+        """Adaptador para ``World.run_ticks`` (entrada pelo número do tick)."""
+        self.position = tick
+        return self.next()
+
+
+def encode_runs(inputs: bytes) -> bytes:
+    out = bytearray()
+    i = 0
+    n = len(inputs)
+    while i < n:
+        bits = inputs[i]
+        run = 1
+        while i + run < n and run < 255 and inputs[i + run] == bits:
+            run += 1
+        out += RUN.pack(bits, run)
+        i += run
+    return bytes(out)
+
+
+def decode_runs(data: bytes) -> bytes:
+    out = bytearray()
+    for bits, run in RUN.iter_unpack(data):
+        out += bytes((bits,)) * run
+    return bytes(out)
+
+
+def play_headless(path: str):
+    """Reproduz o replay sem janela; retorna o ``World`` no fim."""
+    from .World import World
+
+    replay = ReplayPlayer.load(path)
+    world = World.headless()
+    world.reset(seed=replay.seed)
+    world.run_ticks(len(replay.inputs), replay.script)
+    return world
+
+
+def main(argv: list[str]) -> None:
+    if not argv:
+        print("uso: python -m code.Replay ARQUIVO.zrr")
+        return
+
+    start = time.perf_counter()
+    world = play_headless(argv[0])
+    elapsed = time.perf_counter() - start
+
+    print(f"ticks:   {world.ticks} ({world.ticks / max(elapsed, 1e-9):.0f} ticks/s)")
+    print(f"estado:  {world.state}  level {world.difficulty_level}")
+    print(f"score:   {world.score.points}  kills {world.score.kills}  vidas {world.score.lives}")
+    print(f"digest:  {world.state_digest()}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,116 @@
+"""
+Agenda central de temporizadores (callbacks únicos e periódicos).
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Callable
+
+
+class Timer:
+    """Um agendamento; ``cancel`` o desativa sem mexer no heap."""
+
+    __slots__ = ("deadline", "interval", "callback", "args", "active", "scheduler")
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        deadline: float,
+        interval: float | None,
+        callback: Callable[..., None],
+        args: tuple,
+    ) -> None:
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.interval = interval  # None = dispara uma vez
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self) -> None:
+        self.active = False
+
+    def remaining(self) -> float:
+        """Tempo (ms) até disparar; 0 se já disparou ou foi cancelado."""
+        if not self.active:
+            return 0.0
+        return max(0.0, self.deadline - self.scheduler.now)
+
+
+class Scheduler:
+    """
+    Temporizadores de um relógio só, disparados pelo ``advance``.
+
+    Os prazos ficam num heap: a cada ``advance`` só saem os que venceram,
+    então o custo por tick não cresce com temporizadores ociosos. Cancelar
+    só marca o ``Timer`` (ele é descartado quando chega ao topo). O relógio
+    é o tempo simulado de quem chama ``advance`` (ms); ``pause`` congela
+    tudo até ``resume``.
+
+    Periódicos são reagendados a partir do prazo anterior, não do relógio:
+    o N-ésimo disparo cai em N intervalos exatos (a soma dos ``dt`` em
+    float só entra na comparação, com folga de ``EPSILON``).
+    """
+
+    EPSILON = 1e-6  # ms; erro de arredondamento da soma dos dt
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.paused = False
+        self.heap: list[tuple[float, int, Timer]] = []
+        self._order = itertools.count()  # desempate: ordem de agendamento
+
+    def clear(self) -> None:
+        for _, _, timer in self.heap:
+            timer.active = False
+        self.heap.clear()
+        self.now = 0.0
+        self.paused = False
+
+    def after(self, delay: float, callback: Callable[..., None], *args) -> Timer:
+        """Chama ``callback(*args)`` uma vez, daqui a ``delay`` ms."""
+        return self._push(Timer(self, self.now + delay, None, callback, args))
+
+    def every(self, interval: float, callback: Callable[..., None], *args) -> Timer:
+        """Chama ``callback(*args)`` a cada ``interval`` ms (o primeiro daqui a um intervalo)."""
+        if interval <= 0:
+            raise ValueError("interval precisa ser > 0")
+        return self._push(Timer(self, self.now + interval, interval, callback, args))
+
+    def _push(self, timer: Timer) -> Timer:
+        heapq.heappush(self.heap, (timer.deadline, next(self._order), timer))
+        return timer
+
+    def pause(self) -> None:
+        self.paused = True
+
+    def resume(self) -> None:
+        self.paused = False
+
+    def advance(self, dt: float) -> int:
+        """Avança o relógio e dispara os vencidos, em ordem; retorna quantos."""
+        if self.paused:
+            return 0
+        self.now += dt
+        fired = 0
+        heap = self.heap
+        due = self.now + self.EPSILON
+        while heap and heap[0][0] <= due:
+            _, _, timer = heapq.heappop(heap)
+            if not timer.active:
+                continue
+            if timer.interval is None:
+                timer.active = False
+            else:
+                # Periódico: reagenda a partir do prazo anterior; se um
+                # dt grande pulou vários prazos, dispara de novo neste laço
+                timer.deadline += timer.interval
+                self._push(timer)
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
+
+    def __len__(self) -> int:
+        return sum(1 for _, _, timer in self.heap if timer.active)
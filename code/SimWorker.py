@@ -0,0 +1,368 @@
+"""
+Simulação em outro processo, publicada em snapshots na memória compartilhada.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import random
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from .Const import (
+    TICK_MS,
+    STATE_PLAYING,
+    STATE_GAME_OVER,
+    STATE_GAME_WIN,
+    EVENT_SHOOT,
+    EVENT_HIT,
+    EVENT_LEVEL_UP,
+    SNAPSHOT_ZOMBIES,
+    SNAPSHOT_ENTITIES,
+    SNAPSHOT_EVENTS,
+    SNAPSHOT_IMPACTS,
+)
+from .Animation import AnimationSet
+from .BossZombie import BossZombie
+from .Brain import Brain
+from .Bullet import Bullet
+from .Horde import Horde
+from .InputState import InputState
+from .Player import Player
+from .Profiler import Profiler
+from .Score import Score
+
+# Códigos numéricos gravados no snapshot
+STATES = (STATE_PLAYING, STATE_GAME_OVER, STATE_GAME_WIN)
+EVENTS = (EVENT_SHOOT, EVENT_HIT, EVENT_LEVEL_UP)
+IMPACTS = ("zombie", "boss", "brain")
+KINDS = (Player, Bullet, BossZombie, Brain)
+PLAYER, BULLET, BOSS, BRAIN = range(len(KINDS))
+
+# Segundos sem resposta antes de conferir se o processo ainda existe
+WAIT_TIMEOUT = 1.0
+
+
+class Snapshot:
+    """
+    Um slot do buffer duplo: arrays NumPy sobre a memória compartilhada.
+
+    Tudo é float64 para caber num bloco só. ``header`` guarda o estado do
+    HUD e os tamanhos usados de cada tabela; as tabelas têm capacidade
+    fixa (o excedente não é publicado).
+    """
+
+    HEADER = (
+        "tick", "time_ms", "state", "points", "kills", "lives", "level",
+        "boss_due", "horde_time", "zombies", "entities", "events", "impacts",
+        "candidate_pairs", "naive_pairs",
+    )
+    ZOMBIE_COLUMNS = ("x", "y", "prev_x", "prev_y", "phase", "near")
+    ENTITY_COLUMNS = ("kind", "x", "y", "prev_x", "prev_y", "anim_time", "flash")
+
+    SHAPES = (
+        ("header", (len(HEADER),)),
+        ("zombies", (len(ZOMBIE_COLUMNS), SNAPSHOT_ZOMBIES)),
+        ("entities", (SNAPSHOT_ENTITIES, len(ENTITY_COLUMNS))),
+        ("events", (SNAPSHOT_EVENTS,)),
+        ("impacts", (SNAPSHOT_IMPACTS, 3)),
+    )
+    SIZE = sum(int(np.prod(shape)) for _, shape in SHAPES)  # floats por slot
+
+    def __init__(self, buffer, slot: int) -> None:
+        offset = slot * self.SIZE * 8
+        for name, shape in self.SHAPES:
+            array = np.ndarray(shape, dtype=np.float64, buffer=buffer, offset=offset)
+            setattr(self, name, array)
+            offset += array.nbytes
+        self.fields = {name: i for i, name in enumerate(self.HEADER)}
+
+    def get(self, field: str) -> float:
+        return float(self.header[self.fields[field]])
+
+    def set(self, field: str, value: float) -> None:
+        self.header[self.fields[field]] = value
+
+    # ========= Escrita (processo da simulação) ========= #
+
+    def write(self, world) -> None:
+        score = world.score
+        self.set("tick", world.ticks)
+        self.set("time_ms", world.time_ms)
+        self.set("state", STATES.index(world.state))
+        self.set("points", score.points)
+        self.set("kills", score.kills)
+        self.set("lives", score.lives)
+        self.set("level", world.difficulty_level)
+        self.set("boss_due", world.boss_due())
+        self.set("candidate_pairs", world.candidate_pairs)
+        self.set("naive_pairs", world.naive_pairs)
+
+        horde = world.horde
+        n = min(horde.count, SNAPSHOT_ZOMBIES)
+        for row, name in enumerate(self.ZOMBIE_COLUMNS):
+            self.zombies[row, :n] = getattr(horde, name)[:n]
+        self.set("horde_time", horde.time_ms)
+        self.set("zombies", n)
+
+        rows = []
+        for sprite in world.all_sprites:
+            kind = KINDS.index(type(sprite))
+            anim_time = getattr(sprite, "anim_time", 0.0)
+            flash = getattr(sprite, "hit_timer", 0.0) > 0
+            rows.append((kind, sprite.x, sprite.y, sprite.prev_x, sprite.prev_y, anim_time, flash))
+        rows = rows[:SNAPSHOT_ENTITIES]
+        if rows:
+            self.entities[:len(rows)] = rows
+        self.set("entities", len(rows))
+
+        events = [EVENTS.index(event) for event in world.events[:SNAPSHOT_EVENTS]]
+        self.events[:len(events)] = events
+        self.set("events", len(events))
+
+        impacts = [
+            (IMPACTS.index(kind), x, y) for kind, x, y in world.impacts[:SNAPSHOT_IMPACTS]
+        ]
+        if impacts:
+            self.impacts[:len(impacts)] = impacts
+        self.set("impacts", len(impacts))
+
+
+def run_worker(name: str, seed: int | None, commands, ready) -> None:
+    """
+    Laço do processo da simulação.
+
+    Recebe ``("step", bits, dt)``, ``("reset", seed)`` ou ``("stop",)``;
+    depois de cada comando escreve o snapshot no slot que o processo
+    principal não está lendo e avisa qual é por ``ready``.
+    """
+    from .World import World
+
+    memory = shared_memory.SharedMemory(name=name)
+    slots = [Snapshot(memory.buf, 0), Snapshot(memory.buf, 1)]
+    world = World.headless(seed=seed)
+    current = 0
+    try:
+        while True:
+            command = commands.get()
+            if command[0] == "step":
+                world.step(InputState.from_bits(command[1]), command[2])
+            elif command[0] == "reset":
+                world.reset(seed=command[1])
+            else:
+                break
+            current ^= 1
+            slots[current].write(world)
+            ready.put(current)
+    finally:
+        del slots
+        memory.close()
+
+
+class SnapshotSprite:
+    """Entidade desenhável reconstruída de uma linha do snapshot."""
+
+    __slots__ = ("image", "layer", "x", "y", "prev_x", "prev_y")
+
+    def __init__(self, image, layer, x, y, prev_x, prev_y) -> None:
+        self.image = image
+        self.layer = layer
+        self.x = x
+        self.y = y
+        self.prev_x = prev_x
+        self.prev_y = prev_y
+
+    def draw_pos(self, alpha: float) -> tuple[int, int]:
+        return (
+            round(self.prev_x + (self.x - self.prev_x) * alpha),
+            round(self.prev_y + (self.y - self.prev_y) * alpha),
+        )
+
+
+class RemoteWorld:
+    """
+    Fachada de ``World`` para o ``Game``, com a simulação em outro processo.
+
+    ``step`` envia a entrada do próximo tick e devolve o resultado do tick
+    anterior: enquanto o processo da simulação calcula um tick, o processo
+    principal desenha o anterior (um tick de latência, em troca de
+    simulação e desenho em núcleos diferentes). Os snapshots ficam num
+    buffer duplo em memória compartilhada; como há no máximo um tick em
+    voo, o slot sendo escrito nunca é o que está sendo lido, sem locks.
+
+    Expõe só o que o ``Game`` usa: ``horde`` e ``all_sprites`` para o
+    desenho, ``score``/``state``/``difficulty_level`` para o HUD e
+    ``events``/``impacts`` do último tick recebido.
+    """
+
+    def __init__(
+        self,
+        player_image: pygame.Surface,
+        zombie_image: pygame.Surface,
+        bullet_image: pygame.Surface,
+        boss_image: pygame.Surface,
+        brain_image: pygame.Surface,
+        seed: int | None = None,
+        player_animation: AnimationSet | None = None,
+        zombie_animation: AnimationSet | None = None,
+        boss_animation: AnimationSet | None = None,
+        boss_hit_animation: AnimationSet | None = None,
+    ) -> None:
+        self.player_image = player_image
+        self.bullet_image = bullet_image
+        self.boss_image = boss_image
+        self.brain_image = brain_image
+        self.player_animation = player_animation
+        self.boss_animation = boss_animation
+        self.boss_hit_animation = boss_hit_animation
+
+        self.seed = seed
+        self.session_seed = seed
+        self.score = Score()
+        self.state = STATE_PLAYING
+        self.difficulty_level = 1
+        self.ticks = 0
+        self.time_ms = 0.0
+        self.events: list[str] = []
+        self.impacts: list[tuple[str, float, float]] = []
+        self.all_sprites: list[SnapshotSprite] = []
+        self.profiler = Profiler(enabled=False)
+
+        # Só desenho: os arrays apontam para o snapshot atual
+        self.horde = Horde(zombie_image)
+        self.horde.animation = zombie_animation
+
+        # "spawn" evita herdar o estado do SDL/pygame do processo principal
+        context = multiprocessing.get_context("spawn")
+        self.memory = shared_memory.SharedMemory(create=True, size=2 * Snapshot.SIZE * 8)
+        self.slots = [Snapshot(self.memory.buf, 0), Snapshot(self.memory.buf, 1)]
+        self.commands = context.Queue()
+        self.ready = context.Queue()
+        self.process = context.Process(
+            target=run_worker,
+            args=(self.memory.name, seed, self.commands, self.ready),
+            daemon=True,
+        )
+        self.process.start()
+        self.in_flight = False
+        self._boss_due = False
+        self._kinds: list[int] = []
+        self.candidate_pairs = 0
+        self.naive_pairs = 0
+
+    # ========= Comandos ========= #
+
+    def reset(self, seed: int | None = None) -> None:
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.randrange(2**32)
+        self.session_seed = seed & 0xFFFFFFFF
+        if self.in_flight:
+            self._receive()
+        self.commands.put(("reset", self.session_seed))
+        self._receive()
+        self.in_flight = False
+
+    def step(self, controls: InputState, dt: float = TICK_MS) -> list[str]:
+        """Envia o próximo tick e aplica o anterior; devolve os eventos dele."""
+        self.commands.put(("step", controls.to_bits(), dt))
+        if self.in_flight:
+            with self.profiler.section("sim.wait"):
+                self._receive()
+        else:
+            self.events = []
+            self.impacts = []
+        self.in_flight = True
+        return self.events
+
+    def boss_due(self) -> bool:
+        return self._boss_due
+
+    def entity_counts(self) -> dict[str, int]:
+        kinds = self._kinds
+        return {
+            "sprites": len(kinds),
+            "zombies": self.horde.count,
+            "bullets": kinds.count(BULLET),
+            "brains": kinds.count(BRAIN),
+            "bosses": kinds.count(BOSS),
+            "candidate_pairs": self.candidate_pairs,
+            "naive_pairs": self.naive_pairs,
+        }
+
+    def close(self) -> None:
+        """Encerra o processo e libera a memória compartilhada."""
+        if self.process.is_alive():
+            self.commands.put(("stop",))
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+        for name in Snapshot.ZOMBIE_COLUMNS:
+            setattr(self.horde, name, np.zeros(0))
+        self.horde.count = 0
+        self.slots = []
+        self.memory.close()
+        self.memory.unlink()
+
+    # ========= Snapshot ========= #
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                slot = self.ready.get(timeout=WAIT_TIMEOUT)
+                break
+            except queue.Empty:
+                if not self.process.is_alive():
+                    raise RuntimeError("processo da simulação encerrado")
+        self._apply(self.slots[slot])
+
+    def _apply(self, snapshot: Snapshot) -> None:
+        get = snapshot.get
+        self.ticks = int(get("tick"))
+        self.time_ms = get("time_ms")
+        self.state = STATES[int(get("state"))]
+        self.score.points = int(get("points"))
+        self.score.kills = int(get("kills"))
+        self.score.lives = int(get("lives"))
+        self.difficulty_level = int(get("level"))
+        self._boss_due = bool(get("boss_due"))
+        self.candidate_pairs = int(get("candidate_pairs"))
+        self.naive_pairs = int(get("naive_pairs"))
+
+        # Views (sem cópia): válidas até o próximo ``step``
+        horde = self.horde
+        for row, name in enumerate(Snapshot.ZOMBIE_COLUMNS):
+            setattr(horde, name, snapshot.zombies[row])
+        horde.count = int(get("zombies"))
+        horde.time_ms = get("horde_time")
+
+        rows = snapshot.entities[:int(get("entities"))].tolist()
+        self._kinds = [int(row[0]) for row in rows]
+        self.all_sprites = [self._sprite(*row) for row in rows]
+
+        self.events = [EVENTS[int(code)] for code in snapshot.events[:int(get("events"))]]
+        self.impacts = [
+            (IMPACTS[int(kind)], x, y)
+            for kind, x, y in snapshot.impacts[:int(get("impacts"))].tolist()
+        ]
+
+    def _sprite(self, kind, x, y, prev_x, prev_y, anim_time, flash) -> SnapshotSprite:
+        kind = int(kind)
+        if kind == PLAYER:
+            image = self.player_image
+            if self.player_animation is not None and anim_time > 0:
+                image = self.player_animation.frame("walk", anim_time)
+        elif kind == BULLET:
+            image = self.bullet_image
+        elif kind == BOSS:
+            image = self.boss_image
+            if self.boss_animation is not None:
+                animation = self.boss_animation
+                if flash and self.boss_hit_animation is not None:
+                    animation = self.boss_hit_animation
+                image = animation.frame("walk", anim_time)
+        else:
+            image = self.brain_image
+        return SnapshotSprite(image, KINDS[kind].layer, x, y, prev_x, prev_y)
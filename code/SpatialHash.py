@@ -0,0 +1,74 @@
+"""
+Broad phase de colisões com grade uniforme (spatial hash).
+"""
+
+from __future__ import annotations
+
+import pygame
+
+from .Entity import Entity
+
+
+class SpatialHash:
+    """
+    Grade uniforme que indexa sprites pelas células que o ``rect`` ocupa.
+
+    É reconstruída a cada tick (``rebuild``) e consultada com um retângulo;
+    só os sprites das células tocadas viram candidatos ao teste de ``rect``.
+    ``candidates`` conta os pares testados desde a última reconstrução.
+    """
+
+    def __init__(self, cell_size: int = 96) -> None:
+        """
+        Args:
+            cell_size: lado da célula em pixels (>= maior sprite comum).
+        """
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], list[Entity]] = {}
+        self.count = 0
+        self.candidates = 0
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.count = 0
+        self.candidates = 0
+
+    def rebuild(self, sprites) -> None:
+        """Reindexa todos os sprites (posições do tick atual)."""
+        self.clear()
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def insert(self, sprite: Entity) -> None:
+        size = self.cell_size
+        rect = sprite.rect
+        cells = self.cells
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [sprite]
+                else:
+                    bucket.append(sprite)
+        self.count += 1
+
+    def query(self, rect: pygame.Rect) -> list[Entity]:
+        """Sprites indexados cujo ``rect`` colide com ``rect``."""
+        size = self.cell_size
+        cells = self.cells
+        seen: set[int] = set()
+        found: list[Entity] = []
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for sprite in bucket:
+                    key = id(sprite)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    self.candidates += 1
+                    if rect.colliderect(sprite.rect):
+                        found.append(sprite)
+        return found
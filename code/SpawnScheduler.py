@@ -0,0 +1,72 @@
+"""
+Fila de spawns com orçamento por tick, alimentada pela tabela de ondas.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable
+
+from .Const import WAVES, SPAWN_BUDGET
+
+
+def wave_for(level: int) -> dict:
+    """Onda do ``level`` (da tabela ``WAVES`` ou da regra padrão)."""
+    wave = WAVES.get(level)
+    if wave is None:
+        wave = {"zombies": level, "speed_up": 18.0}
+    return wave
+
+
+class SpawnScheduler:
+    """
+    Distribui a criação de entidades ao longo dos ticks.
+
+    Level ups e reposições de zumbis mortos só entram na fila; a cada tick
+    ``run`` cria no máximo ``budget`` entidades, na ordem em que foram
+    pedidas. O orçamento é em entidades (não em tempo) para a simulação
+    continuar determinística nos replays.
+    """
+
+    ZOMBIE = "zombie"
+    BOSS = "boss"
+
+    def __init__(self, budget: int = SPAWN_BUDGET) -> None:
+        self.budget = budget
+        self.pending: deque[list] = deque()  # [tipo, quantidade]
+
+    def clear(self) -> None:
+        self.pending.clear()
+
+    def queue(self, kind: str, amount: int = 1) -> None:
+        if amount <= 0:
+            return
+        if self.pending and self.pending[-1][0] == kind:
+            self.pending[-1][1] += amount
+        else:
+            self.pending.append([kind, amount])
+
+    def queue_wave(self, wave: dict) -> None:
+        self.queue(self.ZOMBIE, wave.get("zombies", 0))
+        if wave.get("boss"):
+            self.queue(self.BOSS)
+
+    def __contains__(self, kind: str) -> bool:
+        return any(entry[0] == kind for entry in self.pending)
+
+    def __len__(self) -> int:
+        return sum(entry[1] for entry in self.pending)
+
+    def run(self, spawn: Callable[[str, int], None]) -> int:
+        """Chama ``spawn(tipo, quantidade)`` dentro do orçamento; retorna o total."""
+        left = self.budget
+        pending = self.pending
+        while pending and left > 0:
+            entry = pending[0]
+            amount = min(entry[1], left)
+            spawn(entry[0], amount)
+            left -= amount
+            entry[1] -= amount
+            if entry[1] == 0:
+                pending.popleft()
+        return self.budget - left
@@ -0,0 +1,182 @@
+"""
+Atlas de texturas e desenho em lote (uma chamada de ``blits`` por quadro).
+"""
+
+from __future__ import annotations
+
+from itertools import repeat
+
+import pygame
+
+
+def scaled(image: pygame.Surface, scale: float) -> pygame.Surface:
+    """``image`` com os lados multiplicados por ``scale`` (mínimo 1 px)."""
+    if scale == 1:
+        return image
+    w, h = image.get_size()
+    return pygame.transform.smoothscale(
+        image, (max(1, round(w * scale)), max(1, round(h * scale)))
+    )
+
+
+class TextureAtlas:
+    """
+    Empacota as imagens das sprites numa única superfície.
+
+    O empacotamento é por prateleiras (imagens mais altas primeiro). Cada
+    imagem original vira uma região do atlas, procurada pela própria
+    superfície: quem já guarda ``sprite.image`` não precisa saber do atlas.
+    Com ``scale`` != 1, as regiões guardam a imagem já reduzida (ou
+    ampliada) para a resolução de desenho (ver ``RenderTarget``).
+    """
+
+    PADDING = 1
+
+    def __init__(
+        self,
+        images: list[pygame.Surface],
+        max_width: int = 512,
+        scale: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            images: superfícies a empacotar (repetidas são ignoradas).
+            max_width: largura máxima do atlas em pixels.
+            scale: resolução de desenho / resolução lógica.
+        """
+        unique = list({id(image): image for image in images}.values())
+        unique.sort(key=lambda image: image.get_height(), reverse=True)
+
+        pad = self.PADDING
+        placements: list[tuple[pygame.Surface, pygame.Surface, pygame.Rect]] = []
+        x = y = shelf_height = width = 0
+        for original in unique:
+            image = scaled(original, scale)
+            w, h = image.get_size()
+            if x and x + w > max_width:
+                x = 0
+                y += shelf_height + pad
+                shelf_height = 0
+            placements.append((original, image, pygame.Rect(x, y, w, h)))
+            x += w + pad
+            width = max(width, x)
+            shelf_height = max(shelf_height, h)
+
+        self.surface = pygame.Surface(
+            (max(1, width), max(1, y + shelf_height)), pygame.SRCALPHA
+        )
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+
+        self.regions: dict[pygame.Surface, pygame.Rect] = {}
+        for original, image, rect in placements:
+            self.surface.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)
+            self.regions[original] = rect
+
+    def region(self, image: pygame.Surface) -> pygame.Rect | None:
+        return self.regions.get(image)
+
+
+class SpriteBatch:
+    """
+    Junta as chamadas de desenho do quadro e envia tudo num só ``blits``.
+
+    As chamadas são agrupadas por camada (menor primeiro) e, na ordem de
+    chegada, dentro de cada camada. Sprites com o retângulo todo fora da
+    tela são descartados antes de entrar no lote. Imagens presentes no
+    atlas são desenhadas a partir dele; as demais, diretamente.
+
+    Quem chama usa imagens e coordenadas lógicas; com ``scale`` != 1 (alvo
+    em outra resolução), ``add`` converte a posição e as imagens fora do
+    atlas são reduzidas uma vez e guardadas. ``add_many`` recebe posições
+    já convertidas (quem tem muitas faz isso em lote com ``scale``).
+    """
+
+    def __init__(
+        self,
+        target: pygame.Surface,
+        atlas: TextureAtlas | None = None,
+        scale: float = 1.0,
+    ) -> None:
+        self.target = target
+        self.atlas = atlas
+        self.scale = scale
+        # Tamanho lógico do alvo (para o recorte de quem chama)
+        self.width = round(target.get_width() / scale)
+        self.height = round(target.get_height() / scale)
+        self.layers: dict[int, list] = {}
+        self.scaled: dict[pygame.Surface, pygame.Surface] = {}
+
+        # Estatísticas do último flush
+        self.drawn = 0
+        self.culled = 0
+        self._culled = 0
+
+    def _source(self, image: pygame.Surface):
+        area = self.atlas.region(image) if self.atlas is not None else None
+        if area is not None:
+            return self.atlas.surface, area
+        if self.scale != 1:
+            image_scaled = self.scaled.get(image)
+            if image_scaled is None:
+                image_scaled = self.scaled[image] = scaled(image, self.scale)
+            # O smoothscale não leva o alpha da superfície, que pode mudar
+            # depois (fade das partículas): copiado a cada consulta
+            alpha = image.get_alpha()
+            if image_scaled.get_alpha() != alpha:
+                image_scaled.set_alpha(alpha)
+            return image_scaled, None
+        return image, None
+
+    def add(self, image: pygame.Surface, pos: tuple[int, int], layer: int = 0) -> None:
+        x, y = pos
+        w, h = image.get_size()
+        if x >= self.width or y >= self.height or x + w <= 0 or y + h <= 0:
+            self._culled += 1
+            return
+        if self.scale != 1:
+            pos = (round(x * self.scale), round(y * self.scale))
+        source, area = self._source(image)
+        calls = self.layers.get(layer)
+        if calls is None:
+            calls = self.layers[layer] = []
+        calls.append((source, pos, area))
+
+    def add_many(
+        self,
+        image: pygame.Surface,
+        positions,
+        layer: int = 0,
+        culled: int = 0,
+    ) -> None:
+        """Várias cópias da mesma imagem (posições já recortadas e na escala do alvo)."""
+        source, area = self._source(image)
+        calls = self.layers.get(layer)
+        if calls is None:
+            calls = self.layers[layer] = []
+        calls.extend(zip(repeat(source), positions, repeat(area)))
+        self._culled += culled
+
+    def add_sprites(self, sprites, alpha: float = 1.0) -> None:
+        """Entidades interpoladas, cada uma na sua ``layer``."""
+        for sprite in sprites:
+            self.add(sprite.image, sprite.draw_pos(alpha), sprite.layer)
+
+    def flush(self) -> int:
+        """Desenha tudo em ordem de camada; retorna quantos blits foram feitos."""
+        layers = self.layers
+        if len(layers) == 1:
+            calls = next(iter(layers.values()))
+        else:
+            calls = []
+            for layer in sorted(layers):
+                calls.extend(layers[layer])
+        if calls:
+            self.target.blits(calls, doreturn=False)
+
+        self.drawn = len(calls)
+        self.culled = self._culled
+        self._culled = 0
+        layers.clear()
+        return self.drawn
@@ -0,0 +1,90 @@
+"""
+Cache de superfícies de texto para HUD e menus.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+
+import pygame
+
+Color = tuple[int, int, int]
+
+
+class TextCache:
+    """
+    Memoriza ``Font.render`` por (fonte, texto, cor), com descarte LRU.
+
+    Textos que não mudam entre quadros (títulos, menus, rótulos do HUD)
+    passam a custar só um blit.
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        """
+        Args:
+            capacity: máximo de superfícies guardadas antes de descartar
+                as usadas há mais tempo.
+        """
+        self.capacity = capacity
+        self.surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+        # Quantas vezes Font.render foi realmente chamado
+        self.renders = 0
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: Color,
+    ) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        surface = font.render(text, True, color)
+        self.renders += 1
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        self.surfaces.clear()
+
+
+class DigitAtlas:
+    """
+    Desenha números colando glifos 0-9 renderizados uma única vez.
+
+    Feito para valores que mudam quase todo quadro (score, contadores),
+    que encheriam o ``TextCache`` com uma entrada por valor.
+    """
+
+    DIGITS = "0123456789-"
+
+    def __init__(self, font: pygame.font.Font, color: Color) -> None:
+        self.glyphs = {ch: font.render(ch, True, color) for ch in self.DIGITS}
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def size(self, value: int) -> tuple[int, int]:
+        width = sum(self.glyphs[ch].get_width() for ch in str(value))
+        return width, self.height
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        value: int,
+        pos: tuple[int, int],
+    ) -> pygame.Rect:
+        """Desenha ``value`` com o canto superior esquerdo em ``pos``."""
+        x, y = pos
+        glyphs = self.glyphs
+        blits = []
+        for ch in str(value):
+            glyph = glyphs[ch]
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        screen.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
@@ -0,0 +1,504 @@
+"""
+Simulação do jogo sem janela, áudio ou fila de eventos.
+
+O ``World`` concentra sprites, score, dificuldade e chefe. O ``Game`` só
+traduz teclado em ``InputState``, chama ``step`` e desenha/toca sons a partir
+do estado e dos eventos devolvidos. Isso permite rodar milhares de ticks por
+segundo em testes de carga e varreduras de balanceamento.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+from typing import Callable
+
+import numpy as np
+import pygame
+
+from .Animation import AnimationSet
+from .AssetCache import AssetCache
+from .BossZombie import BossZombie
+from .Brain import Brain
+from .Bullet import Bullet
+from .Collision import MaskCache, sprites_overlap
+from .Entity import Entity
+from .Const import (
+    TICK_MS,
+    STATE_PLAYING,
+    STATE_GAME_OVER,
+    STATE_GAME_WIN,
+    INITIAL_ZOMBIES,
+    BALANCE,
+    FLOW_CELL,
+    FLOW_REFRESH_TICKS,
+    PLAYER_SIZE,
+    ZOMBIE_SIZE,
+    BULLET_SIZE,
+    BOSS_SIZE,
+    BRAIN_SIZE,
+    PLAYER_IMG,
+    ZOMBIE_IMG,
+    BULLET_IMG,
+    BOSS_IMG,
+    BRAIN_IMG,
+    COLLIDE_MASK,
+    COLLISION_MODES,
+    EVENT_SHOOT,
+    EVENT_HIT,
+    EVENT_LEVEL_UP,
+)
+from .Horde import Horde
+from .InputState import InputState
+from .Navigation import FlowField
+from .Player import Player
+from .Pool import Pool
+from .Profiler import Profiler
+from .Registry import Registry
+from .Scheduler import Scheduler, Timer
+from .Score import Score
+from .SpawnScheduler import SpawnScheduler, wave_for
+from .SpatialHash import SpatialHash
+
+
+class World:
+    """Estado e regras de uma partida, avançado tick a tick."""
+
+    def __init__(
+        self,
+        player_image: pygame.Surface,
+        zombie_image: pygame.Surface,
+        bullet_image: pygame.Surface,
+        boss_image: pygame.Surface,
+        brain_image: pygame.Surface,
+        seed: int | None = None,
+        player_animation: AnimationSet | None = None,
+        zombie_animation: AnimationSet | None = None,
+        boss_animation: AnimationSet | None = None,
+        boss_hit_animation: AnimationSet | None = None,
+        collision_modes: dict[str, str] | None = None,
+        balance: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Args:
+            *_image: sprites já carregados (ou vazios, ver ``headless``).
+            seed: semente do RNG da partida; None sorteia uma a cada reset.
+            *_animation: quadros pré-assados (só visuais; None = imagem fixa).
+                ``boss_hit_animation`` é a do chefe já clareada por
+                ``BossZombie.HIT_TINT``, compartilhada por todos os chefes.
+            collision_modes: sobrescreve ``COLLISION_MODES`` por par
+                (``COLLIDE_RECT`` ou ``COLLIDE_MASK``).
+            balance: sobrescreve ``BALANCE`` (vidas, pontos, chefe, velocidades).
+        """
+        self.player_image = player_image
+        self.zombie_image = zombie_image
+        self.bullet_image = bullet_image
+        self.boss_image = boss_image
+        self.brain_image = brain_image
+        self.player_animation = player_animation
+        self.boss_animation = boss_animation
+        self.boss_hit_animation = boss_hit_animation
+
+        self.balance = {**BALANCE, **(balance or {})}
+        balance = self.balance
+
+        self.score = Score(balance["initial_lives"])
+
+        # Entidades vivas, uma coleção por tipo (ordem = ordem de update)
+        self.entities = Registry((Player, Bullet, BossZombie, Brain))
+
+        # Estado do chefe
+        self.boss_spawned = False
+        self.boss_dead = False
+
+        self.player: Player | None = None
+
+        # RNG da partida: toda aleatoriedade da simulação passa por ele
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Zumbis em arrays NumPy (movimento e colisões vetorizados)
+        self.horde = Horde(
+            self.zombie_image,
+            min_speed=balance["zombie_min_speed"],
+            max_speed=balance["zombie_max_speed"],
+        )
+        self.horde.animation = zombie_animation
+
+        # Campo de fluxo até o jogador, compartilhado por toda a horda
+        self.flow = FlowField(FLOW_CELL, FLOW_REFRESH_TICKS)
+
+        # Pools: tiros e cérebros são reaproveitados, não recriados
+        self.bullet_pool = Pool(lambda: Bullet(self.bullet_image, (0, 0)))
+        self.brain_pool = Pool(lambda: Brain(self.brain_image, 0, 0))
+        self.bullet_pool.prewarm(8)
+
+        # Spawns pendentes (ondas e reposições), diluídos ao longo dos ticks
+        self.spawner = SpawnScheduler()
+
+        # Temporizadores da partida (level up, ataque do chefe), no tempo
+        # simulado: param junto com o step
+        self.timers = Scheduler()
+
+        # ----- Dificuldade -----
+        self.difficulty_level = 1
+        self.difficulty_interval = balance["difficulty_interval"]
+        self.level_timer: Timer | None = None
+
+        # Broad phase das colisões (reconstruída a cada tick; os zumbis
+        # usam o sweep and prune da própria horda)
+        self.bullet_grid = SpatialHash()
+        self.brain_grid = SpatialHash()
+
+        # Narrow phase: máscaras por imagem de origem, usadas nos pares em
+        # modo máscara depois do teste de retângulo
+        self.collision_modes = {**COLLISION_MODES, **(collision_modes or {})}
+        self.masks = MaskCache()
+
+        # Pares candidatos testados no último tick vs. força bruta (n·m)
+        self.candidate_pairs = 0
+        self.naive_pairs = 0
+
+        # Instrumentação das fases do tick (o Game injeta o seu)
+        self.profiler = Profiler(enabled=False)
+
+        # Tempo simulado (ms) e eventos do último tick
+        self.time_ms = 0.0
+        self.ticks = 0
+        self.events: list[str] = []
+
+        # Pontos de impacto do último tick (tipo, x, y), para efeitos visuais
+        self.impacts: list[tuple[str, float, float]] = []
+        self.state = STATE_PLAYING
+        self.session_seed = seed
+
+    @classmethod
+    def headless(cls, seed: int | None = None, art: bool = True, **options) -> World:
+        """
+        Cria um mundo sem precisar de janela.
+
+        Args:
+            art: carrega a arte (sem ``convert``) só para as máscaras de
+                colisão baterem com as do jogo; sem ela, ou se o arquivo
+                faltar, usa superfícies vazias (colisão por retângulo).
+            options: demais argumentos de ``World``.
+        """
+        def image(path: str, size: tuple[int, int]) -> pygame.Surface:
+            if art:
+                try:
+                    return AssetCache.bake(path, size)
+                except (pygame.error, FileNotFoundError):
+                    pass
+            return pygame.Surface(size, pygame.SRCALPHA)
+
+        return cls(
+            image(PLAYER_IMG, PLAYER_SIZE),
+            image(ZOMBIE_IMG, ZOMBIE_SIZE),
+            image(BULLET_IMG, BULLET_SIZE),
+            image(BOSS_IMG, BOSS_SIZE),
+            image(BRAIN_IMG, BRAIN_SIZE),
+            seed=seed,
+            **options,
+        )
+
+    # ========= Setup ========= #
+
+    def reset(self, seed: int | None = None) -> None:
+        """
+        Reseta score, recria player e zumbis.
+
+        Args:
+            seed: semente desta partida; None usa a do construtor ou,
+                se não houver, sorteia uma (guardada em ``session_seed``).
+        """
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.randrange(2**32)
+        self.session_seed = seed & 0xFFFFFFFF  # cabe no cabeçalho do replay
+        self.rng.seed(self.session_seed)
+        self.horde.reset(self.session_seed)
+
+        self.score.reset()
+
+        # Devolve as entidades aos pools antes de esvaziar o registro
+        for entity in self.entities.all():
+            entity.kill()
+        self.entities.clear()
+
+        self.boss_spawned = False
+        self.boss_dead = False
+        self.spawner.clear()
+        self.flow.reset()
+
+        self.timers.clear()
+        self.difficulty_level = 1
+        self.level_timer = self.timers.every(self.difficulty_interval, self.level_up)
+
+        self.time_ms = 0.0
+        self.ticks = 0
+        self.events = []
+        self.impacts = []
+        self.state = STATE_PLAYING
+
+        self.player = Player(self.player_image, animation=self.player_animation)
+        self.entities.add(self.player)
+
+        # Cria vários zumbis iniciais
+        self.spawn_zombies(INITIAL_ZOMBIES)
+
+    def spawn_zombies(self, amount: int = 1) -> None:
+        self.horde.spawn(amount)
+
+    def spawn(self, kind: str, amount: int) -> None:
+        """Cria entidades pedidas ao ``spawner`` (chamado dentro do orçamento)."""
+        if kind == SpawnScheduler.ZOMBIE:
+            self.spawn_zombies(amount)
+        elif kind == SpawnScheduler.BOSS and not self.boss_spawned:
+            boss = BossZombie(
+                self.boss_image,
+                life=self.balance["boss_life"],
+                animation=self.boss_animation,
+                hit_animation=self.boss_hit_animation,
+                attack_interval=self.balance["boss_attack_interval"],
+                timers=self.timers,
+            )
+            self.entities.add(boss)
+            self.boss_spawned = True
+
+    # ========= Simulação ========= #
+
+    def run_ticks(
+        self,
+        ticks: int,
+        script: Callable[[int], InputState] | None = None,
+        dt: float = TICK_MS,
+    ) -> int:
+        """
+        Avança até ``ticks`` ticks com entrada roteirizada.
+
+        Args:
+            ticks: quantidade máxima de ticks.
+            script: função tick -> InputState (None = sem entrada).
+            dt: duração de cada tick em ms.
+
+        Returns:
+            Quantidade de ticks executados (para antes se a partida acabar).
+        """
+        idle = InputState()
+        for i in range(ticks):
+            if self.state != STATE_PLAYING:
+                return i
+            self.step(script(self.ticks) if script else idle, dt)
+        return ticks
+
+    def step(self, controls: InputState, dt: float = TICK_MS) -> list[str]:
+        """Avança um tick e devolve os eventos gerados (sons, level up)."""
+        self.events = []
+        self.impacts = []
+        if self.state != STATE_PLAYING:
+            return self.events
+
+        self.ticks += 1
+        self.time_ms += dt
+
+        if self.player is not None:
+            self.player.controls = controls
+            if controls.shoot:
+                self.fire()
+
+        profiler = self.profiler
+        with profiler.section("spawn"):
+            self.spawner.run(self.spawn)
+
+        with profiler.section("sprites.update"):
+            for entity in self.entities.all():
+                entity.update(dt)
+
+        with profiler.section("horde.update"):
+            flow = None
+            if self.player is not None:
+                self.flow.update(self.player.rect.center)
+                flow = self.flow
+            self.horde.update(dt, flow)
+
+        # ----- Temporizadores (level up, ataques do chefe) -----
+        with profiler.section("timers"):
+            self.timers.advance(dt)
+
+        # ----- Ataque do Boss (movimento já feito no update) -----
+        with profiler.section("boss"):
+            for boss in self.entities.of(BossZombie):
+                if boss.attack_ready:
+                    boss.attack_ready = False
+                    brain = self.brain_pool.acquire(self.entities)
+                    brain.launch(boss.rect.left, boss.rect.centery)
+
+        self.handle_collisions()
+        return self.events
+
+    @property
+    def all_sprites(self) -> list[Entity]:
+        """Todas as entidades vivas, para o desenho (``image``, ``draw_pos``, ``layer``)."""
+        return self.entities.all()
+
+    def boss_due(self) -> bool:
+        """O chefe está na fila (aparece num dos próximos ``step``)?"""
+        return not self.boss_spawned and SpawnScheduler.BOSS in self.spawner
+
+    def state_digest(self) -> str:
+        """Hash do estado da simulação (confere replays bit a bit)."""
+        digest = hashlib.sha1()
+        digest.update(repr((
+            self.ticks,
+            self.time_ms,
+            self.state,
+            self.score.points,
+            self.score.lives,
+            self.score.kills,
+            self.difficulty_level,
+            list(self.spawner.pending),
+        )).encode())
+        for sprite in self.entities.all():
+            digest.update(repr((type(sprite).__name__, sprite.x, sprite.y)).encode())
+        n = self.horde.count
+        for array in (self.horde.x, self.horde.y, self.horde.speed_x):
+            digest.update(array[:n].tobytes())
+        return digest.hexdigest()
+
+    def entity_counts(self) -> dict[str, int]:
+        """
+        Entidades vivas por grupo e pares de colisão do último tick
+        (candidatos testados vs. força bruta), para o profiler.
+        """
+        return {
+            "sprites": len(self.entities),
+            "zombies": self.horde.count,
+            "bullets": self.entities.count(Bullet),
+            "brains": self.entities.count(Brain),
+            "bosses": self.entities.count(BossZombie),
+            "candidate_pairs": self.candidate_pairs,
+            "naive_pairs": self.naive_pairs,
+        }
+
+    def fire(self) -> None:
+        bullet = self.player.shoot(self.bullet_pool, self.time_ms)
+        if bullet is not None:
+            self.entities.add(bullet)
+            self.events.append(EVENT_SHOOT)
+
+    def level_up(self) -> None:
+        self.difficulty_level += 1
+        self.events.append(EVENT_LEVEL_UP)
+        self.profiler.mark(f"level {self.difficulty_level}")
+
+        wave = wave_for(self.difficulty_level)
+
+        # Deixar zumbis mais rápidos (uma operação sobre o array)
+        self.horde.speed_up(wave.get("speed_up", 0.0))  # px/s
+
+        # Mais zumbis e, no BOSS_LEVEL, o chefe: entram na fila de spawns
+        self.spawner.queue_wave(wave)
+
+    def mask_pair(
+        self,
+        pair: str,
+        image: pygame.Surface,
+        other: pygame.Surface,
+    ) -> tuple[pygame.mask.Mask, pygame.mask.Mask] | None:
+        """Máscaras de ``image`` e ``other`` se ``pair`` está em modo máscara."""
+        if self.collision_modes.get(pair) != COLLIDE_MASK:
+            return None
+        return self.masks.get(image), self.masks.get(other)
+
+    def handle_collisions(self) -> None:
+        profiler = self.profiler
+        player = self.player
+        horde = self.horde
+        entities = self.entities
+        bullets = entities.of(Bullet)
+        self.naive_pairs = horde.count * (len(bullets) + 1)
+        self.naive_pairs += entities.count(Brain)
+
+        # ----- Colisão tiro x zumbi -----
+        with profiler.section("collide.bullet_zombie"):
+            horde.prepare_queries()
+            masks = self.mask_pair("bullet_zombie", horde.image, self.bullet_image)
+
+            hit_lists = []
+            for bullet in bullets:
+                hits = horde.overlapping(bullet.rect, masks)
+                if hits.size:
+                    bullet.kill()
+                    hit_lists.append(hits)
+
+            if hit_lists:
+                hits = np.unique(np.concatenate(hit_lists))
+                self.impacts.extend(("zombie", x, y) for x, y in horde.centers(hits))
+                killed = horde.kill(hits)
+                self.score.add_points(self.balance["points_per_zombie"] * killed)
+                self.score.add_kill(killed)
+                self.events.extend([EVENT_HIT] * killed)
+                self.spawner.queue(SpawnScheduler.ZOMBIE, killed)
+
+        # ----- Colisão tiro x Boss -----
+        with profiler.section("collide.bullet_boss"):
+            if self.boss_spawned and not self.boss_dead:
+                self.bullet_grid.rebuild(entities.of(Bullet))
+                for boss in entities.of(BossZombie):
+                    self.naive_pairs += entities.count(Bullet)
+                    hits = self.bullet_grid.query(boss.rect)
+                    masks = self.mask_pair("bullet_boss", boss.base_image, self.bullet_image)
+                    if masks is not None:
+                        hits = [
+                            bullet for bullet in hits
+                            if sprites_overlap(masks[0], boss.rect, masks[1], bullet.rect)
+                        ]
+                    for bullet in hits:
+                        bullet.kill()
+                        self.impacts.append(("boss", *bullet.rect.midright))
+                        died = boss.take_damage(1)
+                        if died:
+                            boss.kill()
+                            self.boss_dead = True
+                            self.state = STATE_GAME_WIN
+            else:
+                self.bullet_grid.clear()
+
+        # ----- Colisão zumbi x player -----
+        with profiler.section("collide.player_zombie"):
+            if player:
+                masks = self.mask_pair("player_zombie", horde.image, player.base_image)
+                collisions = horde.overlapping(player.rect, masks)
+                if collisions.size:
+                    self.score.lose_life(1)
+                    self.impacts.extend(
+                        ("zombie", x, y) for x, y in horde.centers(collisions)
+                    )
+                    killed = horde.kill(collisions)
+                    self.spawner.queue(SpawnScheduler.ZOMBIE, killed)
+
+        # ----- Colisão cérebro x player -----
+        with profiler.section("collide.player_brain"):
+            if player:
+                self.brain_grid.rebuild(entities.of(Brain))
+                brain_hits = self.brain_grid.query(player.rect)
+                masks = self.mask_pair("player_brain", player.base_image, self.brain_image)
+                if masks is not None:
+                    brain_hits = [
+                        brain for brain in brain_hits
+                        if sprites_overlap(masks[0], player.rect, masks[1], brain.rect)
+                    ]
+                if brain_hits:
+                    self.score.lose_life(1)
+                    for brain in brain_hits:
+                        self.impacts.append(("brain", *brain.rect.center))
+                        brain.kill()
+
+        self.candidate_pairs = (
+            horde.candidates
+            + self.bullet_grid.candidates
+            + self.brain_grid.candidates
+        )
+
+        # GAME OVER por vidas
+        if self.score.is_game_over() and self.state != STATE_GAME_WIN:
+            self.state = STATE_GAME_OVER
@@ -3,15 +3,118 @@ Ponto de entrada do jogo.
 
 Para rodar:
     python main.py
+    python main.py --dirty-rects   # telas estáticas sem redesenho contínuo
+    python main.py --profile-out profile.json   # F3 overlay, F4 salva
+    python main.py --record partida.zrr         # grava; --replay reproduz
+    python main.py --pipelined   # simulação em outro processo (multi-core)
+    python main.py --render 480x270 --window-scale 2   # 1/4 do fill, janela 960x540
 """
 
+import argparse
+import multiprocessing
+
+from code.Const import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    RENDER_SIZE,
+    WINDOW_SCALE,
+    UPSCALE_INTEGER,
+    UPSCALE_SCALE2X,
+)
 from code.Game import Game
 
 
+def resolution(text: str) -> tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    try:
+        size = int(width), int(height)
+    except ValueError:
+        size = (0, 0)
+    if min(size) <= 0:
+        raise argparse.ArgumentTypeError(f"resolução inválida: {text} (use LxA, ex.: 480x270)")
+    return size
+
+
 def main() -> None:
-    game = Game()
+    parser = argparse.ArgumentParser(description="Zombie Runner")
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="atualiza só as regiões alteradas da tela",
+    )
+    parser.add_argument(
+        "--no-asset-cache",
+        action="store_true",
+        help="ignora o cache de sprites e decodifica os PNGs",
+    )
+    parser.add_argument(
+        "--no-batch",
+        action="store_true",
+        help="desenha sprite a sprite, sem atlas nem lote",
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help="simula em outro processo, um tick à frente do desenho",
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="ARQUIVO",
+        help="salva o trace do profiler (.csv ou .json) ao sair",
+    )
+    parser.add_argument("--seed", type=int, help="semente fixa das partidas")
+    parser.add_argument(
+        "--record",
+        metavar="ARQUIVO",
+        help="grava a entrada da partida para replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARQUIVO",
+        help="reproduz uma partida gravada com --record",
+    )
+    parser.add_argument(
+        "--render",
+        metavar="LxA",
+        type=resolution,
+        default=RENDER_SIZE,
+        help="resolução interna do desenho (mesma proporção de 960x540)",
+    )
+    parser.add_argument(
+        "--window-scale",
+        type=int,
+        default=WINDOW_SCALE,
+        help="quantas vezes a janela amplia a resolução interna",
+    )
+    parser.add_argument(
+        "--upscale",
+        choices=(UPSCALE_INTEGER, UPSCALE_SCALE2X),
+        default=UPSCALE_INTEGER,
+        help="ampliação: vizinho mais próximo ou scale2x (janela 2x, 4x...)",
+    )
+    args = parser.parse_args()
+    width, height = args.render
+    if width * SCREEN_HEIGHT != height * SCREEN_WIDTH:
+        parser.error(f"--render {width}x{height} fora da proporção {SCREEN_WIDTH}:{SCREEN_HEIGHT}")
+    if args.window_scale < 1:
+        parser.error("--window-scale precisa ser >= 1")
+
+    game = Game(
+        use_asset_cache=not args.no_asset_cache,
+        dirty_rects=args.dirty_rects,
+        batched_draw=not args.no_batch,
+        profile_out=args.profile_out,
+        seed=args.seed,
+        record_path=args.record,
+        replay_path=args.replay,
+        pipelined=args.pipelined,
+        render_size=args.render,
+        window_scale=args.window_scale,
+        upscale=args.upscale,
+    )
     game.run()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # executável do PyInstaller
     main()
@@ -0,0 +1,55 @@
+"""
+Agenda de temporizadores: periódicos sem deriva no passo fixo da simulação.
+"""
+
+from __future__ import annotations
+
+from code.Const import BALANCE, EVENT_LEVEL_UP, TICK_MS
+from code.InputState import InputState
+from code.Scheduler import Scheduler
+from code.World import World
+
+
+def firing_ticks(interval: float, ticks: int) -> list[int]:
+    timers = Scheduler()
+    fired: list[int] = []
+    tick = 0
+
+    def record() -> None:
+        fired.append(tick)
+
+    timers.every(interval, record)
+    for tick in range(1, ticks + 1):
+        timers.advance(TICK_MS)
+    return fired
+
+
+def test_every_fires_on_exact_ticks() -> None:
+    interval = BALANCE["difficulty_interval"]
+    per_interval = round(interval / TICK_MS)  # 1200 a 60 Hz
+    fired = firing_ticks(interval, 20 * per_interval)
+    assert fired == [n * per_interval for n in range(1, 21)]
+
+
+def test_every_catches_up_after_long_step() -> None:
+    timers = Scheduler()
+    fired: list[float] = []
+    timers.every(100, lambda: fired.append(timers.now))
+    timers.advance(350)
+    assert len(fired) == 3
+    timers.advance(50)
+    assert len(fired) == 4
+
+
+def test_world_level_up_ticks() -> None:
+    world = World.headless(seed=1)
+    world.reset(seed=1)
+    world.score.lives = 10**9  # a partida não termina no meio
+    per_interval = round(world.difficulty_interval / TICK_MS)
+    idle = InputState()
+    levels = [
+        tick
+        for tick in range(1, 4 * per_interval + 1)
+        if EVENT_LEVEL_UP in world.step(idle)
+    ]
+    assert levels == [n * per_interval for n in range(1, 5)]